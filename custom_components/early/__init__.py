@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import os
 
 from homeassistant.components import bluetooth as ha_bluetooth
 from homeassistant.components.bluetooth.match import BluetoothCallbackMatcher
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 
 from .bluetooth import EarlyBluetoothDevice
-from .const import BLE_SERVICE_UUID, DEVICE_NAME_PREFIX, DOMAIN
+from .const import (
+    BLE_SERVICE_UUID,
+    CONF_HUB,
+    DATA_DISCOVERY_CACHE,
+    DEVICE_NAME_PREFIX,
+    DOMAIN,
+    JOURNAL_STORAGE_KEY,
+    JOURNAL_STORAGE_VERSION,
+    STATISTICS_STORAGE_KEY,
+    STATISTICS_STORAGE_VERSION,
+    TIME_ENTRIES_DATABASE,
+    TIME_ENTRIES_STORAGE_KEY,
+    TIME_ENTRIES_STORAGE_VERSION,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,6 +60,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     service_info.address,
                     change,
                 )
+                device = (
+                    hass.data[DOMAIN]
+                    .get(entry.entry_id, {})
+                    .get("bluetooth_devices", {})
+                    .get(service_info.address)
+                )
+                if isinstance(device, EarlyBluetoothDevice):
+                    device.async_handle_advertisement(service_info, change)
 
         entry.async_on_unload(
             ha_bluetooth.async_register_callback(
@@ -54,9 +78,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
         )
 
+    if "address" in entry.data or entry.data.get(CONF_HUB):
+        # Connection options only take effect when the tracker is set up again
+        entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     # Disconnect from any bluetooth devices
@@ -70,5 +103,37 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        if not hass.data[DOMAIN] and (
+            cache := hass.data.pop(DATA_DISCOVERY_CACHE, None)
+        ):
+            # Last entry gone; stop following tracker advertisements
+            cache.async_stop()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the storage and database files kept for a removed entry.
+
+    Entries without API credentials never wrote any, which is harmless.
+    Long-term statistics are left in the recorder: they are the account's
+    tracked history, and an entry added again for the account imports over
+    the same `early:activity_<id>` statistics.
+    """
+    for key, version in (
+        (JOURNAL_STORAGE_KEY, JOURNAL_STORAGE_VERSION),
+        (TIME_ENTRIES_STORAGE_KEY, TIME_ENTRIES_STORAGE_VERSION),
+        (STATISTICS_STORAGE_KEY, STATISTICS_STORAGE_VERSION),
+    ):
+        await Store(hass, version, key.format(entry.entry_id)).async_remove()
+
+    await hass.async_add_executor_job(
+        _remove_database, hass.config.path(TIME_ENTRIES_DATABASE.format(entry.entry_id))
+    )
+
+
+def _remove_database(path: str) -> None:
+    """Delete an SQLite database along with its WAL and shared-memory files."""
+    for suffix in ("", "-wal", "-shm"):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(f"{path}{suffix}")
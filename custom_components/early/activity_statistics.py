@@ -0,0 +1,295 @@
+"""Import of EARLY (Timeular) activity time into long-term statistics."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later, async_track_utc_time_change
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+from homeassistant.util.unit_conversion import DurationConverter
+
+from .const import (
+    DOMAIN,
+    STATISTICS_IMPORT_CHUNK_HOURS,
+    STATISTICS_IMPORT_DELAY,
+    STATISTICS_IMPORT_MINUTE,
+    STATISTICS_SAVE_DELAY,
+    STATISTICS_STORAGE_KEY,
+    STATISTICS_STORAGE_VERSION,
+    TIME_ENTRIES_BACKFILL_DAYS,
+)
+
+if TYPE_CHECKING:
+    from .sensor import EarlyAPICoordinator
+    from .time_entries import EarlyTimeEntriesSync, TimeEntriesDelta
+    from .time_entry_database import EarlyTimeEntryDatabase
+
+_LOGGER = logging.getLogger(__name__)
+
+_HOUR = timedelta(hours=1)
+_EPOCH = datetime.fromtimestamp(0, dt_util.UTC)
+
+
+def statistic_id(activity_id: str) -> str:
+    """Return the external statistic ID for an activity."""
+    return f"{DOMAIN}:activity_{slugify(activity_id)}"
+
+
+def _start_of_hour(value: datetime) -> datetime:
+    """Return the start of the UTC hour value falls in."""
+    return value.astimezone(dt_util.UTC).replace(minute=0, second=0, microsecond=0)
+
+
+class EarlyStatisticsImporter:
+    """Publish hourly per-activity time as external statistics.
+
+    Each activity gets an `early:activity_<id>` statistic in hours, with one
+    row per completed UTC hour whose sum is the total tracked so far, so the
+    statistics and energy dashboards chart it without templates. Hours are
+    computed from the local time entry database and sent to the recorder
+    one chunk of STATISTICS_IMPORT_CHUNK_HOURS at a time, one import call
+    per activity; the next chunk waits until the recorder has worked through
+    the last, so a backfill never floods its queue.
+
+    The last imported hour is kept in Home Assistant storage, and imports
+    resume from it. When synced entries change, the hours from the earliest
+    one affected are imported again with corrected sums.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: EarlyAPICoordinator,
+        sync: EarlyTimeEntriesSync,
+        database: EarlyTimeEntryDatabase,
+        entry_id: str,
+    ) -> None:
+        """Initialize the importer for one EARLY account entry."""
+        self.hass = hass
+        self._coordinator = coordinator
+        self._sync = sync
+        self._database = database
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STATISTICS_STORAGE_VERSION,
+            STATISTICS_STORAGE_KEY.format(entry_id),
+        )
+        self._loaded = False
+        # Every hour before this has been imported
+        self._imported_until: datetime | None = None
+        # Earliest hour changed by synced entries since the last import, and
+        # the activities that lost time there
+        self._changed_from: datetime | None = None
+        self._changed_activities: set[str] = set()
+        self._task: asyncio.Task | None = None
+        self._cancel_delay: CALLBACK_TYPE | None = None
+        self._unsubscribers: list[CALLBACK_TYPE] = []
+
+    @property
+    def imported_until(self) -> datetime | None:
+        """Return the end of the last imported hour."""
+        return self._imported_until
+
+    @callback
+    def async_start(self) -> None:
+        """Import now, then hourly and whenever synced entries change."""
+        self._unsubscribers = [
+            self._sync.async_add_listener(self._async_entries_changed),
+            async_track_utc_time_change(
+                self.hass,
+                self._async_hour_passed,
+                minute=STATISTICS_IMPORT_MINUTE,
+                second=0,
+            ),
+        ]
+        self._async_start_import()
+
+    async def async_stop(self) -> None:
+        """Stop importing and persist the last imported hour."""
+        while self._unsubscribers:
+            self._unsubscribers.pop()()
+        if self._cancel_delay is not None:
+            self._cancel_delay()
+            self._cancel_delay = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._loaded:
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _async_entries_changed(self, delta: TimeEntriesDelta) -> None:
+        """Note the hours a sync changed and import them shortly."""
+        changed = [*delta.upserted, *delta.previous]
+        if not changed:
+            return
+        self._async_note_changes(
+            _start_of_hour(min(entry.started_at for entry in changed)),
+            {entry.activity_id for entry in delta.previous},
+        )
+        if self._cancel_delay is None:
+            # Let the database write the changes first
+            self._cancel_delay = async_call_later(
+                self.hass, STATISTICS_IMPORT_DELAY, self._async_delay_passed
+            )
+
+    @callback
+    def _async_note_changes(self, first: datetime, activities: set[str]) -> None:
+        """Widen the changed range to include hours from first onwards."""
+        if self._changed_from is None or first < self._changed_from:
+            self._changed_from = first
+        self._changed_activities.update(activities)
+
+    @callback
+    def _async_delay_passed(self, _now: Any) -> None:
+        """Import the changed hours, or retry once a running import ends."""
+        self._cancel_delay = None
+        if self._task is not None:
+            self._cancel_delay = async_call_later(
+                self.hass, STATISTICS_IMPORT_DELAY, self._async_delay_passed
+            )
+            return
+        self._async_start_import()
+
+    @callback
+    def _async_hour_passed(self, _now: datetime) -> None:
+        """Import the hour that just completed."""
+        self._async_start_import()
+
+    @callback
+    def _async_start_import(self) -> None:
+        """Start an import in the background unless one is running."""
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_import(), "early activity statistics"
+            )
+
+    async def _async_load(self) -> None:
+        """Load the last imported hour from storage once."""
+        if self._loaded:
+            return
+        if (data := await self._store.async_load()) is not None and data.get(
+            "imported_until"
+        ):
+            self._imported_until = dt_util.parse_datetime(data["imported_until"])
+        self._loaded = True
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the import state as stored."""
+        return {
+            "imported_until": (
+                self._imported_until.isoformat() if self._imported_until else None
+            )
+        }
+
+    async def _async_import(self) -> None:
+        """Import every completed hour from the resume point, chunk by chunk.
+
+        The changed range is taken over when the import begins, so changes
+        arriving meanwhile are kept for the next one, and handed back if the
+        import does not complete.
+        """
+        changed_from, changed_activities = self._changed_from, self._changed_activities
+        self._changed_from = None
+        self._changed_activities = set()
+        completed = False
+        try:
+            await self._async_load()
+            await self._database.async_flush()
+            end = _start_of_hour(dt_util.utcnow())
+            start = self._imported_until or _start_of_hour(
+                end - timedelta(days=TIME_ENTRIES_BACKFILL_DAYS)
+            )
+            if changed_from is not None and changed_from < start:
+                start = changed_from
+
+            recorder = get_instance(self.hass)
+            names = self._coordinator.get_all_activities()
+            while start < end:
+                chunk_end = min(
+                    start + timedelta(hours=STATISTICS_IMPORT_CHUNK_HOURS), end
+                )
+                totals = await self._database.async_durations(_EPOCH, start)
+                hourly = await self._database.async_hourly_durations(start, chunk_end)
+                for activity_id in sorted({*totals, *hourly, *changed_activities}):
+                    if statistics := _hourly_statistics(
+                        start,
+                        chunk_end,
+                        totals.get(activity_id, 0.0),
+                        hourly.get(activity_id, {}),
+                        activity_id in changed_activities,
+                    ):
+                        async_add_external_statistics(
+                            self.hass,
+                            _metadata(activity_id, names.get(activity_id)),
+                            statistics,
+                        )
+                self._imported_until = chunk_end
+                self._store.async_delay_save(self._data_to_save, STATISTICS_SAVE_DELAY)
+                start = chunk_end
+                # Let the recorder work through this chunk before queuing more
+                await recorder.async_block_till_done()
+            completed = True
+        except sqlite3.Error as err:
+            _LOGGER.error("Error reading EARLY time entries for statistics: %s", err)
+        except HomeAssistantError as err:
+            _LOGGER.error("Error importing EARLY activity statistics: %s", err)
+        finally:
+            if not completed and changed_from is not None:
+                self._async_note_changes(changed_from, changed_activities)
+            self._task = None
+
+
+def _metadata(activity_id: str, name: str | None) -> StatisticMetaData:
+    """Return the statistic metadata for an activity."""
+    return StatisticMetaData(
+        mean_type=StatisticMeanType.NONE,
+        has_sum=True,
+        name=f"EARLY {name or activity_id}",
+        source=DOMAIN,
+        statistic_id=statistic_id(activity_id),
+        unit_class=DurationConverter.UNIT_CLASS,
+        unit_of_measurement=UnitOfTime.HOURS,
+    )
+
+
+def _hourly_statistics(
+    start: datetime,
+    end: datetime,
+    total: float,
+    hours: dict[float, float],
+    changed: bool,
+) -> list[StatisticData]:
+    """Return an activity's rows for the hours from start to end.
+
+    total is the time tracked before start (in seconds). Hours before the
+    activity's first tracked time are left out, unless it lost time in a
+    change, when rows already imported must be corrected down.
+    """
+    statistics: list[StatisticData] = []
+    hour = start
+    while hour < end:
+        seconds = hours.get(hour.timestamp(), 0.0)
+        total += seconds
+        if total > 0 or changed:
+            statistics.append(
+                StatisticData(start=hour, state=seconds / 3600, sum=total / 3600)
+            )
+        hour += _HOUR
+    return statistics
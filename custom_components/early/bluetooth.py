@@ -2,23 +2,130 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+import time
+from datetime import timedelta
+from enum import StrEnum
 from typing import Any, Callable
 
 from bleak import BleakClient
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.device import BLEDevice
 from bleak.exc import BleakError
+from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 from homeassistant.components import bluetooth
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.components.bluetooth.match import BluetoothCallbackMatcher
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 
+from .capture import EarlyNotificationCapture
 from .const import (
+    BATTERY_POLL_INTERVAL,
+    BLE_BATTERY_LEVEL_CHARACTERISTIC_UUID,
+    BLE_FIRMWARE_REVISION_CHARACTERISTIC_UUID,
     BLE_ORIENTATION_CHARACTERISTIC_UUID,
     BLE_SERVICE_UUID,
+    CONNECT_MAX_ATTEMPTS,
+    CONNECT_TIMEOUT,
+    CONNECTION_MODE_ON_DEMAND,
+    DATA_DISCOVERY_CACHE,
+    DEFAULT_CONNECTION_MODE,
+    DEFAULT_LINGER_TIME,
+    DEFAULT_LIVENESS_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_SETTLE_HYSTERESIS,
+    DEFAULT_SETTLE_TIME,
     DEVICE_NAME_PREFIX,
+    LIVENESS_PROBE_TIMEOUT,
+    ON_DEMAND_ADVERTISEMENT_COOLDOWN,
+    RECONNECT_ADVERTISEMENT_COOLDOWN,
+    RECONNECT_BACKOFF_INITIAL,
+    RECONNECT_BACKOFF_MAX,
+    RSSI_CHANGE_THRESHOLD,
+    RSSI_PUBLISH_INTERVAL,
+    RSSI_SAMPLE_INTERVAL,
+    RSSI_SMOOTHING_FACTOR,
+    SIGNAL_BATTERY_UPDATED,
+    SIGNAL_ORIENTATION_UPDATED,
+    SIGNAL_RSSI_UPDATED,
 )
+from .history import EarlyOrientationHistory
+from .scheduler import EarlyConnectionScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
+# Forms of the service UUID match_device accepts. Home Assistant reports
+# UUIDs in lower case; the upper-case form covers sources that do not.
+_SERVICE_UUID_FORMS = frozenset({BLE_SERVICE_UUID.lower(), BLE_SERVICE_UUID.upper()})
+
+
+class EarlyListenerRegistry:
+    """Listeners for one kind of tracker update.
+
+    Listeners are kept in an insertion-ordered dict, so adding and removing
+    are O(1) and they fire in subscription order. A failing listener is logged
+    without stopping the rest. Each firing is also sent as a dispatcher signal
+    for consumers outside the integration's entities.
+    """
+
+    def __init__(self, hass: HomeAssistant, signal: str) -> None:
+        """Initialize the registry."""
+        self.hass = hass
+        self.signal = signal
+        self._listeners: dict[Callable[[], None], None] = {}
+
+    def __len__(self) -> int:
+        """Return the number of listeners."""
+        return len(self._listeners)
+
+    def __contains__(self, listener: object) -> bool:
+        """Return True if listener is subscribed."""
+        return listener in self._listeners
+
+    @callback
+    def async_add(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Subscribe listener and return a handle that unsubscribes it."""
+        self._listeners[listener] = None
+
+        @callback
+        def _async_remove() -> None:
+            self._listeners.pop(listener, None)
+
+        return _async_remove
+
+    @callback
+    def async_remove(self, listener: Callable[[], None]) -> None:
+        """Unsubscribe listener, if subscribed."""
+        self._listeners.pop(listener, None)
+
+    @callback
+    def async_fire(self) -> None:
+        """Call every listener, then send the dispatcher signal."""
+        # Copy so listeners may unsubscribe while being called
+        for listener in list(self._listeners):
+            try:
+                listener()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error in EARLY tracker listener %s", listener)
+        async_dispatcher_send(self.hass, self.signal)
+
+
+class ConnectionState(StrEnum):
+    """Connection manager states for an EARLY tracker."""
+
+    # Not managed: before async_start() or after disconnect()
+    STOPPED = "stopped"
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    # Managed but not connected; a reconnect attempt is scheduled
+    WAITING = "waiting"
+    # On-demand mode between sessions; the connection slot is released
+    IDLE = "idle"
+
 
 class EarlyBluetoothDevice:
     """Representation of an EARLY Bluetooth tracker device."""
@@ -26,157 +133,1240 @@ class EarlyBluetoothDevice:
     def __init__(
         self,
         hass: HomeAssistant,
-        device: BLEDevice,
-        advertisement_data: bluetooth.BluetoothServiceInfoBleak,
+        device: BLEDevice | None,
+        advertisement_data: bluetooth.BluetoothServiceInfoBleak | None,
+        min_update_interval: float = DEFAULT_MIN_UPDATE_INTERVAL,
+        *,
+        address: str | None = None,
+        name: str | None = None,
+        connection_mode: str = DEFAULT_CONNECTION_MODE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        linger_time: float = DEFAULT_LINGER_TIME,
+        scheduler: EarlyConnectionScheduler | None = None,
+        settle_time: float = DEFAULT_SETTLE_TIME,
+        settle_hysteresis: float = DEFAULT_SETTLE_HYSTERESIS,
+        liveness_interval: float = DEFAULT_LIVENESS_INTERVAL,
+        capture: EarlyNotificationCapture | None = None,
     ) -> None:
-        """Initialize the bluetooth device."""
+        """Initialize the bluetooth device.
+
+        device and advertisement_data may be None when the tracker has not been
+        seen since startup; address (and optionally name) must then be given.
+        scheduler is shared between trackers so they take turns connecting
+        through the same adapter or proxy. capture, if given, records every
+        raw orientation notification.
+        """
         self.hass = hass
         self._device = device
         self._advertisement_data = advertisement_data
+        self._address = address or device.address
+        self._fallback_name = name
         self._client: BleakClient | None = None
         self._orientation: int = 0
-        self._callbacks: list[Callable] = []
+        self._callbacks = EarlyListenerRegistry(
+            hass, SIGNAL_ORIENTATION_UPDATED.format(self._address)
+        )
+        # Settle filter: notifications update the raw face, which is only
+        # committed to orientation once it has stopped changing, so the faces
+        # passed through while the cube is turned are never reported.
+        self._raw_orientation: int = 0
+        self._raw_since = 0.0
+        self._committed_at: float | None = None
+        self._settle_time = settle_time / 1000
+        self._settle_hysteresis = settle_hysteresis / 1000
+        self._cancel_settle: CALLBACK_TYPE | None = None
+        self._history = EarlyOrientationHistory()
+        self._capture = capture
+        # Callback dispatches are coalesced so a burst of notifications
+        # (e.g. rolling the cube past several faces) produces one state
+        # write per entity per interval, always carrying the latest value.
+        self._min_update_interval = min_update_interval
+        self._last_dispatch: float | None = None
+        self._cancel_pending_dispatch: CALLBACK_TYPE | None = None
+        # Connection manager: a single lock serialises connection attempts,
+        # and reconnects back off exponentially unless a fresh advertisement
+        # shows the tracker is back in range.
+        self._connect_lock = asyncio.Lock()
+        self._state = ConnectionState.STOPPED
+        self._failed_attempts = 0
+        self._last_attempt: float | None = None
+        self._cancel_reconnect: CALLBACK_TYPE | None = None
+        self._disconnected_at: float | None = None
+        self._reconnect_count = 0
+        self._last_reconnect_latency: float | None = None
+        self._total_reconnect_latency = 0.0
+        # Connect-to-first-valid-state latency: from the start of an attempt
+        # until the first orientation value arrives over the new connection
+        self._awaiting_first_state = False
+        self._first_state_count = 0
+        self._last_first_state_latency: float | None = None
+        self._total_first_state_latency = 0.0
+        # Notifications received so far; a read overlapped by a notification
+        # is discarded because the notification is at least as new.
+        self._notification_count = 0
+        self._scheduler = scheduler or EarlyConnectionScheduler()
+        # Liveness watchdog: a proxy can keep reporting a link as connected
+        # after it has stopped delivering notifications, so a quiet link is
+        # probed with a read and torn down if the read fails.
+        self._liveness_interval = liveness_interval
+        self._cancel_watchdog: CALLBACK_TYPE | None = None
+        self._liveness_probes = 0
+        self._liveness_failures = 0
+        self._has_connected = False
+        # GATT handles resolved on the first connection, reused on reconnects
+        # through the same adapter or proxy so they skip characteristic lookup.
+        # The handles are keyed on the firmware revision they were resolved
+        # under, which is re-read on each reconnect.
+        self._orientation_char: BleakGATTCharacteristic | None = None
+        self._firmware_char: BleakGATTCharacteristic | None = None
+        self._gatt_cache_source: str | None = None
+        self._firmware_revision: str | None = None
+        # Battery level from the standard Battery Service, only ever read over
+        # a connection made for orientation, so it costs no extra radio time.
+        self._battery_char: BleakGATTCharacteristic | None = None
+        self._battery_level: int | None = None
+        self._battery_read_at: float | None = None
+        self._battery_notifying = False
+        self._battery_callbacks = EarlyListenerRegistry(
+            hass, SIGNAL_BATTERY_UPDATED.format(self._address)
+        )
+        self._cancel_battery_poll: CALLBACK_TYPE | None = None
+        # On-demand mode: short sessions triggered by advertisements or the
+        # poll cadence, each holding the connection slot only while it runs.
+        self._connection_mode = connection_mode
+        self._on_demand = connection_mode == CONNECTION_MODE_ON_DEMAND
+        self._poll_interval = poll_interval
+        self._linger_time = linger_time
+        self._cancel_session: CALLBACK_TYPE | None = None
+        self._session_task: asyncio.Task | None = None
+        self._session_deadline = 0.0
+        # Set when the tracker drops mid-session, ending the linger early
+        self._session_wake = asyncio.Event()
+        self._session_ended: float | None = None
+        self._last_read: float | None = None
+        # Signal strength is smoothed across advertisements and only published
+        # when it moves noticeably, at most once per RSSI_PUBLISH_INTERVAL.
+        # Home Assistant does not call advertisement callbacks when only the
+        # RSSI changed, so while anything listens the latest advertisement is
+        # sampled on a timer; each advertisement is folded in once.
+        self._rssi_callbacks = EarlyListenerRegistry(
+            hass, SIGNAL_RSSI_UPDATED.format(self._address)
+        )
+        self._smoothed_rssi: float | None = None
+        self._rssi: int | None = None
+        self._last_rssi_publish: float | None = None
+        self._rssi_sampled: bluetooth.BluetoothServiceInfoBleak | None = None
+        self._cancel_rssi_sample: CALLBACK_TYPE | None = None
+        if advertisement_data is not None:
+            self._smoothed_rssi = advertisement_data.rssi
+            self._rssi = advertisement_data.rssi
+            self._rssi_sampled = advertisement_data
 
     @property
     def name(self) -> str:
         """Return the name of the device."""
-        return self._device.name or "EARLY Tracker"
+        if self._device is not None and self._device.name:
+            return self._device.name
+        return self._fallback_name or "EARLY Tracker"
 
     @property
     def address(self) -> str:
         """Return the address of the device."""
-        return self._device.address
+        return self._address
 
     @property
-    def rssi(self) -> int:
-        """Return the RSSI of the device."""
-        return self._advertisement_data.rssi
+    def rssi(self) -> int | None:
+        """Return the smoothed RSSI of the device as last published."""
+        return self._rssi
 
     @property
     def is_connected(self) -> bool:
         """Return True if the device is currently connected."""
         return self._client is not None and self._client.is_connected
 
+    @property
+    def available(self) -> bool:
+        """Return True if the orientation can be trusted.
+
+        In on-demand mode the tracker is usually disconnected, so the value is
+        considered current until two poll intervals pass without a read.
+        """
+        if not self._on_demand:
+            return self.is_connected
+        return self._last_read is not None and (
+            time.monotonic() - self._last_read
+            < 2 * self._poll_interval + self._linger_time
+        )
+
     @property
     def orientation(self) -> int:
         """Return the current orientation (0-8)."""
         return self._orientation
 
-    def register_callback(self, callback: callable) -> None:
-        """Register a callback to be called when orientation changes."""
-        self._callbacks.append(callback)
+    @property
+    def raw_orientation(self) -> int:
+        """Return the latest reported orientation, before settling."""
+        return self._raw_orientation
+
+    @property
+    def orientation_history(self) -> EarlyOrientationHistory:
+        """Return the recent settled orientation changes."""
+        return self._history
+
+    @property
+    def capture(self) -> EarlyNotificationCapture | None:
+        """Return the notification capture, if recording."""
+        return self._capture
+
+    @property
+    def battery_level(self) -> int | None:
+        """Return the last battery level read (0-100), if known."""
+        return self._battery_level
+
+    @property
+    def firmware_revision(self) -> str | None:
+        """Return the firmware revision read during GATT resolution."""
+        return self._firmware_revision
+
+    @property
+    def connection_state(self) -> ConnectionState:
+        """Return the connection manager state."""
+        return self._state
 
-    def unregister_callback(self, callback: callable) -> None:
+    @property
+    def connection_stats(self) -> dict[str, Any]:
+        """Return reconnect metrics for diagnostics."""
+        return {
+            "state": self._state.value,
+            "mode": self._connection_mode,
+            "failed_attempts": self._failed_attempts,
+            "reconnect_count": self._reconnect_count,
+            "last_reconnect_latency": self._last_reconnect_latency,
+            "average_reconnect_latency": (
+                self._total_reconnect_latency / self._reconnect_count
+                if self._reconnect_count
+                else None
+            ),
+            "last_first_state_latency": self._last_first_state_latency,
+            "average_first_state_latency": (
+                self._total_first_state_latency / self._first_state_count
+                if self._first_state_count
+                else None
+            ),
+            "seconds_since_last_data": (
+                round(time.monotonic() - self._last_read, 1)
+                if self._last_read is not None
+                else None
+            ),
+            "liveness_probes": self._liveness_probes,
+            "liveness_failures": self._liveness_failures,
+        }
+
+    @property
+    def listener_counts(self) -> dict[str, int]:
+        """Return the number of listeners per update kind for diagnostics."""
+        return {
+            "orientation": len(self._callbacks),
+            "rssi": len(self._rssi_callbacks),
+            "battery": len(self._battery_callbacks),
+        }
+
+    @callback
+    def register_callback(self, callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Register a callback for orientation and availability changes.
+
+        Returns a handle that unregisters the callback.
+        """
+        return self._callbacks.async_add(callback)
+
+    @callback
+    def unregister_callback(self, callback: Callable[[], None]) -> None:
         """Unregister a callback."""
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+        self._callbacks.async_remove(callback)
+
+    @callback
+    def register_rssi_callback(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Register a callback for published RSSI changes.
+
+        Returns a handle that unregisters the callback. The first callback
+        starts sampling the RSSI.
+        """
+        remove = self._rssi_callbacks.async_add(listener)
+        self._async_start_rssi_sample()
+
+        @callback
+        def _async_remove() -> None:
+            remove()
+            if not self._rssi_callbacks:
+                self._async_cancel_rssi_sample()
+
+        return _async_remove
+
+    @callback
+    def unregister_rssi_callback(self, callback: Callable[[], None]) -> None:
+        """Unregister an RSSI callback."""
+        self._rssi_callbacks.async_remove(callback)
+        if not self._rssi_callbacks:
+            self._async_cancel_rssi_sample()
+
+    @callback
+    def _async_start_rssi_sample(self) -> None:
+        """Start sampling the RSSI, unless already sampling."""
+        if self._cancel_rssi_sample is None:
+            self._cancel_rssi_sample = async_track_time_interval(
+                self.hass,
+                self._async_sample_rssi,
+                timedelta(seconds=RSSI_SAMPLE_INTERVAL),
+            )
+
+    @callback
+    def _async_cancel_rssi_sample(self) -> None:
+        """Stop sampling the RSSI, if sampling."""
+        if self._cancel_rssi_sample is not None:
+            self._cancel_rssi_sample()
+            self._cancel_rssi_sample = None
+
+    @callback
+    def register_battery_callback(self, callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Register a callback for battery level changes.
+
+        Returns a handle that unregisters the callback.
+        """
+        return self._battery_callbacks.async_add(callback)
+
+    @callback
+    def unregister_battery_callback(self, callback: Callable[[], None]) -> None:
+        """Unregister a battery callback."""
+        self._battery_callbacks.async_remove(callback)
 
     @callback
     def _fire_callbacks(self) -> None:
         """Fire all registered callbacks."""
-        for callback_func in self._callbacks:
-            callback_func()
+        self._callbacks.async_fire()
+
+    @callback
+    def _async_schedule_callbacks(self) -> None:
+        """Fire callbacks now, or once at the end of the current interval.
+
+        The first change after a quiet period is delivered immediately. Further
+        changes inside the interval collapse into a single trailing dispatch,
+        which reads the device state at that time and so delivers the final value.
+        """
+        if self._cancel_pending_dispatch is not None:
+            return
+
+        now = time.monotonic()
+        if (
+            self._last_dispatch is None
+            or now - self._last_dispatch >= self._min_update_interval
+        ):
+            self._async_dispatch_callbacks()
+            return
+
+        self._cancel_pending_dispatch = async_call_later(
+            self.hass,
+            self._min_update_interval - (now - self._last_dispatch),
+            self._async_dispatch_pending,
+        )
+
+    @callback
+    def _async_dispatch_pending(self, _now: Any) -> None:
+        """Deliver the trailing dispatch scheduled by _async_schedule_callbacks."""
+        self._cancel_pending_dispatch = None
+        self._async_dispatch_callbacks()
+
+    @callback
+    def _async_dispatch_callbacks(self) -> None:
+        """Record the dispatch time and fire all registered callbacks."""
+        self._last_dispatch = time.monotonic()
+        self._fire_callbacks()
+
+    @callback
+    def _async_cancel_pending_dispatch(self) -> None:
+        """Cancel a scheduled trailing dispatch, if any."""
+        if self._cancel_pending_dispatch is not None:
+            self._cancel_pending_dispatch()
+            self._cancel_pending_dispatch = None
 
     async def connect(self) -> bool:
         """Connect to the device."""
-        if self._client and self._client.is_connected:
-            return True
+        async with self._connect_lock:
+            if self._client and self._client.is_connected:
+                return True
+            return await self._async_connect_locked()
+
+    async def _async_connect_locked(self) -> bool:
+        """Establish the connection; the caller must hold the connect lock."""
+        if self._state is not ConnectionState.STOPPED:
+            self._state = ConnectionState.CONNECTING
+        self._last_attempt = time.monotonic()
+        self._awaiting_first_state = True
 
         try:
             _LOGGER.debug("Connecting to EARLY tracker at %s", self.address)
-            self._client = BleakClient(
-                self._device, disconnected_callback=self._on_disconnect
+            # Always go through the adapter or proxy Home Assistant currently
+            # considers best for this address; the device captured at setup
+            # may be stale or reachable only through a weaker path.
+            if (ble_device := self._async_best_ble_device()) is None:
+                raise BleakError(f"EARLY tracker {self.address} has not been seen")
+            self._device = ble_device
+            # Queue time does not count against the connect timeout
+            async with self._scheduler.async_slot(
+                self._device_source(), never_connected=not self._has_connected
+            ):
+                self._client = await self._async_establish()
+                await self._async_setup_gatt()
+
+        except (BleakError, TimeoutError) as err:
+            _LOGGER.error("Error connecting to EARLY tracker: %s", err)
+            self._failed_attempts += 1
+            self._awaiting_first_state = False
+            if self._state is ConnectionState.CONNECTING:
+                self._state = ConnectionState.WAITING
+            await self._async_drop_client()
+            return False
+
+        _LOGGER.info("Connected to EARLY tracker at %s", self.address)
+        self._failed_attempts = 0
+        self._has_connected = True
+        if self._state is ConnectionState.CONNECTING:
+            self._state = ConnectionState.CONNECTED
+        if self._disconnected_at is not None:
+            latency = time.monotonic() - self._disconnected_at
+            self._disconnected_at = None
+            self._reconnect_count += 1
+            self._last_reconnect_latency = latency
+            self._total_reconnect_latency += latency
+            _LOGGER.debug(
+                "Reconnected to EARLY tracker at %s after %.1fs",
+                self.address,
+                latency,
             )
-            await self._client.connect()
+        if self._state is ConnectionState.CONNECTED:
+            self._async_schedule_watchdog(self._liveness_interval)
+        self._fire_callbacks()
+        return True
 
-            # Read initial orientation
-            await self._read_orientation()
+    async def _async_establish(self) -> BleakClient:
+        """Open a connection through the best path within the connect timeout."""
+        async with asyncio.timeout(CONNECT_TIMEOUT):
+            return await establish_connection(
+                BleakClientWithServiceCache,
+                self._device,
+                self.name,
+                disconnected_callback=self._on_disconnect,
+                max_attempts=CONNECT_MAX_ATTEMPTS,
+                ble_device_callback=self._async_best_ble_device,
+            )
 
-            # Subscribe to orientation changes
-            await self._client.start_notify(
-                BLE_ORIENTATION_CHARACTERISTIC_UUID,
-                self._on_orientation_changed,
+    @callback
+    def _async_best_ble_device(self) -> BLEDevice | None:
+        """Return the BLEDevice for the best connectable path to the tracker."""
+        return (
+            bluetooth.async_ble_device_from_address(
+                self.hass, self.address, connectable=True
             )
+            or self._device
+        )
 
-            _LOGGER.info("Connected to EARLY tracker at %s", self.address)
-            return True
+    async def _async_setup_gatt(self) -> None:
+        """Subscribe to and read orientation, reusing cached GATT handles.
+
+        The subscription is made before the initial read, so a flip during the
+        handshake is caught by one or the other. The initial orientation and
+        battery reads, and the firmware revision check for cached handles, are
+        then issued together; backends that queue GATT requests (BlueZ,
+        ESPHome proxies) overlap their round trips.
+
+        Cached handles that fail are stale, which means the client's services
+        are stale too, so the service cache is cleared and the tracker
+        reconnected to rediscover them. A changed firmware revision clears the
+        cache the same way, but for the next connection: the subscription on
+        this one has already succeeded.
+        """
+        if self._gatt_cache_source != self._device_source():
+            self._orientation_char = None
+
+        cached = self._orientation_char is not None
+        if cached:
+            try:
+                await self._async_start_orientation()
+            except BleakError as err:
+                _LOGGER.debug(
+                    "Cached GATT handles for %s are stale (%s), rediscovering",
+                    self.address,
+                    err,
+                )
+                await self._async_invalidate_gatt_cache()
+                await self._async_drop_client()
+                self._client = await self._async_establish()
+                cached = False
+
+        if self._orientation_char is None:
+            await self._async_resolve_gatt()
+            await self._async_start_orientation()
+
+        reads = [self._async_start_battery()]
+        if cached:
+            reads.append(self._async_check_firmware_revision())
+        if not (self._on_demand and self._linger_time <= 0):
+            reads.append(self._read_orientation())
+        await asyncio.gather(*reads)
+
+    async def _async_start_orientation(self) -> None:
+        """Subscribe to orientation changes, or read it in a read-only session."""
+        if self._on_demand and self._linger_time <= 0:
+            # Read-only session: no subscription, errors surface to the caller
+            self._handle_orientation_value(
+                await self._client.read_gatt_char(
+                    self._orientation_char or BLE_ORIENTATION_CHARACTERISTIC_UUID
+                )
+            )
+            return
+
+        await self._client.start_notify(
+            self._orientation_char or BLE_ORIENTATION_CHARACTERISTIC_UUID,
+            self._on_orientation_changed,
+        )
+
+    async def _async_start_battery(self) -> None:
+        """Read the battery level if due, then subscribe or poll it.
+
+        Battery errors never fail the connection; the level is informational.
+        """
+        self._battery_notifying = False
+        if self._battery_char is None:
+            return
+
+        if (
+            self._battery_read_at is None
+            or time.monotonic() - self._battery_read_at >= BATTERY_POLL_INTERVAL
+        ):
+            await self._async_read_battery()
+
+        if self._on_demand:
+            # Sessions are short; each one re-reads the level once it is due
+            return
+
+        if "notify" in self._battery_char.properties:
+            try:
+                await self._client.start_notify(
+                    self._battery_char, self._on_battery_changed
+                )
+                self._battery_notifying = True
+                return
+            except BleakError as err:
+                _LOGGER.debug("Error subscribing to battery level: %s", err)
 
+        # A held connection is re-read periodically instead
+        if self._cancel_battery_poll is None:
+            self._async_schedule_battery_poll()
+
+    async def _async_read_battery(self) -> None:
+        """Read the battery level over the current connection."""
+        if self._battery_char is None or not self.is_connected:
+            return
+        try:
+            value = await self._client.read_gatt_char(self._battery_char)
         except BleakError as err:
-            _LOGGER.error("Error connecting to EARLY tracker: %s", err)
-            return False
+            _LOGGER.debug("Error reading battery level: %s", err)
+            return
+        self._handle_battery_value(value)
 
-    async def disconnect(self) -> None:
-        """Disconnect from the device."""
-        if self._client and self._client.is_connected:
+    def _on_battery_changed(self, sender: int, data: bytearray) -> None:
+        """Handle battery level notification."""
+        self._handle_battery_value(data)
+
+    def _handle_battery_value(self, value: bytes | bytearray) -> None:
+        """Store a battery level and notify listeners if it changed."""
+        if not value:
+            return
+        self._battery_read_at = time.monotonic()
+        level = min(int(value[0]), 100)
+        if level == self._battery_level:
+            return
+        _LOGGER.debug("Battery level of %s: %d%%", self.address, level)
+        self._battery_level = level
+        self._battery_callbacks.async_fire()
+
+    @callback
+    def _async_schedule_battery_poll(self) -> None:
+        """Schedule the next periodic battery read."""
+        self._cancel_battery_poll = async_call_later(
+            self.hass, BATTERY_POLL_INTERVAL, self._async_battery_poll_timer
+        )
+
+    @callback
+    def _async_battery_poll_timer(self, _now: Any) -> None:
+        """Re-read the battery level while connected and not notifying."""
+        self._async_schedule_battery_poll()
+        if not self._battery_notifying and self.is_connected:
+            self.hass.async_create_background_task(
+                self._async_read_battery(), f"early battery {self.address}"
+            )
+
+    @callback
+    def _async_cancel_battery_poll(self) -> None:
+        """Cancel the periodic battery read, if scheduled."""
+        if self._cancel_battery_poll is not None:
+            self._cancel_battery_poll()
+            self._cancel_battery_poll = None
+
+    async def _async_resolve_gatt(self) -> None:
+        """Resolve and cache GATT handles from the client's discovered services."""
+        services = self._client.services
+        orientation_char = services.get_characteristic(
+            BLE_ORIENTATION_CHARACTERISTIC_UUID
+        )
+        if orientation_char is None:
+            raise BleakError(f"Orientation characteristic not found on {self.address}")
+
+        self._firmware_char = services.get_characteristic(
+            BLE_FIRMWARE_REVISION_CHARACTERISTIC_UUID
+        )
+        self._firmware_revision = None
+        if self._firmware_char is not None:
             try:
-                await self._client.disconnect()
-                _LOGGER.debug("Disconnected from EARLY tracker at %s", self.address)
+                self._firmware_revision = await self._async_read_firmware_revision()
             except BleakError as err:
-                _LOGGER.error("Error disconnecting from EARLY tracker: %s", err)
+                _LOGGER.debug("Error reading firmware revision: %s", err)
+
+        self._orientation_char = orientation_char
+        self._battery_char = services.get_characteristic(
+            BLE_BATTERY_LEVEL_CHARACTERISTIC_UUID
+        )
+        self._gatt_cache_source = self._device_source()
+        _LOGGER.debug(
+            "Cached GATT handles for %s (firmware %s)",
+            self.address,
+            self._firmware_revision,
+        )
+
+    async def _async_check_firmware_revision(self) -> None:
+        """Clear the service cache if the firmware changed since handles were cached.
+
+        Handles in use on this connection are left alone; the next connection
+        rediscovers them.
+        """
+        if self._firmware_char is None:
+            return
+        try:
+            revision = await self._async_read_firmware_revision()
+        except BleakError as err:
+            _LOGGER.debug("Error reading firmware revision: %s", err)
+            return
+        if revision == self._firmware_revision:
+            return
+        _LOGGER.debug(
+            "Firmware of %s changed from %s to %s, rediscovering on next connect",
+            self.address,
+            self._firmware_revision,
+            revision,
+        )
+        self._firmware_revision = revision
+        self._gatt_cache_source = None
+        try:
+            await self._client.clear_cache()
+        except BleakError as err:
+            _LOGGER.debug("Error clearing service cache: %s", err)
+
+    async def _async_read_firmware_revision(self) -> str | None:
+        """Read the firmware revision string over the current connection."""
+        value = await self._client.read_gatt_char(self._firmware_char)
+        return bytes(value).decode("utf-8", "ignore").strip("\x00 ") or None
+
+    async def _async_invalidate_gatt_cache(self) -> None:
+        """Drop cached handles and the client's service cache."""
+        self._orientation_char = None
+        self._battery_char = None
+        self._firmware_char = None
+        self._gatt_cache_source = None
+        if self._client is not None:
+            await self._client.clear_cache()
+
+    def _device_source(self) -> str | None:
+        """Return the adapter or proxy the current BLEDevice was seen through."""
+        if self._device is None:
+            return None
+        details = self._device.details
+        if isinstance(details, dict):
+            return details.get("source")
+        return None
+
+    async def _async_drop_client(self) -> None:
+        """Release a half-open client after a failed connection attempt."""
+        client, self._client = self._client, None
+        if client is None or not client.is_connected:
+            return
+        try:
+            await client.disconnect()
+        except BleakError as err:
+            _LOGGER.debug("Error releasing EARLY tracker connection: %s", err)
+
+    @callback
+    def async_start(self) -> None:
+        """Start managing the connection, reconnecting whenever it drops."""
+        if self._state is not ConnectionState.STOPPED:
+            return
+        if self._rssi_callbacks:
+            self._async_start_rssi_sample()
+        if self._on_demand:
+            self._state = ConnectionState.IDLE
+            self._async_schedule_session(0)
+            return
+        if self.is_connected:
+            self._state = ConnectionState.CONNECTED
+            self._async_schedule_watchdog(self._liveness_interval)
+            return
+        self._state = ConnectionState.WAITING
+        self._async_schedule_reconnect(0)
+
+    @callback
+    def async_handle_advertisement(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Handle a fresh advertisement from the tracker.
+
+        An advertisement proves the tracker is in range, so a pending backoff
+        is cut short and the reconnect is attempted right away.
+        """
+        self._advertisement_data = service_info
+        self._device = service_info.device
+        self._rssi_sampled = service_info
+        self._async_update_rssi(service_info.rssi)
+
+        if self._on_demand:
+            self._async_session_advertisement()
+            return
+        if self._state is not ConnectionState.WAITING:
+            return
+        if (
+            self._last_attempt is not None
+            and time.monotonic() - self._last_attempt < RECONNECT_ADVERTISEMENT_COOLDOWN
+        ):
+            return
+
+        _LOGGER.debug(
+            "Advertisement from %s while disconnected, reconnecting now",
+            self.address,
+        )
+        self._async_schedule_reconnect(0)
+
+    @callback
+    def _async_sample_rssi(self, _now: Any) -> None:
+        """Fold in the latest advertisement Bluetooth has seen, once."""
+        service_info = bluetooth.async_last_service_info(
+            self.hass, self.address, connectable=False
+        )
+        if service_info is None or service_info is self._rssi_sampled:
+            return
+        self._rssi_sampled = service_info
+        self._async_update_rssi(service_info.rssi)
+
+    @callback
+    def _async_update_rssi(self, rssi: int | None) -> None:
+        """Fold an advertisement RSSI into the average and publish if due."""
+        if rssi is None:
+            return
+        if self._smoothed_rssi is None:
+            self._smoothed_rssi = rssi
+        else:
+            self._smoothed_rssi += RSSI_SMOOTHING_FACTOR * (rssi - self._smoothed_rssi)
+
+        value = round(self._smoothed_rssi)
+        now = time.monotonic()
+        if self._rssi is not None and (
+            abs(value - self._rssi) < RSSI_CHANGE_THRESHOLD
+            or (
+                self._last_rssi_publish is not None
+                and now - self._last_rssi_publish < RSSI_PUBLISH_INTERVAL
+            )
+        ):
+            return
+
+        self._rssi = value
+        self._last_rssi_publish = now
+        self._rssi_callbacks.async_fire()
+
+    @callback
+    def _async_schedule_reconnect(self, delay: float) -> None:
+        """Schedule the next reconnect attempt after delay seconds."""
+        self._async_cancel_reconnect()
+        self._cancel_reconnect = async_call_later(
+            self.hass, delay, self._async_reconnect_timer
+        )
+
+    @callback
+    def _async_cancel_reconnect(self) -> None:
+        """Cancel a scheduled reconnect attempt, if any."""
+        if self._cancel_reconnect is not None:
+            self._cancel_reconnect()
+            self._cancel_reconnect = None
+
+    @callback
+    def _async_reconnect_timer(self, _now: Any) -> None:
+        """Start a reconnect attempt in the background."""
+        self._cancel_reconnect = None
+        self.hass.async_create_background_task(
+            self._async_reconnect(), f"{self.address} reconnect"
+        )
+
+    async def _async_reconnect(self) -> None:
+        """Attempt a reconnect and back off exponentially on failure."""
+        if self._state is not ConnectionState.WAITING:
+            return
+        if await self.connect():
+            return
+        if self._state is not ConnectionState.WAITING:
+            return
+
+        delay = min(
+            RECONNECT_BACKOFF_MAX,
+            RECONNECT_BACKOFF_INITIAL * 2 ** (self._failed_attempts - 1),
+        )
+        # Jitter keeps several trackers from retrying in lockstep
+        delay += random.uniform(0, delay * 0.1)
+        _LOGGER.debug(
+            "Reconnect to %s failed (%d attempts), retrying in %.1fs",
+            self.address,
+            self._failed_attempts,
+            delay,
+        )
+        self._async_schedule_reconnect(delay)
+
+    @callback
+    def _async_session_advertisement(self) -> None:
+        """Start an on-demand session for an advertisement, unless too soon."""
+        if self._state is not ConnectionState.IDLE:
+            return
+        if (
+            self._session_ended is not None
+            and time.monotonic() - self._session_ended
+            < ON_DEMAND_ADVERTISEMENT_COOLDOWN
+        ):
+            return
+        _LOGGER.debug("Advertisement from %s, starting session", self.address)
+        self._async_schedule_session(0)
+
+    @callback
+    def _async_schedule_session(self, delay: float) -> None:
+        """Schedule the next on-demand session after delay seconds."""
+        self._async_cancel_session()
+        self._cancel_session = async_call_later(
+            self.hass, delay, self._async_session_timer
+        )
+
+    @callback
+    def _async_cancel_session(self) -> None:
+        """Cancel a scheduled on-demand session, if any."""
+        if self._cancel_session is not None:
+            self._cancel_session()
+            self._cancel_session = None
+
+    @callback
+    def _async_session_timer(self, _now: Any) -> None:
+        """Start an on-demand session in the background."""
+        self._cancel_session = None
+        if self._state is not ConnectionState.IDLE:
+            return
+        self._session_task = self.hass.async_create_background_task(
+            self._async_run_session(), f"{self.address} session"
+        )
+
+    async def _async_run_session(self) -> None:
+        """Connect, read, optionally linger subscribed, then release the slot."""
+        # Claim the session so advertisements do not start another one
+        self._state = ConnectionState.CONNECTING
+        try:
+            if await self.connect() and self._linger_time > 0:
+                self._session_deadline = time.monotonic() + self._linger_time
+                self._session_wake.clear()
+                # Flips push the deadline back, so it is re-checked on waking
+                while (
+                    self.is_connected
+                    and (remaining := self._session_deadline - time.monotonic()) > 0
+                ):
+                    try:
+                        async with asyncio.timeout(remaining):
+                            await self._session_wake.wait()
+                    except TimeoutError:
+                        pass
+        finally:
+            if self._state is not ConnectionState.STOPPED:
+                self._state = ConnectionState.IDLE
+                self._session_ended = time.monotonic()
+                self._session_task = None
+                await self._async_release_connection()
+                self._fire_callbacks()
+                self._async_schedule_session(self._poll_interval)
+
+    async def _async_release_connection(self) -> None:
+        """Disconnect at the end of an on-demand session."""
+        async with self._connect_lock:
+            if self._client and self._client.is_connected:
+                try:
+                    await self._client.disconnect()
+                except BleakError as err:
+                    _LOGGER.debug("Error ending session with %s: %s", self.address, err)
+
+    async def disconnect(self) -> None:
+        """Disconnect from the device and stop reconnecting."""
+        self._state = ConnectionState.STOPPED
+        self._async_cancel_reconnect()
+        self._async_cancel_session()
+        if self._session_task is not None:
+            self._session_task.cancel()
+            self._session_task = None
+        self._async_cancel_pending_dispatch()
+        self._async_cancel_settle()
+        self._async_cancel_battery_poll()
+        self._async_cancel_watchdog()
+        self._async_cancel_rssi_sample()
+        # Wait for an in-flight attempt so it cannot leave a connection behind
+        async with self._connect_lock:
+            if self._client and self._client.is_connected:
+                try:
+                    await self._client.disconnect()
+                    _LOGGER.debug("Disconnected from EARLY tracker at %s", self.address)
+                except BleakError as err:
+                    _LOGGER.error("Error disconnecting from EARLY tracker: %s", err)
 
     async def _read_orientation(self) -> None:
         """Read the current orientation from the device."""
         if not self._client or not self._client.is_connected:
             return
 
+        notifications = self._notification_count
         try:
             value = await self._client.read_gatt_char(
-                BLE_ORIENTATION_CHARACTERISTIC_UUID
+                self._orientation_char or BLE_ORIENTATION_CHARACTERISTIC_UUID
             )
-            if value:
-                # The orientation is the first byte of the characteristic
-                self._orientation = int(value[0])
-                _LOGGER.debug("Read orientation: %d", self._orientation)
         except BleakError as err:
             _LOGGER.error("Error reading orientation: %s", err)
+            return
+
+        if self._notification_count != notifications:
+            # A notification arrived while the read was in flight and already
+            # went through the settle filter; the read may predate it
+            _LOGGER.debug("Discarding orientation read overlapped by a notification")
+            return
+        self._handle_orientation_value(value)
+
+    def _handle_orientation_value(self, value: bytes | bytearray) -> None:
+        """Store an orientation value read from the characteristic."""
+        if value:
+            # The orientation is the first byte of the characteristic. A read
+            # reports a face at rest, so it is committed without settling.
+            self._async_cancel_settle()
+            self._orientation = self._raw_orientation = int(value[0])
+            self._last_read = self._raw_since = self._committed_at = time.monotonic()
+            self._async_record_first_state(self._last_read)
+            self._async_record_history(self._last_read)
+            _LOGGER.debug("Read orientation: %d", self._orientation)
 
     def _on_orientation_changed(self, sender: int, data: bytearray) -> None:
         """Handle orientation change notification."""
+        now = time.monotonic()
+        if self._capture is not None:
+            self._capture.record(now, data)
         if data:
+            self._last_read = now
+            self._notification_count += 1
+            self._async_record_first_state(now)
+            if self._on_demand:
+                # Activity keeps an on-demand session open a little longer
+                self._session_deadline = now + self._linger_time
             new_orientation = int(data[0])
-            if new_orientation != self._orientation:
+            if new_orientation != self._raw_orientation:
                 _LOGGER.debug(
-                    "Orientation changed from %d to %d",
-                    self._orientation,
+                    "Raw orientation changed from %d to %d",
+                    self._raw_orientation,
                     new_orientation,
                 )
-                self._orientation = new_orientation
-                self._fire_callbacks()
+                self._raw_orientation = new_orientation
+                self._raw_since = now
+                self._async_settle_orientation(now)
+
+    @callback
+    def _async_record_first_state(self, now: float) -> None:
+        """Record the connect-to-first-valid-state latency of this connection."""
+        if not self._awaiting_first_state or self._last_attempt is None:
+            return
+        self._awaiting_first_state = False
+        latency = now - self._last_attempt
+        self._first_state_count += 1
+        self._last_first_state_latency = latency
+        self._total_first_state_latency += latency
+        _LOGGER.debug(
+            "First orientation from %s %.2fs after connecting", self.address, latency
+        )
+
+    @callback
+    def _async_settle_orientation(self, now: float) -> None:
+        """Commit the raw face now, or once it has settled."""
+        self._async_cancel_settle()
+        if self._raw_orientation == self._orientation:
+            # The cube came back before the transient face settled
+            return
+
+        delay = self._raw_since + self._settle_time - now
+        if self._committed_at is not None:
+            delay = max(delay, self._committed_at + self._settle_hysteresis - now)
+        if delay <= 0:
+            self._async_commit_orientation()
+            return
+
+        self._cancel_settle = async_call_later(
+            self.hass, delay, self._async_settle_timer
+        )
+
+    @callback
+    def _async_settle_timer(self, _now: Any) -> None:
+        """Commit the raw face once the settle window has passed."""
+        self._cancel_settle = None
+        self._async_commit_orientation()
+
+    @callback
+    def _async_commit_orientation(self) -> None:
+        """Make the raw face the reported orientation and notify listeners."""
+        _LOGGER.debug(
+            "Orientation changed from %d to %d",
+            self._orientation,
+            self._raw_orientation,
+        )
+        self._orientation = self._raw_orientation
+        self._committed_at = time.monotonic()
+        self._async_record_history(self._committed_at)
+        self._async_schedule_callbacks()
+
+    @callback
+    def _async_record_history(self, now: float) -> None:
+        """Append the orientation to the history if it is a new face."""
+        latest = self._history.latest()
+        if latest is None or latest[1] != self._orientation:
+            self._history.append(now, self._orientation)
+
+    @callback
+    def _async_cancel_settle(self) -> None:
+        """Cancel a pending settle commit, if any."""
+        if self._cancel_settle is not None:
+            self._cancel_settle()
+            self._cancel_settle = None
 
     def _on_disconnect(self, client: BleakClient) -> None:
         """Handle disconnection."""
-        _LOGGER.warning("EARLY tracker at %s disconnected", self.address)
+        if client is not self._client:
+            # Late callback from a client that has already been replaced
+            return
         self._client = None
+        self._async_cancel_watchdog()
+
+        if self._state is ConnectionState.STOPPED or self._on_demand:
+            # On-demand sessions release the link deliberately; a drop during
+            # a session simply ends it early.
+            _LOGGER.debug("EARLY tracker at %s disconnected", self.address)
+            self._session_wake.set()
+            return
+
+        _LOGGER.warning("EARLY tracker at %s disconnected, reconnecting", self.address)
+        self._disconnected_at = time.monotonic()
+        self._state = ConnectionState.WAITING
+        self._fire_callbacks()
+        self._async_schedule_reconnect(0)
+
+    @callback
+    def _async_schedule_watchdog(self, delay: float) -> None:
+        """Check the link for liveness after delay seconds."""
+        self._async_cancel_watchdog()
+        if self._liveness_interval <= 0:
+            return
+        self._cancel_watchdog = async_call_later(
+            self.hass, delay, self._async_watchdog_timer
+        )
+
+    @callback
+    def _async_cancel_watchdog(self) -> None:
+        """Cancel the liveness check, if scheduled."""
+        if self._cancel_watchdog is not None:
+            self._cancel_watchdog()
+            self._cancel_watchdog = None
+
+    @callback
+    def _async_watchdog_timer(self, _now: Any) -> None:
+        """Probe the link if it has been quiet for a full interval."""
+        self._cancel_watchdog = None
+        if self._state is not ConnectionState.CONNECTED or not self.is_connected:
+            return
+
+        quiet = (
+            time.monotonic() - self._last_read
+            if self._last_read is not None
+            else self._liveness_interval
+        )
+        if quiet < self._liveness_interval:
+            # Data arrived recently; check again once it could have gone quiet
+            self._async_schedule_watchdog(self._liveness_interval - quiet)
+            return
+
+        self.hass.async_create_background_task(
+            self._async_probe_liveness(), f"early liveness probe {self.address}"
+        )
+
+    async def _async_probe_liveness(self) -> None:
+        """Read the orientation to prove the link works, or force a reconnect."""
+        client = self._client
+        if client is None:
+            return
+        self._liveness_probes += 1
+        notifications = self._notification_count
+        try:
+            async with asyncio.timeout(LIVENESS_PROBE_TIMEOUT):
+                value = await client.read_gatt_char(
+                    self._orientation_char or BLE_ORIENTATION_CHARACTERISTIC_UUID
+                )
+        except (BleakError, TimeoutError) as err:
+            self._liveness_failures += 1
+            _LOGGER.warning(
+                "EARLY tracker at %s stopped responding (%s), reconnecting",
+                self.address,
+                err,
+            )
+            await self._async_force_reconnect(client)
+            return
+
+        # The probe doubles as a missed-notification check. It is a read, not
+        # a notification: it is not captured, counted or allowed to extend a
+        # session, and a notification that overlapped it is newer.
+        if self._notification_count == notifications:
+            orientation = self._orientation
+            self._handle_orientation_value(value)
+            if self._orientation != orientation:
+                self._async_schedule_callbacks()
+        if client is self._client:
+            self._async_schedule_watchdog(self._liveness_interval)
+
+    async def _async_force_reconnect(self, client: BleakClient) -> None:
+        """Tear down a dead link and hand over to the reconnect manager."""
+        try:
+            async with asyncio.timeout(LIVENESS_PROBE_TIMEOUT):
+                await client.disconnect()
+        except (BleakError, TimeoutError) as err:
+            _LOGGER.debug("Error disconnecting dead EARLY link: %s", err)
+        # A dead link may never report the disconnect itself
+        self._on_disconnect(client)
 
     @staticmethod
     def match_device(
         service_info: bluetooth.BluetoothServiceInfoBleak,
     ) -> bool:
-        """Check if the device matches EARLY tracker criteria."""
+        """Check if the device matches EARLY tracker criteria.
+
+        Runs for every advertisement seen, so it allocates nothing.
+        """
         # Check if the device name starts with "Timeular ZEI"
-        if service_info.name and service_info.name.startswith(DEVICE_NAME_PREFIX):
+        name = service_info.name
+        if name and name.startswith(DEVICE_NAME_PREFIX):
             return True
 
         # Check if the device advertises the EARLY service UUID
-        if BLE_SERVICE_UUID.lower() in [
-            str(uuid).lower() for uuid in service_info.service_uuids
-        ]:
-            return True
+        return not _SERVICE_UUID_FORMS.isdisjoint(service_info.service_uuids)
+
+
+class EarlyDiscoveryCache:
+    """EARLY trackers currently visible, kept up to date incrementally.
+
+    The cache is seeded once from every device Bluetooth has discovered.
+    After that it is fed only by callbacks, which Home Assistant's matcher
+    index calls just for tracker advertisements. Trackers are dropped when
+    they become unavailable, so a query costs O(matches), not O(all devices).
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty cache."""
+        self.hass = hass
+        self._service_infos: dict[str, bluetooth.BluetoothServiceInfoBleak] = {}
+        self._cancel_unavailable: dict[str, CALLBACK_TYPE] = {}
+        self._unsubscribers: list[CALLBACK_TYPE] = []
+
+    @property
+    def service_infos(self) -> list[bluetooth.BluetoothServiceInfoBleak]:
+        """Return the latest advertisement of each visible tracker."""
+        return list(self._service_infos.values())
+
+    @callback
+    def async_start(self) -> None:
+        """Seed the cache, then follow tracker advertisements."""
+        for service_info in bluetooth.async_discovered_service_info(self.hass):
+            if EarlyBluetoothDevice.match_device(service_info):
+                self._async_update(service_info)
+
+        for matcher in (
+            BluetoothCallbackMatcher(local_name=f"{DEVICE_NAME_PREFIX}*"),
+            BluetoothCallbackMatcher(service_uuid=BLE_SERVICE_UUID),
+        ):
+            self._unsubscribers.append(
+                bluetooth.async_register_callback(
+                    self.hass,
+                    self._async_handle_bluetooth_event,
+                    matcher,
+                    bluetooth.BluetoothScanningMode.ACTIVE,
+                )
+            )
 
-        return False
+    @callback
+    def async_stop(self) -> None:
+        """Stop following advertisements."""
+        while self._unsubscribers:
+            self._unsubscribers.pop()()
+        for cancel in self._cancel_unavailable.values():
+            cancel()
+        self._cancel_unavailable.clear()
+        self._service_infos.clear()
+
+    @callback
+    def _async_handle_bluetooth_event(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Record a tracker advertisement."""
+        self._async_update(service_info)
+
+    @callback
+    def _async_update(self, service_info: bluetooth.BluetoothServiceInfoBleak) -> None:
+        """Store the latest advertisement, watching new trackers for loss."""
+        address = service_info.address
+        self._service_infos[address] = service_info
+        if address not in self._cancel_unavailable:
+            self._cancel_unavailable[address] = bluetooth.async_track_unavailable(
+                self.hass, self._async_unavailable, address, connectable=False
+            )
+
+    @callback
+    def _async_unavailable(
+        self, service_info: bluetooth.BluetoothServiceInfoBleak
+    ) -> None:
+        """Forget a tracker that is no longer seen."""
+        self._service_infos.pop(service_info.address, None)
+        if (
+            cancel := self._cancel_unavailable.pop(service_info.address, None)
+        ) is not None:
+            cancel()
+
+
+@callback
+def async_get_discovery_cache(hass: HomeAssistant) -> EarlyDiscoveryCache:
+    """Return the discovery cache, starting it on first use."""
+    if (cache := hass.data.get(DATA_DISCOVERY_CACHE)) is None:
+        cache = hass.data[DATA_DISCOVERY_CACHE] = EarlyDiscoveryCache(hass)
+        cache.async_start()
+    return cache
 
 
 async def async_discover_devices(
     hass: HomeAssistant,
 ) -> list[bluetooth.BluetoothServiceInfoBleak]:
     """Discover EARLY Bluetooth devices."""
-    discovered_devices = []
-
-    # Get all discovered bluetooth devices
-    service_infos = bluetooth.async_discovered_service_info(hass)
-
-    for service_info in service_infos:
-        if EarlyBluetoothDevice.match_device(service_info):
-            discovered_devices.append(service_info)
-
-    return discovered_devices
+    return async_get_discovery_cache(hass).service_infos
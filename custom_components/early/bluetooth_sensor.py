@@ -7,22 +7,57 @@ from typing import TYPE_CHECKING, Any
 
 import requests
 from homeassistant.components import bluetooth
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_API_KEY, SIGNAL_STRENGTH_DECIBELS_MILLIWATT
+from homeassistant.const import (
+    CONF_API_KEY,
+    PERCENTAGE,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .bluetooth import EarlyBluetoothDevice
+from .capture import EarlyNotificationCapture
 from .const import (
     ATTR_ACTIVITY_NAME,
     ATTR_ORIENTATION,
+    ATTR_RAW_ORIENTATION,
     ATTR_RSSI,
     CONF_API_SECRET,
+    CONF_CAPTURE_NOTIFICATIONS,
+    CONF_CONNECTION_MODE,
+    CONF_CUBE_TRACKING,
+    CONF_LINGER_TIME,
+    CONF_LIVENESS_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_POLL_INTERVAL,
+    CONF_SETTLE_HYSTERESIS,
+    CONF_SETTLE_TIME,
+    DEFAULT_CAPTURE_NOTIFICATIONS,
+    DEFAULT_CONNECTION_MODE,
+    DEFAULT_CUBE_TRACKING,
+    DEFAULT_LINGER_TIME,
+    DEFAULT_LIVENESS_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_SETTLE_HYSTERESIS,
+    DEFAULT_SETTLE_TIME,
     DEVICE_NAME_PREFIX,
     DOMAIN,
+    TRACKER_SIDES,
 )
+from .cube_tracking import EarlyCubeTracking
+from .dwell import EarlyDwellTracker
+from .hub import EarlyTrackerHub
+from .journal import EarlyTrackingJournal
+from .scheduler import async_get_connection_scheduler
 
 if TYPE_CHECKING:
     from .sensor import EarlyAPICoordinator
@@ -38,23 +73,6 @@ async def async_setup_bluetooth_entry(
     """Set up EARLY Bluetooth sensors from a config entry."""
     address = config_entry.data["address"]
 
-    # Get the bluetooth device info
-    service_info = bluetooth.async_last_service_info(hass, address, connectable=True)
-    if not service_info:
-        _LOGGER.error("Could not find bluetooth device with address %s", address)
-        return
-
-    # Create the bluetooth device wrapper
-    ble_device = EarlyBluetoothDevice(hass, service_info.device, service_info)
-
-    # Connect to the device
-    if not await ble_device.connect():
-        _LOGGER.error("Failed to connect to bluetooth device %s", address)
-        return
-
-    # Store the device in hass data
-    hass.data[DOMAIN][config_entry.entry_id]["bluetooth_devices"][address] = ble_device
-
     # Check if we have API credentials to fetch activity mappings.
     # Credentials live in options (not data) so HA can handle them separately.
     coordinator = None
@@ -65,8 +83,9 @@ async def async_setup_bluetooth_entry(
         # Import here to avoid circular dependency
         from .sensor import EarlyAPICoordinator
 
-        # Create coordinator for fetching activities
-        coordinator = EarlyAPICoordinator(hass, api_key, api_secret)
+        # Create coordinator for fetching activities; the account's API entry
+        # reports tracking transitions
+        coordinator = EarlyAPICoordinator(hass, api_key, api_secret, fire_events=False)
         try:
             await coordinator.async_fetch_activities()
             hass.data[DOMAIN][config_entry.entry_id]["coordinator"] = coordinator
@@ -79,10 +98,108 @@ async def async_setup_bluetooth_entry(
             )
             coordinator = None
 
+    async_setup_tracker(
+        hass,
+        config_entry,
+        async_add_entities,
+        address,
+        config_entry.title,
+        coordinator,
+    )
+
+
+async def async_setup_hub_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    coordinator: EarlyAPICoordinator,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the trackers of a hub entry, adding new ones as they are seen."""
+
+    @callback
+    def _async_add_tracker(address: str, name: str) -> EarlyBluetoothDevice:
+        return async_setup_tracker(
+            hass, config_entry, async_add_entities, address, name, coordinator
+        )
+
+    hub = EarlyTrackerHub(hass, config_entry, _async_add_tracker)
+    hass.data[DOMAIN][config_entry.entry_id]["hub"] = hub
+    hub.async_start()
+
+
+@callback
+def async_setup_tracker(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    address: str,
+    name: str,
+    coordinator: EarlyAPICoordinator | None,
+) -> EarlyBluetoothDevice:
+    """Create a tracker's device and entities, and start connecting to it.
+
+    The entry's options tune the connection; for a hub entry they apply to
+    every tracker it manages.
+    """
+    # Get the bluetooth device info. A tracker that is out of range at boot
+    # has none yet; it is still set up and connects once it advertises.
+    service_info = bluetooth.async_last_service_info(hass, address, connectable=True)
+    if not service_info:
+        _LOGGER.debug(
+            "EARLY tracker %s not seen yet, will connect when it advertises",
+            address,
+        )
+
+    # Raw notification capture, for reproducing field problems
+    capture: EarlyNotificationCapture | None = None
+    if config_entry.options.get(
+        CONF_CAPTURE_NOTIFICATIONS, DEFAULT_CAPTURE_NOTIFICATIONS
+    ):
+        capture = EarlyNotificationCapture(hass, address)
+        config_entry.async_on_unload(capture.async_stop)
+        _LOGGER.info("Capturing notifications from %s to %s", address, capture.path)
+
+    # Create the bluetooth device wrapper
+    ble_device = EarlyBluetoothDevice(
+        hass,
+        service_info.device if service_info else None,
+        service_info,
+        min_update_interval=config_entry.options.get(
+            CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL
+        ),
+        address=address,
+        name=name,
+        connection_mode=config_entry.options.get(
+            CONF_CONNECTION_MODE, DEFAULT_CONNECTION_MODE
+        ),
+        poll_interval=config_entry.options.get(
+            CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL
+        ),
+        linger_time=config_entry.options.get(CONF_LINGER_TIME, DEFAULT_LINGER_TIME),
+        scheduler=async_get_connection_scheduler(hass),
+        settle_time=config_entry.options.get(CONF_SETTLE_TIME, DEFAULT_SETTLE_TIME),
+        settle_hysteresis=config_entry.options.get(
+            CONF_SETTLE_HYSTERESIS, DEFAULT_SETTLE_HYSTERESIS
+        ),
+        liveness_interval=config_entry.options.get(
+            CONF_LIVENESS_INTERVAL, DEFAULT_LIVENESS_INTERVAL
+        ),
+        capture=capture,
+    )
+
+    # Store the device in hass data so advertisements reach it
+    hass.data[DOMAIN][config_entry.entry_id]["bluetooth_devices"][address] = ble_device
+
+    # Per-side time today, computed locally so it works without the API
+    dwell = EarlyDwellTracker(hass, ble_device)
+    dwell.async_start()
+    config_entry.async_on_unload(dwell.async_stop)
+
     # Create sensors
-    sensors = [
+    sensors: list[SensorEntity] = [
         EarlyTrackerOrientationSensor(ble_device, config_entry),
         EarlyTrackerRSSISensor(ble_device, config_entry),
+        EarlyTrackerBatterySensor(ble_device, config_entry),
     ]
 
     # Add current activity sensor if we have API credentials
@@ -91,8 +208,33 @@ async def async_setup_bluetooth_entry(
             EarlyTrackerCurrentActivitySensor(ble_device, config_entry, coordinator)
         )
 
+    sensors.extend(
+        EarlyTrackerSideDwellSensor(ble_device, config_entry, dwell, side)
+        for side in range(1, TRACKER_SIDES + 1)
+    )
+
+    # Entities start unavailable; the connection is made in the background
+    # (with retries) so an absent tracker never holds up startup.
     async_add_entities(sensors, True)
 
+    if coordinator and config_entry.options.get(
+        CONF_CUBE_TRACKING, DEFAULT_CUBE_TRACKING
+    ):
+        # One journal per account entry, shared by a hub's trackers
+        entry_data = hass.data[DOMAIN][config_entry.entry_id]
+        if (journal := entry_data.get("journal")) is None:
+            journal = entry_data["journal"] = EarlyTrackingJournal(
+                hass, coordinator, config_entry.entry_id
+            )
+            journal.async_start()
+            config_entry.async_on_unload(journal.async_stop)
+        cube_tracking = EarlyCubeTracking(hass, ble_device, coordinator, journal)
+        cube_tracking.async_start()
+        config_entry.async_on_unload(cube_tracking.async_stop)
+
+    ble_device.async_start()
+    return ble_device
+
 
 class EarlyTrackerOrientationSensor(SensorEntity):
     """Representation of an EARLY tracker orientation sensor."""
@@ -110,9 +252,6 @@ class EarlyTrackerOrientationSensor(SensorEntity):
         self._attr_icon = "mdi:axis-z-rotate-counterclockwise"
         self._attr_native_unit_of_measurement = None
 
-        # Register callback for orientation changes
-        self._device.register_callback(self._handle_orientation_change)
-
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
@@ -134,6 +273,7 @@ class EarlyTrackerOrientationSensor(SensorEntity):
         """Return the state attributes."""
         return {
             ATTR_ORIENTATION: self._device.orientation,
+            ATTR_RAW_ORIENTATION: self._device.raw_orientation,
             "device_address": self._device.address,
         }
 
@@ -145,16 +285,21 @@ class EarlyTrackerOrientationSensor(SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._device.is_connected
+        return self._device.available
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Disconnect from the device when removed."""
-        self._device.unregister_callback(self._handle_orientation_change)
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to device updates until the entity is removed."""
+        self.async_on_remove(
+            self._device.register_callback(self._handle_orientation_change)
+        )
 
 
 class EarlyTrackerRSSISensor(SensorEntity):
     """Representation of an EARLY tracker RSSI sensor."""
 
+    # Pushed by the device as smoothed RSSI moves; nothing to poll
+    _attr_should_poll = False
+
     def __init__(
         self,
         device: EarlyBluetoothDevice,
@@ -181,14 +326,135 @@ class EarlyTrackerRSSISensor(SensorEntity):
         )
 
     @property
-    def native_value(self) -> int:
+    def native_value(self) -> int | None:
         """Return the state of the sensor."""
         return self._device.rssi
 
+    @callback
+    def _handle_rssi_change(self) -> None:
+        """Handle a published signal strength change from the device."""
+        self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self._device.available
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to device updates until the entity is removed."""
+        self.async_on_remove(
+            self._device.register_rssi_callback(self._handle_rssi_change)
+        )
+
+
+class EarlyTrackerBatterySensor(SensorEntity):
+    """Representation of an EARLY tracker battery sensor."""
+
+    # Pushed by the device when a new battery level is read
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        device: EarlyBluetoothDevice,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        self._device = device
+        self._config_entry = config_entry
+        self._attr_name = f"{device.name} Battery"
+        self._attr_unique_id = f"{device.address}_battery"
+        self._attr_device_class = SensorDeviceClass.BATTERY
+        self._attr_native_unit_of_measurement = PERCENTAGE
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._device.address)},
+            name=self._device.name,
+            manufacturer="Timeular",
+            model="ZEI Tracker",
+            connections={(bluetooth.DOMAIN, self._device.address)},
+        )
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the state of the sensor."""
+        return self._device.battery_level
+
+    @callback
+    def _handle_battery_change(self) -> None:
+        """Handle a battery level change from the device."""
+        self.async_write_ha_state()
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._device.is_connected
+        return self._device.available and self._device.battery_level is not None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to device updates until the entity is removed."""
+        self.async_on_remove(
+            self._device.register_battery_callback(self._handle_battery_change)
+        )
+
+
+class EarlyTrackerSideDwellSensor(SensorEntity):
+    """Representation of the time a tracker side has been up today."""
+
+    # Pushed by the dwell tracker as this side's total grows
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        device: EarlyBluetoothDevice,
+        config_entry: ConfigEntry,
+        dwell: EarlyDwellTracker,
+        side: int,
+    ) -> None:
+        """Initialize the sensor."""
+        self._device = device
+        self._config_entry = config_entry
+        self._dwell = dwell
+        self._side = side
+        self._attr_name = f"{device.name} Side {side} Today"
+        self._attr_unique_id = f"{device.address}_side_{side}_today"
+        self._attr_icon = "mdi:timer-outline"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
+        self._attr_suggested_unit_of_measurement = UnitOfTime.HOURS
+        self._attr_suggested_display_precision = 2
+        self._written_value: int | None = None
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._device.address)},
+            name=self._device.name,
+            manufacturer="Timeular",
+            model="ZEI Tracker",
+            connections={(bluetooth.DOMAIN, self._device.address)},
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return the state of the sensor."""
+        return round(self._dwell.seconds(self._side))
+
+    @callback
+    def _handle_dwell_update(self) -> None:
+        """Write the state when this side's total has moved."""
+        value = self.native_value
+        if value != self._written_value:
+            self._written_value = value
+            self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to dwell updates until the entity is removed."""
+        self._written_value = self.native_value
+        self.async_on_remove(self._dwell.register_callback(self._handle_dwell_update))
 
 
 class EarlyTrackerCurrentActivitySensor(SensorEntity):
@@ -208,9 +474,6 @@ class EarlyTrackerCurrentActivitySensor(SensorEntity):
         self._attr_unique_id = f"{device.address}_current_activity"
         self._attr_icon = "mdi:clock-outline"
 
-        # Register callback for orientation changes
-        self._device.register_callback(self._handle_orientation_change)
-
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
@@ -243,6 +506,7 @@ class EarlyTrackerCurrentActivitySensor(SensorEntity):
         """Return the state attributes."""
         attributes: dict[str, Any] = {
             ATTR_ORIENTATION: self._device.orientation,
+            ATTR_RAW_ORIENTATION: self._device.raw_orientation,
             "device_address": self._device.address,
         }
         activity_name = self._current_activity_name
@@ -258,8 +522,10 @@ class EarlyTrackerCurrentActivitySensor(SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._device.is_connected
+        return self._device.available
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Disconnect from the device when removed."""
-        self._device.unregister_callback(self._handle_orientation_change)
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to device updates until the entity is removed."""
+        self.async_on_remove(
+            self._device.register_callback(self._handle_orientation_change)
+        )
@@ -0,0 +1,201 @@
+"""Capture and replay of raw EARLY (Timeular) ZEI notifications."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import struct
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import CAPTURE_DIRECTORY, CAPTURE_FLUSH_INTERVAL, CAPTURE_MAX_BYTES
+
+if TYPE_CHECKING:
+    from .bluetooth import EarlyBluetoothDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_MAGIC = b"EZC1"
+# File header: magic, then the wall-clock start of the capture (Unix time)
+_HEADER = struct.Struct("<4sd")
+# Record: seconds since the capture started and the payload length, followed
+# by the payload itself (one byte for an orientation)
+_RECORD = struct.Struct("<dB")
+_MAX_PAYLOAD = 0xFF
+
+
+def capture_path(hass: HomeAssistant, address: str, started: datetime) -> str:
+    """Return the capture file path for a tracker's session."""
+    return hass.config.path(
+        CAPTURE_DIRECTORY,
+        f"{address.replace(':', '').lower()}-{started.strftime('%Y%m%dT%H%M%S')}.ezc",
+    )
+
+
+class EarlyNotificationCapture:
+    """Record a tracker's raw orientation notifications to a binary file.
+
+    Each notification is packed into an in-memory buffer on the event loop,
+    which costs one struct pack; the buffer is written out in the executor
+    every CAPTURE_FLUSH_INTERVAL seconds and when the capture stops, so the
+    notification path never touches the disk. Recording stops once the file
+    would exceed its size limit, and is suspended while a capture is replayed
+    through the same tracker.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        address: str,
+        max_bytes: int = CAPTURE_MAX_BYTES,
+    ) -> None:
+        """Initialize a capture that starts now."""
+        self.hass = hass
+        started = dt_util.now()
+        self._path = capture_path(hass, address, started)
+        self._start = time.monotonic()
+        self._max_bytes = max_bytes
+        self._buffer = bytearray(_HEADER.pack(CAPTURE_MAGIC, started.timestamp()))
+        self._size = len(self._buffer)
+        self._records = 0
+        self._full = False
+        self._suspended = 0
+        self._write_lock = asyncio.Lock()
+        self._cancel_flush: CALLBACK_TYPE | None = None
+
+    @property
+    def path(self) -> str:
+        """Return the path of the capture file."""
+        return self._path
+
+    @property
+    def records(self) -> int:
+        """Return the number of notifications recorded."""
+        return self._records
+
+    @callback
+    def record(self, timestamp: float, data: bytes | bytearray) -> None:
+        """Record a notification received at the monotonic timestamp."""
+        if self._full or self._suspended:
+            return
+        payload = bytes(data[:_MAX_PAYLOAD])
+        size = _RECORD.size + len(payload)
+        if self._size + size > self._max_bytes:
+            self._full = True
+            _LOGGER.warning(
+                "Notification capture %s reached %d bytes, no longer recording",
+                self._path,
+                self._size,
+            )
+            return
+        self._buffer += _RECORD.pack(timestamp - self._start, len(payload))
+        self._buffer += payload
+        self._size += size
+        self._records += 1
+        if self._cancel_flush is None:
+            self._cancel_flush = async_call_later(
+                self.hass, CAPTURE_FLUSH_INTERVAL, self._async_flush_timer
+            )
+
+    @contextmanager
+    def suspended(self) -> Iterator[None]:
+        """Skip recording within the block."""
+        self._suspended += 1
+        try:
+            yield
+        finally:
+            self._suspended -= 1
+
+    async def async_stop(self) -> None:
+        """Stop recording and write out what is buffered."""
+        self._full = True
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        await self._async_flush()
+
+    @callback
+    def _async_flush_timer(self, _now: Any) -> None:
+        """Write out the buffer in the background."""
+        self._cancel_flush = None
+        self.hass.async_create_background_task(
+            self._async_flush(), f"early capture {self._path}"
+        )
+
+    async def _async_flush(self) -> None:
+        """Append the buffered records to the file."""
+        # The lock keeps overlapping flushes in order
+        async with self._write_lock:
+            if not self._buffer:
+                return
+            data = bytes(self._buffer)
+            self._buffer.clear()
+            try:
+                await self.hass.async_add_executor_job(self._write, data)
+            except OSError as err:
+                _LOGGER.error("Error writing notification capture: %s", err)
+                self._full = True
+
+    def _write(self, data: bytes) -> None:
+        """Append data to the capture file (runs in the executor)."""
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        with open(self._path, "ab") as file:
+            file.write(data)
+
+
+def read_capture(path: str) -> list[tuple[float, bytes]]:
+    """Return the (seconds since start, payload) records of a capture file.
+
+    This does blocking I/O. A record cut short, as when Home Assistant stopped
+    mid-write, ends the capture.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if len(data) < _HEADER.size or data[:4] != CAPTURE_MAGIC:
+        raise ValueError(f"{path} is not an EARLY notification capture")
+
+    records: list[tuple[float, bytes]] = []
+    offset = _HEADER.size
+    while offset + _RECORD.size <= len(data):
+        elapsed, length = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        if offset + length > len(data):
+            break
+        records.append((elapsed, data[offset : offset + length]))
+        offset += length
+    return records
+
+
+async def async_replay_capture(
+    device: EarlyBluetoothDevice,
+    records: Sequence[tuple[float, bytes]],
+    speed: float = 1.0,
+) -> None:
+    """Feed captured notifications through a device's notification handler.
+
+    Notifications are spaced as captured, divided by speed (2.0 replays twice
+    as fast); a speed of 0 replays them back to back without waiting. The
+    device's own capture does not record the replayed notifications.
+    """
+    if not records:
+        return
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    first = records[0][0]
+    capture = device.capture
+    with capture.suspended() if capture is not None else nullcontext():
+        for elapsed, payload in records:
+            if (
+                speed > 0
+                and (delay := start + (elapsed - first) / speed - loop.time()) > 0
+            ):
+                await asyncio.sleep(delay)
+            device._on_orientation_changed(0, bytearray(payload))
@@ -11,12 +11,37 @@ from homeassistant import config_entries
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
 from homeassistant.const import CONF_ADDRESS, CONF_API_KEY
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
 from .bluetooth import EarlyBluetoothDevice
-from .const import API_SIGN_IN_ENDPOINT, CONF_API_SECRET, DOMAIN
+from .const import (
+    API_SIGN_IN_ENDPOINT,
+    CONF_API_SECRET,
+    CONF_CAPTURE_NOTIFICATIONS,
+    CONF_CONNECTION_MODE,
+    CONF_CUBE_TRACKING,
+    CONF_HUB,
+    CONF_LINGER_TIME,
+    CONF_LIVENESS_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_POLL_INTERVAL,
+    CONF_SETTLE_HYSTERESIS,
+    CONF_SETTLE_TIME,
+    CONNECTION_MODE_ON_DEMAND,
+    CONNECTION_MODE_PERSISTENT,
+    DEFAULT_CAPTURE_NOTIFICATIONS,
+    DEFAULT_CONNECTION_MODE,
+    DEFAULT_CUBE_TRACKING,
+    DEFAULT_LINGER_TIME,
+    DEFAULT_LIVENESS_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_SETTLE_HYSTERESIS,
+    DEFAULT_SETTLE_TIME,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +49,7 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_API_KEY): str,
         vol.Required(CONF_API_SECRET): str,
+        vol.Optional(CONF_HUB, default=False): bool,
     }
 )
 
@@ -75,12 +101,33 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._discovery_info: BluetoothServiceInfoBleak | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler()
+
+    @classmethod
+    @callback
+    def async_supports_options_flow(
+        cls, config_entry: config_entries.ConfigEntry
+    ) -> bool:
+        """Only entries that manage trackers have tunable options."""
+        return CONF_ADDRESS in config_entry.data or bool(
+            config_entry.data.get(CONF_HUB)
+        )
+
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
     ) -> FlowResult:
         """Handle the bluetooth discovery step."""
         await self.async_set_unique_id(discovery_info.address)
         self._abort_if_unique_id_configured()
+        if any(entry.data.get(CONF_HUB) for entry in self._async_current_entries()):
+            # The hub adopts the tracker on its own
+            return self.async_abort(reason="managed_by_hub")
 
         self._discovery_info = discovery_info
 
@@ -187,6 +234,74 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Bluetooth tracker connection options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the connection mode and its latency/capacity trade-offs."""
+        options = self.config_entry.options
+
+        if user_input is not None:
+            # Keep API credentials, which share the options mapping
+            return self.async_create_entry(title="", data={**options, **user_input})
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_CONNECTION_MODE,
+                        default=options.get(
+                            CONF_CONNECTION_MODE, DEFAULT_CONNECTION_MODE
+                        ),
+                    ): vol.In([CONNECTION_MODE_PERSISTENT, CONNECTION_MODE_ON_DEMAND]),
+                    vol.Required(
+                        CONF_POLL_INTERVAL,
+                        default=options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=30, max=86400)),
+                    vol.Required(
+                        CONF_LINGER_TIME,
+                        default=options.get(CONF_LINGER_TIME, DEFAULT_LINGER_TIME),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Required(
+                        CONF_MIN_UPDATE_INTERVAL,
+                        default=options.get(
+                            CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                    vol.Required(
+                        CONF_SETTLE_TIME,
+                        default=options.get(CONF_SETTLE_TIME, DEFAULT_SETTLE_TIME),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5000)),
+                    vol.Required(
+                        CONF_SETTLE_HYSTERESIS,
+                        default=options.get(
+                            CONF_SETTLE_HYSTERESIS, DEFAULT_SETTLE_HYSTERESIS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=60000)),
+                    vol.Required(
+                        CONF_LIVENESS_INTERVAL,
+                        default=options.get(
+                            CONF_LIVENESS_INTERVAL, DEFAULT_LIVENESS_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                    vol.Required(
+                        CONF_CUBE_TRACKING,
+                        default=options.get(CONF_CUBE_TRACKING, DEFAULT_CUBE_TRACKING),
+                    ): bool,
+                    vol.Required(
+                        CONF_CAPTURE_NOTIFICATIONS,
+                        default=options.get(
+                            CONF_CAPTURE_NOTIFICATIONS, DEFAULT_CAPTURE_NOTIFICATIONS
+                        ),
+                    ): bool,
+                }
+            ),
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
@@ -9,20 +9,180 @@ API_BASE_URL = "https://api.timeular.com/api/v3"
 API_SIGN_IN_ENDPOINT = f"{API_BASE_URL}/developer/sign-in"
 API_TRACKING_ENDPOINT = f"{API_BASE_URL}/tracking"
 API_ACTIVITIES_ENDPOINT = f"{API_BASE_URL}/activities"
+API_TIME_ENTRIES_ENDPOINT = f"{API_BASE_URL}/time-entries"
 
 # Bluetooth Configuration
 BLE_SERVICE_UUID = "c7e70010-c847-11e6-8175-8c89a55d403c"
 BLE_ORIENTATION_CHARACTERISTIC_UUID = "c7e70012-c847-11e6-8175-8c89a55d403c"
+BLE_FIRMWARE_REVISION_CHARACTERISTIC_UUID = "00002a26-0000-1000-8000-00805f9b34fb"
+# Standard Battery Service (0x180F) Battery Level characteristic
+BLE_BATTERY_LEVEL_CHARACTERISTIC_UUID = "00002a19-0000-1000-8000-00805f9b34fb"
 DEVICE_NAME_PREFIX = "Timeular ZEI"
 
+# Hub mode: an API account entry that also adopts and manages every ZEI
+# tracker it sees, instead of one config entry per tracker
+CONF_HUB = "hub"
+
 # Update interval (in seconds)
 DEFAULT_SCAN_INTERVAL = 30
 
+# Bluetooth tuning options (stored in config entry options)
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+# Minimum time between state writes for a tracker's entities (in seconds)
+DEFAULT_MIN_UPDATE_INTERVAL = 0.5
+
+# Orientation settle filter: a new face is only committed once it has been
+# stable for the settle time, and a committed face is kept for at least the
+# hysteresis time before it can be replaced (both in milliseconds)
+CONF_SETTLE_TIME = "settle_time"
+DEFAULT_SETTLE_TIME = 250
+CONF_SETTLE_HYSTERESIS = "settle_hysteresis"
+DEFAULT_SETTLE_HYSTERESIS = 0
+
+# Cube-driven tracking: flipping the tracker starts the activity mapped to
+# the side facing up, and the resting side stops tracking (opt-in, requires
+# API credentials)
+CONF_CUBE_TRACKING = "cube_tracking"
+DEFAULT_CUBE_TRACKING = False
+
+# Link-liveness watchdog (persistent mode): once a connection has been quiet
+# for this long, the orientation is read as a probe, and a failed probe forces
+# a reconnect; 0 disables the watchdog (in seconds)
+CONF_LIVENESS_INTERVAL = "liveness_interval"
+DEFAULT_LIVENESS_INTERVAL = 300
+LIVENESS_PROBE_TIMEOUT = 10.0
+
+# Notification capture (opt-in, for troubleshooting): raw orientation
+# notifications are recorded with timestamps to one compact binary file per
+# tracker and session under the config directory. Records are written out at
+# the flush interval (in seconds), and recording stops at the size limit
+CONF_CAPTURE_NOTIFICATIONS = "capture_notifications"
+DEFAULT_CAPTURE_NOTIFICATIONS = False
+CAPTURE_DIRECTORY = "early_captures"
+CAPTURE_FLUSH_INTERVAL = 10.0
+CAPTURE_MAX_BYTES = 4 * 1024 * 1024
+
+# Offline journal for cube-driven tracking: changes that could not be sent
+# are persisted and replayed once the API answers again, retried at this
+# interval, written to storage after this delay (both in seconds), and sent
+# this many intervals per batch
+JOURNAL_STORAGE_KEY = f"{DOMAIN}.journal.{{}}"
+JOURNAL_STORAGE_VERSION = 1
+JOURNAL_RETRY_INTERVAL = 60
+JOURNAL_SAVE_DELAY = 10
+JOURNAL_SYNC_BATCH = 50
+
+# Time-entries sync: on the first run the account's history is backfilled
+# this far back (in days), one window (in days) per request; afterwards each
+# sync, at the sync interval (in seconds), fetches from the persisted
+# high-water mark, re-checking this much before it (in hours) for entries
+# edited or deleted since. Storage is written after the save delay (in
+# seconds)
+TIME_ENTRIES_STORAGE_KEY = f"{DOMAIN}.time_entries.{{}}"
+TIME_ENTRIES_STORAGE_VERSION = 1
+TIME_ENTRIES_SYNC_INTERVAL = 15 * 60
+TIME_ENTRIES_BACKFILL_DAYS = 365
+TIME_ENTRIES_PAGE_DAYS = 30
+TIME_ENTRIES_RECHECK_HOURS = 48
+TIME_ENTRIES_SAVE_DELAY = 10
+# Synced time entries are kept in this SQLite database in the config
+# directory (formatted with the entry ID) for local range queries
+TIME_ENTRIES_DATABASE = "early_time_entries.{}.db"
+
+# Long-term statistics: the hourly time per activity is imported into the
+# recorder as external statistics, at most this many hours per import call,
+# this long (in seconds) after synced entries change and every hour at this
+# minute. Imports resume from the last imported hour kept in storage
+STATISTICS_STORAGE_KEY = f"{DOMAIN}.statistics.{{}}"
+STATISTICS_STORAGE_VERSION = 1
+STATISTICS_SAVE_DELAY = 10
+STATISTICS_IMPORT_CHUNK_HOURS = 7 * 24
+STATISTICS_IMPORT_DELAY = 30
+STATISTICS_IMPORT_MINUTE = 5
+
+# Connection mode: hold a connection permanently (lowest latency, one
+# connection slot per tracker), or connect on demand when the tracker
+# advertises and on a fixed cadence (frees the slot between sessions)
+CONF_CONNECTION_MODE = "connection_mode"
+CONNECTION_MODE_PERSISTENT = "persistent"
+CONNECTION_MODE_ON_DEMAND = "on_demand"
+DEFAULT_CONNECTION_MODE = CONNECTION_MODE_PERSISTENT
+# On-demand mode: time between scheduled reads (in seconds)
+CONF_POLL_INTERVAL = "poll_interval"
+DEFAULT_POLL_INTERVAL = 300
+# On-demand mode: how long to stay subscribed after a read, extended by
+# each notification; 0 releases the slot right after the read (in seconds)
+CONF_LINGER_TIME = "linger_time"
+DEFAULT_LINGER_TIME = 30
+# On-demand mode: minimum gap between advertisement-triggered sessions
+# (in seconds)
+ON_DEMAND_ADVERTISEMENT_COOLDOWN = 60.0
+
+# Connection establishment: attempts per connect and overall time budget
+# (in seconds) across those attempts
+CONNECT_MAX_ATTEMPTS = 3
+CONNECT_TIMEOUT = 45.0
+
+# Connection slot scheduling: concurrent attempts allowed per adapter or
+# proxy, and minimum gap between attempt starts on one (in seconds)
+CONNECT_CONCURRENCY_PER_SOURCE = 2
+CONNECT_ATTEMPT_SPACING = 1.0
+DATA_CONNECTION_SCHEDULER = f"{DOMAIN}_connection_scheduler"
+
+# Trackers currently visible, shared by discovery queries and the hub
+DATA_DISCOVERY_CACHE = f"{DOMAIN}_discovery_cache"
+
+# Reconnect backoff (in seconds)
+RECONNECT_BACKOFF_INITIAL = 1.0
+RECONNECT_BACKOFF_MAX = 300.0
+# Minimum gap between advertisement-triggered reconnect attempts (in seconds)
+RECONNECT_ADVERTISEMENT_COOLDOWN = 2.0
+
+# Signal strength: exponential smoothing factor for advertisement RSSI, and
+# the smoothed value is published at most once per interval (in seconds) and
+# only when it moved by at least the threshold (in dB). Advertisement
+# callbacks do not fire for RSSI-only changes, so the latest advertisement is
+# also sampled every RSSI_SAMPLE_INTERVAL seconds while anything listens.
+RSSI_SMOOTHING_FACTOR = 0.2
+RSSI_PUBLISH_INTERVAL = 30.0
+RSSI_CHANGE_THRESHOLD = 2
+RSSI_SAMPLE_INTERVAL = 10.0
+
+# Orientation history: settled face changes kept per tracker in a ring buffer
+# (12 bytes per event), and how many of the latest appear in diagnostics
+ORIENTATION_HISTORY_SIZE = 1024
+DIAGNOSTICS_HISTORY_EVENTS = 20
+
+# ZEI trackers have eight sides; orientation 0 means resting on the base
+TRACKER_SIDES = 8
+
+# Per-side dwell time sensors are refreshed at this interval while a side is
+# up (in seconds); totals restart at local midnight
+DWELL_UPDATE_INTERVAL = 60
+
+# Battery level is read after connecting and then at this interval over an
+# existing connection, unless the tracker notifies changes (in seconds)
+BATTERY_POLL_INTERVAL = 3 * 60 * 60
+
+# Dispatcher signals sent with each tracker update, formatted with the
+# tracker's address
+SIGNAL_ORIENTATION_UPDATED = f"{DOMAIN}_orientation_updated_{{}}"
+SIGNAL_RSSI_UPDATED = f"{DOMAIN}_rssi_updated_{{}}"
+SIGNAL_BATTERY_UPDATED = f"{DOMAIN}_battery_updated_{{}}"
+SIGNAL_DWELL_UPDATED = f"{DOMAIN}_dwell_updated_{{}}"
+
 # Sensor attributes
 ATTR_ACTIVITY_ID = "activity_id"
 ATTR_ACTIVITY_NAME = "activity_name"
 ATTR_STARTED_AT = "started_at"
 ATTR_NOTE = "note"
 ATTR_ORIENTATION = "orientation"
+ATTR_RAW_ORIENTATION = "raw_orientation"
 ATTR_RSSI = "rssi"
 ATTR_BATTERY_LEVEL = "battery_level"
+ATTR_PREVIOUS_ACTIVITY_ID = "previous_activity_id"
+ATTR_PREVIOUS_ACTIVITY_NAME = "previous_activity_name"
+ATTR_DURATION = "duration"
+
+# Events
+EVENT_TRACKING_CHANGED = f"{DOMAIN}_tracking_changed"
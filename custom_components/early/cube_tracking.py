@@ -0,0 +1,185 @@
+"""Cube-driven time tracking for EARLY (Timeular) ZEI trackers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Final
+
+import requests
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .bluetooth import EarlyBluetoothDevice
+from .sensor import is_rejection
+
+if TYPE_CHECKING:
+    from .journal import EarlyTrackingJournal
+    from .sensor import EarlyAPICoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Orientation reported while the tracker rests on its base
+RESTING_SIDE = 0
+
+_UNKNOWN: Final = object()
+
+
+def tracked_activity_id(tracking: dict[str, Any] | None) -> str | None:
+    """Return the activity ID of a running tracking, or None when stopped."""
+    if not tracking:
+        return None
+    return (tracking.get("activity") or {}).get("id") or tracking.get("activityId")
+
+
+class EarlyCubeTracking:
+    """Start and stop EARLY tracking as the tracker is flipped.
+
+    Settled orientation changes resolve to an activity through the
+    coordinator's device side index: a mapped side starts tracking that
+    activity, the resting side (or a side with no activity) stops tracking.
+    Only one API command is in flight at a time; flips made meanwhile replace
+    each other, so only the final side is sent once it completes. With a
+    journal, a command that fails while the API is unreachable is journaled
+    instead of dropped, and later flips join it until the journal has been
+    replayed. A command the API rejects is dropped.
+
+    Until a command has succeeded, the running activity is fetched from the
+    API before the first one is sent, so a side that already matches it
+    (e.g. after a restart) does not restart the running entry.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device: EarlyBluetoothDevice,
+        coordinator: EarlyAPICoordinator,
+        journal: EarlyTrackingJournal | None = None,
+    ) -> None:
+        """Initialize cube-driven tracking."""
+        self.hass = hass
+        self._device = device
+        self._coordinator = coordinator
+        self._journal = journal
+        self._side: int | None = None
+        self._pending: int | None = None
+        self._pending_at: datetime | None = None
+        self._task: asyncio.Task | None = None
+        self._unsubscribe: CALLBACK_TYPE | None = None
+        # Activity ID (None when stopped) the last command put in place
+        self._applied: str | None | object = _UNKNOWN
+
+    @callback
+    def async_start(self) -> None:
+        """Follow the tracker's settled orientation."""
+        self._unsubscribe = self._device.register_callback(
+            self._async_orientation_changed
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the tracker and drop any queued command."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        self._pending = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @callback
+    def _async_orientation_changed(self) -> None:
+        """Queue a command for the current side, replacing any queued one."""
+        if not self._device.available:
+            # Callbacks also fire on disconnect; the orientation is stale then
+            return
+        side = self._device.orientation
+        if side == self._side:
+            return
+        self._side = side
+        self._pending = side
+        self._pending_at = self._async_side_up_since(side)
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_process(),
+                f"early cube tracking {self._device.address}",
+            )
+
+    async def _async_process(self) -> None:
+        """Send queued commands until the latest side has been applied."""
+        try:
+            while (side := self._pending) is not None:
+                self._pending = None
+                await self._async_apply(side, self._pending_at or dt_util.utcnow())
+        finally:
+            self._task = None
+
+    @callback
+    def _async_side_up_since(self, side: int) -> datetime:
+        """Return the wall-clock time side was committed."""
+        now = dt_util.utcnow()
+        latest = self._device.orientation_history.latest()
+        if latest is None or latest[1] != side:
+            return now
+        # Dispatches may be coalesced; the history has the commit time
+        return now - timedelta(seconds=max(0.0, time.monotonic() - latest[0]))
+
+    async def _async_apply(self, side: int, at: datetime) -> None:
+        """Start or stop tracking for side, which came up at the given time."""
+        coordinator = self._coordinator
+        if side != RESTING_SIDE and not coordinator.get_all_activities():
+            await coordinator.async_fetch_activities()
+
+        journal = self._journal
+        if (
+            journal is not None
+            and side != RESTING_SIDE
+            and not coordinator.get_all_activities()
+        ):
+            # Offline since startup; the side's activity is resolved on replay
+            await journal.async_append(side, None, at)
+            self._applied = _UNKNOWN
+            return
+
+        activity_id = (
+            coordinator.get_activity_id_by_device_side(side)
+            if side != RESTING_SIDE
+            else None
+        )
+        pending = journal is not None and journal.pending
+        if self._applied is _UNKNOWN and not pending:
+            try:
+                self._applied = tracked_activity_id(
+                    await coordinator.async_get_current_tracking()
+                )
+            except requests.exceptions.RequestException as err:
+                # The command below fails the same way or finds the API back
+                _LOGGER.debug("Error fetching the running EARLY tracking: %s", err)
+        if activity_id == self._applied:
+            return
+
+        if pending:
+            # Still offline or replaying; keep the change in order behind it
+            await journal.async_append(side, activity_id, at)
+            self._applied = activity_id
+            return
+
+        try:
+            if activity_id is None:
+                _LOGGER.debug("Side %d is not tracked, stopping tracking", side)
+                await coordinator.stop_tracking()
+            else:
+                _LOGGER.debug("Side %d flipped up, tracking %s", side, activity_id)
+                await coordinator.start_tracking(activity_id)
+        except requests.exceptions.RequestException as err:
+            # Already logged by the coordinator
+            if journal is not None and not is_rejection(err):
+                await journal.async_append(side, activity_id, at)
+                self._applied = activity_id
+                return
+            # Retry on the next flip
+            self._applied = _UNKNOWN
+            return
+        self._applied = activity_id
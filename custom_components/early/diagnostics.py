@@ -0,0 +1,82 @@
+"""Diagnostics support for EARLY (Timeular)."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_API_KEY
+from homeassistant.core import HomeAssistant
+
+from .bluetooth import EarlyBluetoothDevice
+from .const import (
+    ATTR_BATTERY_LEVEL,
+    CONF_API_SECRET,
+    DATA_CONNECTION_SCHEDULER,
+    DIAGNOSTICS_HISTORY_EVENTS,
+    DOMAIN,
+)
+
+TO_REDACT = {CONF_API_KEY, CONF_API_SECRET}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    now = time.monotonic()
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "bluetooth_devices": {
+            address: {
+                "connected": device.is_connected,
+                "orientation": device.orientation,
+                "raw_orientation": device.raw_orientation,
+                "firmware_revision": device.firmware_revision,
+                ATTR_BATTERY_LEVEL: device.battery_level,
+                "connection": device.connection_stats,
+                "listeners": device.listener_counts,
+                "history": _history_diagnostics(device, now),
+                "capture": (
+                    {"path": capture.path, "records": capture.records}
+                    if (capture := device.capture)
+                    else None
+                ),
+            }
+            for address, device in entry_data.get("bluetooth_devices", {}).items()
+            if isinstance(device, EarlyBluetoothDevice)
+        },
+        "time_entries": (
+            sync.stats if (sync := entry_data.get("time_entries")) else None
+        ),
+        "time_entry_database": (
+            database.stats
+            if (database := entry_data.get("time_entry_database"))
+            else None
+        ),
+        "connection_scheduler": (
+            scheduler.stats
+            if (scheduler := hass.data.get(DATA_CONNECTION_SCHEDULER))
+            else {}
+        ),
+    }
+
+
+def _history_diagnostics(device: EarlyBluetoothDevice, now: float) -> dict[str, Any]:
+    """Summarise the tracker's orientation history, newest events last."""
+    history = device.orientation_history
+    return {
+        "capacity": history.capacity,
+        "total_events": history.total,
+        "recent": [
+            {"seconds_ago": round(now - timestamp, 1), "orientation": face}
+            for timestamp, face in history.snapshot().recent(DIAGNOSTICS_HISTORY_EVENTS)
+        ],
+    }
@@ -0,0 +1,152 @@
+"""Per-side dwell time for EARLY (Timeular) ZEI trackers."""
+
+from __future__ import annotations
+
+import logging
+import time
+from array import array
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .bluetooth import EarlyBluetoothDevice, EarlyListenerRegistry
+from .const import DWELL_UPDATE_INTERVAL, SIGNAL_DWELL_UPDATED, TRACKER_SIDES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EarlyDwellTracker:
+    """Accumulate the time each side of a tracker has been up today.
+
+    Each committed face change closes the running face's interval into its
+    accumulator, so totals cost O(1) per change and never rescan the history;
+    the running face's open interval is added when a total is read. Totals
+    restart at local midnight, checked whenever they are touched, with the
+    running face's time split at midnight. One periodic tick per tracker,
+    running while anything listens, refreshes the side sensors.
+    """
+
+    def __init__(self, hass: HomeAssistant, device: EarlyBluetoothDevice) -> None:
+        """Initialize the dwell tracker."""
+        self.hass = hass
+        self._device = device
+        # Seconds per face today, indexed by face (0 is the resting side)
+        self._totals = array("d", bytes(8 * (TRACKER_SIDES + 1)))
+        self._face: int | None = None
+        self._since = 0.0
+        self._day = dt_util.now().date()
+        self._listeners = EarlyListenerRegistry(
+            hass, SIGNAL_DWELL_UPDATED.format(device.address)
+        )
+        self._unsubscribe: CALLBACK_TYPE | None = None
+        self._cancel_tick: CALLBACK_TYPE | None = None
+
+    @property
+    def running_face(self) -> int | None:
+        """Return the face being timed, or None while the tracker is away."""
+        return self._face
+
+    def seconds(self, face: int) -> float:
+        """Return the seconds face has been up today."""
+        if not 0 <= face <= TRACKER_SIDES:
+            return 0.0
+        self._async_roll_day()
+        total = self._totals[face]
+        if face == self._face:
+            total += time.monotonic() - self._since
+        return total
+
+    @callback
+    def register_callback(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Register a listener for tick and face updates; returns an unsubscribe handle."""
+        remove = self._listeners.async_add(listener)
+        if self._cancel_tick is None:
+            self._cancel_tick = async_track_time_interval(
+                self.hass, self._async_tick, timedelta(seconds=DWELL_UPDATE_INTERVAL)
+            )
+
+        @callback
+        def _async_remove() -> None:
+            remove()
+            if not self._listeners:
+                self._async_cancel_tick()
+
+        return _async_remove
+
+    @callback
+    def async_start(self) -> None:
+        """Start timing the tracker's committed faces."""
+        self._unsubscribe = self._device.register_callback(
+            self._async_orientation_changed
+        )
+        self._async_orientation_changed()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop timing."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        self._async_cancel_tick()
+
+    @callback
+    def _async_cancel_tick(self) -> None:
+        """Cancel the periodic refresh, if running."""
+        if self._cancel_tick is not None:
+            self._cancel_tick()
+            self._cancel_tick = None
+
+    @callback
+    def _async_orientation_changed(self) -> None:
+        """Move the running interval to the newly committed face."""
+        self._async_roll_day()
+        face: int | None = None
+        since = time.monotonic()
+        if self._device.available:
+            face = self._device.orientation
+            latest = self._device.orientation_history.latest()
+            if self._face is not None and latest is not None and latest[1] == face:
+                # The face came up when it was committed (the dispatch may have
+                # been coalesced), but no earlier than midnight
+                since = max(latest[0], self._since)
+            if face > TRACKER_SIDES:
+                face = None
+
+        if face == self._face:
+            return
+        self._async_close_interval(since)
+        self._face = face
+        self._listeners.async_fire()
+
+    @callback
+    def _async_close_interval(self, now: float) -> None:
+        """Credit the running face with its time up to now."""
+        if self._face is not None:
+            self._totals[self._face] += max(0.0, now - self._since)
+        self._since = now
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Refresh listeners while a face is accumulating time or a day ended."""
+        if self._async_roll_day() or self._face is not None:
+            self._listeners.async_fire()
+
+    @callback
+    def _async_roll_day(self) -> bool:
+        """Start a new day if local midnight has passed; return if it had."""
+        now = dt_util.now()
+        if now.date() == self._day:
+            return False
+        _LOGGER.debug("Resetting dwell times for %s", self._device.address)
+        # The running face's time before midnight belongs to the old day
+        midnight = (
+            time.monotonic() - (now - dt_util.start_of_local_day(now)).total_seconds()
+        )
+        self._async_close_interval(max(midnight, self._since))
+        for face in range(len(self._totals)):
+            self._totals[face] = 0.0
+        self._day = now.date()
+        return True
@@ -0,0 +1,111 @@
+"""Orientation event history for EARLY (Timeular) ZEI trackers."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+
+from .const import ORIENTATION_HISTORY_SIZE
+
+
+class EarlyOrientationHistory:
+    """Fixed-capacity ring buffer of (monotonic timestamp, face) events.
+
+    Events live in two preallocated typed arrays, so appending is O(1) and
+    memory stays bounded however long the tracker runs; once full, the oldest
+    event is overwritten. Events are numbered by a running sequence, and an
+    appender claims a sequence before writing its slot, which lets snapshots be
+    read off the event loop and detect slots overwritten in the meantime.
+    """
+
+    __slots__ = ("_capacity", "_timestamps", "_faces", "_total")
+
+    def __init__(self, capacity: int = ORIENTATION_HISTORY_SIZE) -> None:
+        """Initialize an empty history."""
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._faces = array("B", bytes(capacity))
+        self._total = 0
+
+    def __len__(self) -> int:
+        """Return the number of events held."""
+        return min(self._total, self._capacity)
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of events held."""
+        return self._capacity
+
+    @property
+    def total(self) -> int:
+        """Return the number of events ever appended."""
+        return self._total
+
+    def append(self, timestamp: float, face: int) -> None:
+        """Record that face came up at the monotonic timestamp."""
+        index = self._total % self._capacity
+        self._total += 1
+        self._timestamps[index] = timestamp
+        self._faces[index] = face
+
+    def latest(self) -> tuple[float, int] | None:
+        """Return the most recent event, if any."""
+        if not self._total:
+            return None
+        index = (self._total - 1) % self._capacity
+        return self._timestamps[index], self._faces[index]
+
+    def snapshot(self) -> EarlyOrientationHistorySnapshot:
+        """Return a view of the events held now, without copying them."""
+        return EarlyOrientationHistorySnapshot(
+            self, max(0, self._total - self._capacity), self._total
+        )
+
+
+class EarlyOrientationHistorySnapshot:
+    """Events of an EarlyOrientationHistory up to the moment it was taken.
+
+    Taking a snapshot is O(1); events are read from the shared arrays only as
+    the snapshot is iterated, which may happen in an executor. Events the
+    history has overwritten by then are skipped, so iteration always yields a
+    consistent, oldest-first suffix of the snapshot.
+    """
+
+    __slots__ = ("_history", "_start", "_end")
+
+    def __init__(self, history: EarlyOrientationHistory, start: int, end: int) -> None:
+        """Initialize the snapshot over sequences start to end (exclusive)."""
+        self._history = history
+        self._start = start
+        self._end = end
+
+    def __len__(self) -> int:
+        """Return the number of events the snapshot covered when taken."""
+        return self._end - self._start
+
+    def __iter__(self) -> Iterator[tuple[float, int]]:
+        """Yield (timestamp, face) events, oldest first."""
+        return self._iter_from(self._start)
+
+    def recent(self, count: int) -> list[tuple[float, int]]:
+        """Return up to the last count events, oldest first."""
+        return list(self._iter_from(max(self._start, self._end - count)))
+
+    def since(self, timestamp: float) -> list[tuple[float, int]]:
+        """Return the events at or after the monotonic timestamp, oldest first."""
+        return [event for event in self if event[0] >= timestamp]
+
+    def _iter_from(self, start: int) -> Iterator[tuple[float, int]]:
+        """Yield the events from sequence start that have not been overwritten."""
+        history = self._history
+        capacity = history._capacity
+        timestamps = history._timestamps
+        faces = history._faces
+        for sequence in range(start, self._end):
+            index = sequence % capacity
+            event = (timestamps[index], faces[index])
+            # Checked after reading: an appender claims the sequence first
+            if sequence >= history._total - capacity:
+                yield event
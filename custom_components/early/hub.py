@@ -0,0 +1,128 @@
+"""Hub mode: one EARLY account entry managing many ZEI trackers."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+
+from homeassistant.components import bluetooth
+from homeassistant.components.bluetooth.match import BluetoothCallbackMatcher
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from .bluetooth import EarlyBluetoothDevice, async_get_discovery_cache
+from .const import BLE_SERVICE_UUID, DEVICE_NAME_PREFIX, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EarlyTrackerHub:
+    """Adopt and manage every ZEI tracker for one EARLY account entry.
+
+    A single advertisement subscription covers all trackers and dispatches by
+    address. Trackers seen for the first time are set up on the entry's
+    platform as they appear; trackers set up before are restored from the
+    device registry at startup, so they connect once back in range. Trackers
+    that have their own config entry are left to it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        add_tracker: Callable[[str, str], EarlyBluetoothDevice],
+    ) -> None:
+        """Initialize the hub.
+
+        add_tracker creates a tracker's device and entities given its address
+        and name, and returns the device.
+        """
+        self.hass = hass
+        self._entry = entry
+        self._add_tracker = add_tracker
+        self._devices: dict[str, EarlyBluetoothDevice] = hass.data[DOMAIN][
+            entry.entry_id
+        ]["bluetooth_devices"]
+
+    @property
+    def addresses(self) -> list[str]:
+        """Return the addresses of the managed trackers."""
+        return list(self._devices)
+
+    @callback
+    def async_start(self) -> None:
+        """Set up known and visible trackers, then follow advertisements."""
+        for address, name in self._async_registered_trackers():
+            if not self._async_has_own_entry(address):
+                self._async_adopt(address, name)
+
+        for service_info in async_get_discovery_cache(self.hass).service_infos:
+            self._async_handle_bluetooth_event(
+                service_info, bluetooth.BluetoothChange.ADVERTISEMENT
+            )
+
+        # Trackers advertising without a name are still caught by service UUID
+        for matcher in (
+            BluetoothCallbackMatcher(
+                local_name=f"{DEVICE_NAME_PREFIX}*", connectable=True
+            ),
+            BluetoothCallbackMatcher(service_uuid=BLE_SERVICE_UUID, connectable=True),
+        ):
+            self._entry.async_on_unload(
+                bluetooth.async_register_callback(
+                    self.hass,
+                    self._async_handle_bluetooth_event,
+                    matcher,
+                    bluetooth.BluetoothScanningMode.ACTIVE,
+                )
+            )
+
+    @callback
+    def _async_handle_bluetooth_event(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Route an advertisement to its tracker, adopting new trackers."""
+        if (device := self._devices.get(service_info.address)) is None:
+            if not EarlyBluetoothDevice.match_device(service_info):
+                return
+            if self._async_has_own_entry(service_info.address):
+                return
+            device = self._async_adopt(
+                service_info.address, service_info.name or DEVICE_NAME_PREFIX
+            )
+        device.async_handle_advertisement(service_info, change)
+
+    @callback
+    def _async_adopt(self, address: str, name: str) -> EarlyBluetoothDevice:
+        """Set up a tracker under this hub."""
+        _LOGGER.info("Adding EARLY tracker %s (%s) to the hub", name, address)
+        return self._add_tracker(address, name)
+
+    @callback
+    def _async_has_own_entry(self, address: str) -> bool:
+        """Return whether a standalone entry already manages the tracker."""
+        return any(
+            entry.unique_id == address
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+        )
+
+    @callback
+    def _async_registered_trackers(self) -> list[tuple[str, str]]:
+        """Return (address, name) of trackers this hub has set up before."""
+        device_registry = dr.async_get(self.hass)
+        return [
+            (address, device_entry.name or DEVICE_NAME_PREFIX)
+            for device_entry in dr.async_entries_for_config_entry(
+                device_registry, self._entry.entry_id
+            )
+            # Trackers are the devices with a Bluetooth connection
+            if any(
+                connection_type == bluetooth.DOMAIN
+                for connection_type, _ in device_entry.connections
+            )
+            for domain, address in device_entry.identifiers
+            if domain == DOMAIN
+        ]
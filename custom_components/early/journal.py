@@ -0,0 +1,309 @@
+"""Offline journal for cube-driven EARLY (Timeular) tracking."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import requests
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    JOURNAL_RETRY_INTERVAL,
+    JOURNAL_SAVE_DELAY,
+    JOURNAL_STORAGE_KEY,
+    JOURNAL_STORAGE_VERSION,
+    JOURNAL_SYNC_BATCH,
+)
+from .cube_tracking import RESTING_SIDE, tracked_activity_id
+from .sensor import is_rejection, parse_api_time
+
+if TYPE_CHECKING:
+    from .sensor import EarlyAPICoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Entries starting within this of a journaled change are taken to be its
+# entry when replaying (the API stores milliseconds)
+_MATCH_TOLERANCE = timedelta(seconds=1)
+
+
+class EarlyTrackingJournal:
+    """Tracking changes that could not be sent to the API yet.
+
+    When a cube-driven start or stop fails, the change is journaled with the
+    time the side came up, and so is every later change until the journal has
+    been replayed, keeping them in order. The journal is persisted in Home
+    Assistant storage, so an outage spanning a restart is not lost.
+
+    Replay turns the journal into the timesheet the cube described: what was
+    running when the outage began is stopped at the first change, each closed
+    interval becomes a time entry, and the last change is started from when it
+    happened. Intervals are sent in batches against one listing of the
+    entries already in their window; an entry already there is kept or
+    patched instead of duplicated, so replaying the same changes twice (after
+    a failure part way, or a restart before the journal was saved) is safe.
+
+    Only transient failures (the API unreachable, timing out or failing
+    with a server error) keep a change for the next retry. A request the API
+    rejects, such as for an archived activity or an overlapping interval,
+    is logged and its change dropped, so it cannot hold up the rest.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: EarlyAPICoordinator,
+        entry_id: str,
+    ) -> None:
+        """Initialize the journal for one EARLY account entry."""
+        self.hass = hass
+        self._coordinator = coordinator
+        self._store: Store[dict[str, Any]] = Store(
+            hass, JOURNAL_STORAGE_VERSION, JOURNAL_STORAGE_KEY.format(entry_id)
+        )
+        self._changes: list[dict[str, Any]] = []
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self._task: asyncio.Task | None = None
+        self._cancel_retry: CALLBACK_TYPE | None = None
+
+    @property
+    def pending(self) -> int:
+        """Return the number of changes waiting to be replayed."""
+        return len(self._changes)
+
+    @callback
+    def async_start(self) -> None:
+        """Load the journal and replay what a previous run left behind."""
+        self._async_start_sync()
+
+    async def async_stop(self) -> None:
+        """Stop replaying and persist the journal."""
+        self._async_cancel_retry()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._loaded:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_append(
+        self, side: int, activity_id: str | None, at: datetime
+    ) -> None:
+        """Journal that side came up at the given time.
+
+        activity_id is the side's activity, or None for the resting side or
+        when it is not known yet; it is then resolved when replaying.
+        """
+        await self._async_load()
+        self._changes.append(
+            {"side": side, "activity_id": activity_id, "at": at.isoformat()}
+        )
+        self._store.async_delay_save(self._data_to_save, JOURNAL_SAVE_DELAY)
+        if self._cancel_retry is None:
+            # Not known to be offline; the first change of an outage comes
+            # from a failed request and waits for the retry interval
+            if len(self._changes) == 1:
+                self._async_schedule_retry()
+            else:
+                self._async_start_sync()
+
+    @callback
+    def _async_start_sync(self) -> None:
+        """Start replaying in the background unless already running."""
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_sync(), "early tracking journal"
+            )
+
+    @callback
+    def _async_schedule_retry(self) -> None:
+        """Try replaying again after the retry interval."""
+        self._async_cancel_retry()
+        self._cancel_retry = async_call_later(
+            self.hass, JOURNAL_RETRY_INTERVAL, self._async_retry_timer
+        )
+
+    @callback
+    def _async_cancel_retry(self) -> None:
+        """Cancel a scheduled replay attempt, if any."""
+        if self._cancel_retry is not None:
+            self._cancel_retry()
+            self._cancel_retry = None
+
+    @callback
+    def _async_retry_timer(self, _now: Any) -> None:
+        """Replay once the retry interval has passed."""
+        self._cancel_retry = None
+        self._async_start_sync()
+
+    async def _async_load(self) -> None:
+        """Load the journal from storage once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            if (data := await self._store.async_load()) is not None:
+                # Changes journaled before loading finished come after these
+                self._changes[:0] = data.get("changes", [])
+            self._loaded = True
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the journal as stored."""
+        return {"changes": self._changes}
+
+    async def _async_sync(self) -> None:
+        """Replay the journal until it is empty, retrying later on failure."""
+        try:
+            await self._async_load()
+            while self._changes:
+                await self._async_replay_batch()
+        except requests.exceptions.RequestException as err:
+            _LOGGER.warning(
+                "EARLY API unreachable, %d tracking changes kept for later: %s",
+                len(self._changes),
+                err,
+            )
+            self._async_schedule_retry()
+        except (KeyError, ValueError) as err:
+            _LOGGER.error(
+                "Invalid EARLY tracking data, %d changes kept for later: %s",
+                len(self._changes),
+                err,
+            )
+            self._async_schedule_retry()
+        else:
+            _LOGGER.debug("Tracking journal replayed")
+        finally:
+            self._task = None
+            if self._loaded:
+                self._store.async_delay_save(self._data_to_save, JOURNAL_SAVE_DELAY)
+
+    async def _async_replay_batch(self) -> None:
+        """Replay up to JOURNAL_SYNC_BATCH changes from the head of the journal."""
+        coordinator = self._coordinator
+        changes = self._changes[: JOURNAL_SYNC_BATCH + 1]
+        times = [_parse_time(change["at"]) for change in changes]
+        if any(
+            change["activity_id"] is None and change["side"] != RESTING_SIDE
+            for change in changes
+        ):
+            if not coordinator.get_all_activities():
+                await coordinator.async_fetch_activities()
+            if not coordinator.get_all_activities():
+                # Without the side mapping every side would replay as a stop
+                raise requests.exceptions.ConnectionError("Activities unavailable")
+            for change in changes:
+                if change["activity_id"] is None and change["side"] != RESTING_SIDE:
+                    change["activity_id"] = coordinator.get_activity_id_by_device_side(
+                        change["side"]
+                    )
+
+        # Whatever was running when the outage began ends at the first change
+        running = await coordinator.async_get_current_tracking()
+        running_since = _started_at(running)
+        if running_since is not None and running_since < times[0]:
+            if await self._async_send(
+                "stop", coordinator.stop_tracking(stopped_at=times[0])
+            ):
+                running = None
+
+        # Each change followed by another is a closed interval
+        closed = len(changes) - 1
+        if closed:
+            existing = await coordinator.async_get_time_entries(times[0], times[-1])
+            for index in range(closed):
+                if (activity_id := changes[index]["activity_id"]) is not None:
+                    await self._async_send(
+                        f"{activity_id} interval at {times[index]}",
+                        self._async_ensure_entry(
+                            existing, activity_id, times[index], times[index + 1]
+                        ),
+                    )
+            del self._changes[:closed]
+            self._store.async_delay_save(self._data_to_save, JOURNAL_SAVE_DELAY)
+            return
+
+        # The last change is what should be running now
+        change = changes[0]
+        activity_id = change["activity_id"]
+        if running is not None and tracked_activity_id(running) != activity_id:
+            if await self._async_send("stop", coordinator.stop_tracking()):
+                running = None
+        if activity_id is not None and running is None:
+            await self._async_send(
+                f"start of {activity_id}",
+                coordinator.start_tracking(activity_id, started_at=times[0]),
+            )
+        if self._changes and self._changes[0] is change:
+            del self._changes[0]
+
+    async def _async_send(self, description: str, request: Awaitable[Any]) -> bool:
+        """Await a replayed request; return False if the API rejected it.
+
+        Transient errors propagate so the journal is retried.
+        """
+        try:
+            await request
+        except requests.exceptions.RequestException as err:
+            if not is_rejection(err):
+                raise
+            _LOGGER.warning(
+                "EARLY rejected the journaled %s, dropping it: %s", description, err
+            )
+            return False
+        return True
+
+    async def _async_ensure_entry(
+        self,
+        existing: list[dict[str, Any]],
+        activity_id: str,
+        started_at: datetime,
+        stopped_at: datetime,
+    ) -> None:
+        """Create the time entry for an interval, or patch the one already there."""
+        for entry in existing:
+            entry_start, entry_stop = _entry_span(entry)
+            if (
+                entry.get("activityId") != activity_id
+                or entry_start is None
+                or abs(entry_start - started_at) > _MATCH_TOLERANCE
+            ):
+                continue
+            if entry_stop is None or abs(entry_stop - stopped_at) > _MATCH_TOLERANCE:
+                await self._coordinator.async_update_time_entry(
+                    entry["id"], activity_id, started_at, stopped_at
+                )
+            return
+        await self._coordinator.async_create_time_entry(
+            activity_id, started_at, stopped_at
+        )
+
+
+def _parse_time(value: str) -> datetime:
+    """Parse a journaled timestamp."""
+    parsed = dt_util.parse_datetime(value)
+    if parsed is None:
+        raise ValueError(f"Invalid journal timestamp {value}")
+    return parsed
+
+
+def _started_at(tracking: dict[str, Any] | None) -> datetime | None:
+    """Return when a running tracking started."""
+    if not tracking:
+        return None
+    return parse_api_time(tracking.get("startedAt"))
+
+
+def _entry_span(entry: dict[str, Any]) -> tuple[datetime | None, datetime | None]:
+    """Return the start and stop of a time entry."""
+    duration = entry.get("duration") or entry
+    return (
+        parse_api_time(duration.get("startedAt")),
+        parse_api_time(duration.get("stoppedAt")),
+    )
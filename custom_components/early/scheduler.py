@@ -0,0 +1,133 @@
+"""Connection slot scheduling for EARLY (Timeular) ZEI trackers."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONNECT_ATTEMPT_SPACING,
+    CONNECT_CONCURRENCY_PER_SOURCE,
+    DATA_CONNECTION_SCHEDULER,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Queue priorities; lower values are served first
+PRIORITY_NEVER_CONNECTED = 0
+PRIORITY_RECONNECT = 1
+
+
+@dataclass
+class _SourceSlots:
+    """Connection attempt slots for one adapter or proxy."""
+
+    active: int = 0
+    last_start: float = 0.0
+    # Heap of (priority, sequence, future); the sequence keeps equal
+    # priorities in arrival order
+    waiters: list[tuple[int, int, asyncio.Future[None]]] = field(default_factory=list)
+
+
+class EarlyConnectionScheduler:
+    """Limit concurrent connection attempts per Bluetooth adapter or proxy.
+
+    After a restart or proxy reboot every tracker tries to connect at once,
+    which overloads the adapter so that all attempts fail together. Attempts
+    through the same source are instead admitted a few at a time, trackers that
+    have never connected go first, and attempt starts are spaced apart.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = CONNECT_CONCURRENCY_PER_SOURCE,
+        spacing: float = CONNECT_ATTEMPT_SPACING,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._max_concurrent = max_concurrent
+        self._spacing = spacing
+        self._sources: dict[str | None, _SourceSlots] = {}
+        self._sequence = itertools.count()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return per-source slot usage for diagnostics."""
+        return {
+            str(source): {"active": slots.active, "queued": len(slots.waiters)}
+            for source, slots in self._sources.items()
+        }
+
+    @asynccontextmanager
+    async def async_slot(
+        self, source: str | None, *, never_connected: bool = False
+    ) -> AsyncIterator[None]:
+        """Hold a connection attempt slot on source for the duration."""
+        slots = self._sources.setdefault(source, _SourceSlots())
+        await self._async_acquire(
+            slots,
+            PRIORITY_NEVER_CONNECTED if never_connected else PRIORITY_RECONNECT,
+        )
+        try:
+            await self._async_space_start(slots)
+            yield
+        finally:
+            self._release(slots)
+
+    async def _async_acquire(self, slots: _SourceSlots, priority: int) -> None:
+        """Wait until a slot on the source is free."""
+        if slots.active < self._max_concurrent and not slots.waiters:
+            slots.active += 1
+            return
+
+        _LOGGER.debug(
+            "Connection slots busy (%d active), queueing attempt at priority %d",
+            slots.active,
+            priority,
+        )
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(slots.waiters, (priority, next(self._sequence), future))
+        try:
+            # The releasing holder hands its slot over by resolving the future
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Cancelled after being handed a slot; pass it on
+                self._release(slots)
+            else:
+                slots.waiters = [w for w in slots.waiters if w[2] is not future]
+                heapq.heapify(slots.waiters)
+            raise
+
+    async def _async_space_start(self, slots: _SourceSlots) -> None:
+        """Delay the attempt so starts on one source are spaced apart."""
+        now = time.monotonic()
+        start = max(now, slots.last_start + self._spacing)
+        # Reserve the start time before sleeping so later attempts queue behind
+        slots.last_start = start
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def _release(self, slots: _SourceSlots) -> None:
+        """Hand the slot to the next waiter, or free it."""
+        while slots.waiters:
+            _, _, future = heapq.heappop(slots.waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        slots.active -= 1
+
+
+def async_get_connection_scheduler(hass: HomeAssistant) -> EarlyConnectionScheduler:
+    """Return the scheduler shared by every tracker in this instance."""
+    if (scheduler := hass.data.get(DATA_CONNECTION_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_CONNECTION_SCHEDULER] = EarlyConnectionScheduler()
+    return scheduler
@@ -13,19 +13,25 @@ from homeassistant.const import CONF_API_KEY
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import Throttle
-from homeassistant.util.dt import utcnow
+from homeassistant.util.dt import UTC, parse_datetime, utcnow
 
 from .const import (
     API_ACTIVITIES_ENDPOINT,
     API_SIGN_IN_ENDPOINT,
+    API_TIME_ENTRIES_ENDPOINT,
     API_TRACKING_ENDPOINT,
     ATTR_ACTIVITY_ID,
     ATTR_ACTIVITY_NAME,
+    ATTR_DURATION,
     ATTR_NOTE,
+    ATTR_PREVIOUS_ACTIVITY_ID,
+    ATTR_PREVIOUS_ACTIVITY_NAME,
     ATTR_STARTED_AT,
     CONF_API_SECRET,
+    CONF_HUB,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    EVENT_TRACKING_CHANGED,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -62,6 +68,36 @@ async def async_setup_entry(
     # Store the coordinator in hass.data for use by switch platform
     hass.data[DOMAIN][config_entry.entry_id]["coordinator"] = coordinator
 
+    # Keep the account's time entries in sync for history-based features,
+    # with a local database for range queries
+    from .time_entries import EarlyTimeEntriesSync
+    from .time_entry_database import EarlyTimeEntryDatabase
+
+    time_entries = EarlyTimeEntriesSync(hass, coordinator, config_entry.entry_id)
+    hass.data[DOMAIN][config_entry.entry_id]["time_entries"] = time_entries
+    database = EarlyTimeEntryDatabase(hass, config_entry.entry_id)
+    if await database.async_open():
+        hass.data[DOMAIN][config_entry.entry_id]["time_entry_database"] = database
+        if database.created:
+            # A new database starts empty, so fetch the whole history again
+            time_entries.async_request_backfill()
+        # Unload runs these in reverse, closing the database after the sync
+        config_entry.async_on_unload(database.async_close)
+        config_entry.async_on_unload(
+            time_entries.async_add_listener(database.async_apply_delta)
+        )
+        if "recorder" in hass.config.components:
+            # Chart tracked hours per activity in the statistics dashboards
+            from .activity_statistics import EarlyStatisticsImporter
+
+            statistics = EarlyStatisticsImporter(
+                hass, coordinator, time_entries, database, config_entry.entry_id
+            )
+            statistics.async_start()
+            config_entry.async_on_unload(statistics.async_stop)
+    time_entries.async_start()
+    config_entry.async_on_unload(time_entries.async_stop)
+
     # Fetch initial data
     await coordinator.async_update()
 
@@ -73,20 +109,45 @@ async def async_setup_entry(
         True,
     )
 
+    if config_entry.data.get(CONF_HUB):
+        # The account's trackers share this coordinator and entity platform
+        from .bluetooth_sensor import async_setup_hub_entry
+
+        await async_setup_hub_entry(hass, config_entry, coordinator, async_add_entities)
+
 
 class EarlyAPICoordinator:
     """Class to manage fetching EARLY data from the API."""
 
-    def __init__(self, hass: HomeAssistant, api_key: str, api_secret: str) -> None:
-        """Initialize the coordinator."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api_key: str,
+        api_secret: str,
+        *,
+        fire_events: bool = True,
+    ) -> None:
+        """Initialize the coordinator.
+
+        Only the API entry's coordinator fires transition events; others for
+        the same account (e.g. a tracker entry's) pass fire_events=False so
+        one transition is not reported twice.
+        """
         self.hass = hass
+        self._fire_events = fire_events
         self._api_key = api_key
         self._api_secret = api_secret
         self._token: str | None = None
         self._tracking_data: dict[str, Any] | None = None
         self._activities: dict[str, str] = {}
         self._device_side_mapping: dict[int, str] = {}
+        self._device_side_activity_ids: dict[int, str] = {}
         self._activities_last_fetch: datetime | None = None
+        # Last known currentTracking snapshot, used to detect transitions.
+        # Kept separately from _tracking_data so a failed poll (which resets
+        # _tracking_data to None) does not look like a transition.
+        self._last_current_tracking: dict[str, Any] | None = None
+        self._has_tracking_snapshot = False
 
     async def _get_token(self) -> str:
         """Get authentication token from EARLY API."""
@@ -139,8 +200,9 @@ class EarlyAPICoordinator:
                     for activity in data["activities"]
                 }
 
-                # Build device side mapping (orientation -> activity name)
+                # Build device side mappings (orientation -> activity name/ID)
                 self._device_side_mapping = {}
+                self._device_side_activity_ids = {}
                 for activity in data["activities"]:
                     device_side = activity.get("deviceSide")
                     if device_side is not None:
@@ -148,6 +210,9 @@ class EarlyAPICoordinator:
                         self._device_side_mapping[int(device_side)] = activity.get(
                             "name", "Unknown Activity"
                         )
+                        self._device_side_activity_ids[int(device_side)] = activity[
+                            "id"
+                        ]
 
                 self._activities_last_fetch = utcnow()
                 _LOGGER.debug(
@@ -205,11 +270,77 @@ class EarlyAPICoordinator:
             response.raise_for_status()
             self._tracking_data = response.json()
             _LOGGER.debug("Updated EARLY tracking data: %s", self._tracking_data)
+            self._async_check_transition(self._tracking_data)
 
         except requests.exceptions.RequestException as err:
             _LOGGER.error("Error fetching EARLY tracking data: %s", err)
             self._tracking_data = None
 
+    def _async_check_transition(self, tracking_data: dict[str, Any] | None) -> None:
+        """Fire EVENT_TRACKING_CHANGED if the tracked session differs from the last poll.
+
+        The first successful poll only records a baseline, so restarting Home
+        Assistant does not produce a spurious transition.
+        """
+        current = (tracking_data or {}).get("currentTracking") or None
+        previous = self._last_current_tracking
+        had_snapshot = self._has_tracking_snapshot
+        self._last_current_tracking = current
+        self._has_tracking_snapshot = True
+
+        if (
+            not self._fire_events
+            or not had_snapshot
+            or _session_key(previous) == _session_key(current)
+        ):
+            return
+
+        event_data: dict[str, Any] = {
+            ATTR_PREVIOUS_ACTIVITY_ID: None,
+            ATTR_PREVIOUS_ACTIVITY_NAME: None,
+            ATTR_ACTIVITY_ID: None,
+            ATTR_ACTIVITY_NAME: None,
+            ATTR_STARTED_AT: None,
+            ATTR_DURATION: None,
+            ATTR_NOTE: None,
+        }
+
+        if previous:
+            previous_activity = previous.get("activity") or {}
+            event_data[ATTR_PREVIOUS_ACTIVITY_ID] = previous_activity.get("id")
+            event_data[ATTR_PREVIOUS_ACTIVITY_NAME] = self._resolve_activity_name(
+                previous_activity
+            )
+            event_data[ATTR_NOTE] = (previous.get("note") or {}).get("text")
+            started_at = parse_api_time(previous.get("startedAt"))
+            # A switch ends the previous session when the new one started,
+            # not when the poll noticed it
+            ended_at = (
+                parse_api_time(current.get("startedAt")) if current else None
+            ) or utcnow()
+            if started_at is not None:
+                event_data[ATTR_DURATION] = round(
+                    (ended_at - started_at).total_seconds()
+                )
+
+        if current:
+            activity = current.get("activity") or {}
+            event_data[ATTR_ACTIVITY_ID] = activity.get("id")
+            event_data[ATTR_ACTIVITY_NAME] = self._resolve_activity_name(activity)
+            event_data[ATTR_STARTED_AT] = current.get("startedAt")
+
+        _LOGGER.debug("EARLY tracking changed: %s", event_data)
+        self.hass.bus.async_fire(EVENT_TRACKING_CHANGED, event_data)
+
+    def _resolve_activity_name(self, activity: dict[str, Any]) -> str | None:
+        """Return the activity name from the payload, falling back to the cache."""
+        if name := activity.get("name"):
+            return name
+        activity_id = activity.get("id")
+        if activity_id is None:
+            return None
+        return self._activities.get(activity_id)
+
     @property
     def tracking_data(self) -> dict[str, Any] | None:
         """Return the current tracking data."""
@@ -227,8 +358,15 @@ class EarlyAPICoordinator:
         """Get activity name from device side (orientation)."""
         return self._device_side_mapping.get(device_side)
 
-    async def start_tracking(self, activity_id: str) -> None:
-        """Start tracking a specific activity."""
+    def get_activity_id_by_device_side(self, device_side: int) -> str | None:
+        """Get activity ID from device side (orientation)."""
+        return self._device_side_activity_ids.get(device_side)
+
+    async def start_tracking(
+        self, activity_id: str, started_at: datetime | None = None
+    ) -> None:
+        """Start tracking a specific activity, now or from started_at."""
+        payload = {"startedAt": format_api_time(started_at)} if started_at else {}
         try:
             token = await self._get_token()
             headers = {"Authorization": f"Bearer {token}"}
@@ -240,7 +378,7 @@ class EarlyAPICoordinator:
                 lambda: requests.post(
                     endpoint,
                     headers=headers,
-                    json={},
+                    json=payload,
                     timeout=10,
                 )
             )
@@ -254,7 +392,7 @@ class EarlyAPICoordinator:
                     lambda: requests.post(
                         endpoint,
                         headers=headers,
-                        json={},
+                        json=payload,
                         timeout=10,
                     )
                 )
@@ -271,8 +409,9 @@ class EarlyAPICoordinator:
             )
             raise
 
-    async def stop_tracking(self) -> None:
-        """Stop the current tracking."""
+    async def stop_tracking(self, stopped_at: datetime | None = None) -> None:
+        """Stop the current tracking, now or as of stopped_at."""
+        payload = {"stoppedAt": format_api_time(stopped_at)} if stopped_at else {}
         try:
             token = await self._get_token()
             headers = {"Authorization": f"Bearer {token}"}
@@ -284,7 +423,7 @@ class EarlyAPICoordinator:
                 lambda: requests.post(
                     endpoint,
                     headers=headers,
-                    json={},
+                    json=payload,
                     timeout=10,
                 )
             )
@@ -298,7 +437,7 @@ class EarlyAPICoordinator:
                     lambda: requests.post(
                         endpoint,
                         headers=headers,
-                        json={},
+                        json=payload,
                         timeout=10,
                     )
                 )
@@ -313,6 +452,121 @@ class EarlyAPICoordinator:
             _LOGGER.error("Error stopping tracking: %s", err)
             raise
 
+    async def _async_request(
+        self, method: str, endpoint: str, payload: dict[str, Any] | None = None
+    ) -> requests.Response:
+        """Send an authenticated request, renewing an expired token once.
+
+        Errors are raised as requests exceptions for the caller to handle.
+        """
+
+        def _send(token: str) -> requests.Response:
+            return requests.request(
+                method,
+                endpoint,
+                headers={"Authorization": f"Bearer {token}"},
+                json=payload,
+                timeout=10,
+            )
+
+        response = await self.hass.async_add_executor_job(
+            _send, await self._get_token()
+        )
+        if response.status_code == 401:
+            # Token expired, reset and try again
+            self._token = None
+            response = await self.hass.async_add_executor_job(
+                _send, await self._get_token()
+            )
+        response.raise_for_status()
+        return response
+
+    async def async_get_current_tracking(self) -> dict[str, Any] | None:
+        """Fetch the running tracking, bypassing the update throttle."""
+        response = await self._async_request("GET", API_TRACKING_ENDPOINT)
+        return (response.json() or {}).get("currentTracking") or None
+
+    async def async_get_time_entries(
+        self, stopped_after: datetime, started_before: datetime
+    ) -> list[dict[str, Any]]:
+        """Fetch the time entries overlapping a window."""
+        response = await self._async_request(
+            "GET",
+            f"{API_TIME_ENTRIES_ENDPOINT}/{format_api_time(stopped_after)}"
+            f"/{format_api_time(started_before)}",
+        )
+        return (response.json() or {}).get("timeEntries", [])
+
+    async def async_create_time_entry(
+        self, activity_id: str, started_at: datetime, stopped_at: datetime
+    ) -> dict[str, Any]:
+        """Create a completed time entry."""
+        response = await self._async_request(
+            "POST",
+            API_TIME_ENTRIES_ENDPOINT,
+            {
+                "activityId": activity_id,
+                "startedAt": format_api_time(started_at),
+                "stoppedAt": format_api_time(stopped_at),
+            },
+        )
+        return response.json()
+
+    async def async_update_time_entry(
+        self,
+        entry_id: str,
+        activity_id: str,
+        started_at: datetime,
+        stopped_at: datetime,
+    ) -> dict[str, Any]:
+        """Replace the activity and span of an existing time entry."""
+        response = await self._async_request(
+            "PATCH",
+            f"{API_TIME_ENTRIES_ENDPOINT}/{entry_id}",
+            {
+                "activityId": activity_id,
+                "startedAt": format_api_time(started_at),
+                "stoppedAt": format_api_time(stopped_at),
+            },
+        )
+        return response.json()
+
+
+def _session_key(tracking: dict[str, Any] | None) -> tuple[Any, Any] | None:
+    """Return the (activity id, startedAt) pair identifying a tracking session."""
+    if not tracking:
+        return None
+    return ((tracking.get("activity") or {}).get("id"), tracking.get("startedAt"))
+
+
+def parse_api_time(value: str | None) -> datetime | None:
+    """Parse an API timestamp; the API omits the offset but reports UTC."""
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+def format_api_time(value: datetime) -> str:
+    """Format a timestamp the way the API expects: UTC, milliseconds, no offset."""
+    return value.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3]
+
+
+def is_rejection(err: requests.exceptions.RequestException) -> bool:
+    """Return True if the API refused a request, so retrying it cannot help.
+
+    Connection errors, timeouts, rate limiting and server errors are
+    transient; any other 4xx response rejects the request itself.
+    """
+    if not isinstance(err, requests.exceptions.HTTPError) or err.response is None:
+        return False
+    status = err.response.status_code
+    return 400 <= status < 500 and status not in (408, 429)
+
 
 class EarlyCurrentTrackingSensor(SensorEntity):
     """Representation of an EARLY current tracking sensor."""
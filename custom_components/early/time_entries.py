@@ -0,0 +1,328 @@
+"""Incremental sync of EARLY (Timeular) time entries."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import requests
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    TIME_ENTRIES_BACKFILL_DAYS,
+    TIME_ENTRIES_PAGE_DAYS,
+    TIME_ENTRIES_RECHECK_HOURS,
+    TIME_ENTRIES_SAVE_DELAY,
+    TIME_ENTRIES_STORAGE_KEY,
+    TIME_ENTRIES_STORAGE_VERSION,
+    TIME_ENTRIES_SYNC_INTERVAL,
+)
+from .sensor import parse_api_time
+
+if TYPE_CHECKING:
+    from .sensor import EarlyAPICoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TimeEntry:
+    """A completed time entry."""
+
+    id: str
+    activity_id: str
+    started_at: datetime
+    stopped_at: datetime
+    note: str | None = None
+
+    @property
+    def duration(self) -> float:
+        """Return the tracked time in seconds."""
+        return (self.stopped_at - self.started_at).total_seconds()
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> TimeEntry | None:
+        """Return the entry an API time entry describes, if it is complete."""
+        duration = data.get("duration") or data
+        started_at = parse_api_time(duration.get("startedAt"))
+        stopped_at = parse_api_time(duration.get("stoppedAt"))
+        if (
+            not data.get("id")
+            or not data.get("activityId")
+            or started_at is None
+            or stopped_at is None
+        ):
+            return None
+        return cls(
+            str(data["id"]),
+            str(data["activityId"]),
+            started_at,
+            stopped_at,
+            (data.get("note") or {}).get("text"),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TimeEntry:
+        """Return an entry as stored by as_dict()."""
+        return cls(
+            data["id"],
+            data["activity_id"],
+            dt_util.parse_datetime(data["started_at"]),
+            dt_util.parse_datetime(data["stopped_at"]),
+            data.get("note"),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the entry in a JSON-serialisable form."""
+        return {
+            "id": self.id,
+            "activity_id": self.activity_id,
+            "started_at": self.started_at.isoformat(),
+            "stopped_at": self.stopped_at.isoformat(),
+            "note": self.note,
+        }
+
+
+@dataclass
+class TimeEntriesDelta:
+    """Time entries added, changed or deleted since the last sync."""
+
+    upserted: list[TimeEntry] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    # Edited and deleted entries as they were before the change
+    previous: list[TimeEntry] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Return True if anything changed."""
+        return bool(self.upserted or self.removed)
+
+
+class EarlyTimeEntriesSync:
+    """Keep a local view of an account's time entries in step with the API.
+
+    The first sync backfills TIME_ENTRIES_BACKFILL_DAYS of history, one
+    TIME_ENTRIES_PAGE_DAYS window per request, moving a high-water mark
+    forward after each window; the mark is persisted in Home Assistant
+    storage, so a backfill cut short by a restart resumes where it stopped.
+    Later syncs only fetch from the mark to now, starting
+    TIME_ENTRIES_RECHECK_HOURS before it: entries in that re-check window are
+    kept and compared against what the API returns, which finds entries
+    edited or deleted since they were synced. Changes further back are not
+    seen.
+
+    Listeners are handed only what changed in each window, as a
+    TimeEntriesDelta.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: EarlyAPICoordinator,
+        entry_id: str,
+    ) -> None:
+        """Initialize the sync for one EARLY account entry."""
+        self.hass = hass
+        self._coordinator = coordinator
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            TIME_ENTRIES_STORAGE_VERSION,
+            TIME_ENTRIES_STORAGE_KEY.format(entry_id),
+        )
+        self._loaded = False
+        # Everything that ended before this has been synced
+        self._cursor: datetime | None = None
+        # Synced entries still inside the re-check window, by ID
+        self._recent: dict[str, TimeEntry] = {}
+        self._listeners: dict[Callable[[TimeEntriesDelta], None], None] = {}
+        self._running = False
+        self._backfill_requested = False
+        self._task: asyncio.Task | None = None
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        self._last_sync: datetime | None = None
+        self._last_fetched = 0
+        self._last_changes = 0
+
+    @property
+    def cursor(self) -> datetime | None:
+        """Return the high-water mark, or None before the first sync."""
+        return self._cursor
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return sync state for diagnostics."""
+        return {
+            "cursor": self._cursor.isoformat() if self._cursor else None,
+            "last_sync": self._last_sync.isoformat() if self._last_sync else None,
+            "last_fetched": self._last_fetched,
+            "last_changes": self._last_changes,
+            "recent_entries": len(self._recent),
+            "listeners": len(self._listeners),
+        }
+
+    @callback
+    def async_add_listener(
+        self, listener: Callable[[TimeEntriesDelta], None]
+    ) -> CALLBACK_TYPE:
+        """Subscribe listener to changes and return a handle that unsubscribes."""
+        self._listeners[listener] = None
+
+        @callback
+        def _async_remove() -> None:
+            self._listeners.pop(listener, None)
+
+        return _async_remove
+
+    @callback
+    def async_request_backfill(self) -> None:
+        """Backfill the whole history again, for a consumer starting empty."""
+        self._backfill_requested = True
+
+    @callback
+    def async_start(self) -> None:
+        """Sync now and then every TIME_ENTRIES_SYNC_INTERVAL seconds."""
+        self._running = True
+        self._async_start_sync()
+
+    async def async_stop(self) -> None:
+        """Stop syncing and persist the high-water mark."""
+        self._running = False
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._loaded:
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _async_start_sync(self) -> None:
+        """Start a sync in the background unless one is running."""
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_sync(), "early time entries sync"
+            )
+
+    @callback
+    def _async_sync_timer(self, _now: Any) -> None:
+        """Sync once the interval has passed."""
+        self._cancel_timer = None
+        self._async_start_sync()
+
+    async def _async_load(self) -> None:
+        """Load the high-water mark and re-check window from storage once."""
+        if self._loaded:
+            return
+        if (data := await self._store.async_load()) is not None:
+            if data.get("cursor"):
+                self._cursor = dt_util.parse_datetime(data["cursor"])
+            for stored in data.get("recent", []):
+                entry = TimeEntry.from_dict(stored)
+                self._recent[entry.id] = entry
+        self._loaded = True
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the sync state as stored."""
+        return {
+            "cursor": self._cursor.isoformat() if self._cursor else None,
+            "recent": [entry.as_dict() for entry in self._recent.values()],
+        }
+
+    async def _async_sync(self) -> None:
+        """Fetch every window from the re-check start to now."""
+        now = dt_util.utcnow()
+        try:
+            await self._async_load()
+            if self._backfill_requested:
+                self._backfill_requested = False
+                self._cursor = None
+                self._recent.clear()
+            if self._cursor is None:
+                # First sync; backfill the history
+                self._cursor = now - timedelta(days=TIME_ENTRIES_BACKFILL_DAYS)
+                start = self._cursor
+            else:
+                start = self._cursor - timedelta(hours=TIME_ENTRIES_RECHECK_HOURS)
+            fetched = changes = 0
+            while start < now:
+                end = min(start + timedelta(days=TIME_ENTRIES_PAGE_DAYS), now)
+                entries = await self._coordinator.async_get_time_entries(start, end)
+                fetched += len(entries)
+                delta = self._async_apply_window(start, end, entries)
+                self._cursor = max(self._cursor, end)
+                self._async_prune(
+                    self._cursor - timedelta(hours=TIME_ENTRIES_RECHECK_HOURS)
+                )
+                self._store.async_delay_save(
+                    self._data_to_save, TIME_ENTRIES_SAVE_DELAY
+                )
+                if delta:
+                    changes += len(delta.upserted) + len(delta.removed)
+                    self._async_fire(delta)
+                start = end
+        except requests.exceptions.RequestException as err:
+            _LOGGER.warning("Error syncing EARLY time entries: %s", err)
+        else:
+            self._last_sync = now
+            self._last_fetched = fetched
+            self._last_changes = changes
+            _LOGGER.debug(
+                "Synced EARLY time entries: %d fetched, %d changed", fetched, changes
+            )
+        finally:
+            self._task = None
+            if self._running:
+                self._cancel_timer = async_call_later(
+                    self.hass, TIME_ENTRIES_SYNC_INTERVAL, self._async_sync_timer
+                )
+
+    @callback
+    def _async_apply_window(
+        self, start: datetime, end: datetime, entries: list[dict[str, Any]]
+    ) -> TimeEntriesDelta:
+        """Compare the entries the API returned for a window with known ones."""
+        delta = TimeEntriesDelta()
+        seen: set[str] = set()
+        for data in entries:
+            if (entry := TimeEntry.from_api(data)) is None:
+                continue
+            seen.add(entry.id)
+            if (known := self._recent.get(entry.id)) != entry:
+                if known is not None:
+                    delta.previous.append(known)
+                self._recent[entry.id] = entry
+                delta.upserted.append(entry)
+        # A known entry overlapping the window that was not returned is gone
+        for entry_id, entry in list(self._recent.items()):
+            if (
+                entry_id not in seen
+                and entry.stopped_at > start
+                and entry.started_at < end
+            ):
+                del self._recent[entry_id]
+                delta.removed.append(entry_id)
+                delta.previous.append(entry)
+        return delta
+
+    @callback
+    def _async_prune(self, horizon: datetime) -> None:
+        """Forget entries that ended before the re-check window."""
+        for entry_id, entry in list(self._recent.items()):
+            if entry.stopped_at < horizon:
+                del self._recent[entry_id]
+
+    @callback
+    def _async_fire(self, delta: TimeEntriesDelta) -> None:
+        """Hand delta to every listener."""
+        for listener in list(self._listeners):
+            try:
+                listener(delta)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error in EARLY time entries listener %s", listener)
@@ -0,0 +1,315 @@
+"""Indexed local database of synced EARLY (Timeular) time entries."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sqlite3
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.dt import UTC
+
+from .const import TIME_ENTRIES_DATABASE
+from .time_entries import TimeEntriesDelta, TimeEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+_SCHEMA_VERSION = 1
+# Times are stored as Unix timestamps; duration is computed on write
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS time_entries (
+    id TEXT PRIMARY KEY,
+    activity_id TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    stopped_at REAL NOT NULL,
+    duration REAL GENERATED ALWAYS AS (stopped_at - started_at) STORED,
+    note TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_time_entries_activity_start
+    ON time_entries (activity_id, started_at);
+CREATE INDEX IF NOT EXISTS ix_time_entries_start_stop
+    ON time_entries (started_at, stopped_at);
+"""
+_UPSERT = """
+INSERT INTO time_entries (id, activity_id, started_at, stopped_at, note)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    activity_id = excluded.activity_id,
+    started_at = excluded.started_at,
+    stopped_at = excluded.stopped_at,
+    note = excluded.note
+"""
+_COLUMNS = "id, activity_id, started_at, stopped_at, note"
+
+
+class EarlyTimeEntryDatabase:
+    """Synced time entries in an indexed SQLite database.
+
+    The database lives in the config directory and is indexed on (activity,
+    start) and (start, stop), so a range query only walks the entries near
+    its window. An entry overlapping a window started at most the longest
+    stored duration before it, which bounds the start of that walk.
+
+    Sync deltas are buffered on the event loop and written by one background
+    task, so everything that arrived while a write was running goes into the
+    next single transaction. The connection is only ever used from one
+    dedicated thread; reads queue behind the writes submitted before them.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the database for one EARLY account entry."""
+        self.hass = hass
+        self._path = hass.config.path(TIME_ENTRIES_DATABASE.format(entry_id))
+        self._executor: ThreadPoolExecutor | None = None
+        self._connection: sqlite3.Connection | None = None
+        self._created = False
+        # Longest stored entry (in seconds); only grows, so it stays an
+        # upper bound when entries are removed
+        self._max_duration = 0.0
+        self._pending_upserts: dict[str, TimeEntry] = {}
+        self._pending_removals: set[str] = set()
+        self._write_task: asyncio.Task | None = None
+        self._transactions = 0
+
+    @property
+    def path(self) -> str:
+        """Return the path of the database file."""
+        return self._path
+
+    @property
+    def created(self) -> bool:
+        """Return True if opening the database created it."""
+        return self._created
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return database state for diagnostics."""
+        return {
+            "path": self._path,
+            "open": self._executor is not None,
+            "transactions": self._transactions,
+            "pending_writes": len(self._pending_upserts) + len(self._pending_removals),
+            "max_duration": self._max_duration,
+        }
+
+    async def async_open(self) -> bool:
+        """Open the database, creating it if needed; return True on success."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="early_time_entries"
+        )
+        try:
+            await self._async_run(self._open)
+        except (sqlite3.Error, OSError) as err:
+            _LOGGER.error("Error opening EARLY time entry database: %s", err)
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            return False
+        return True
+
+    async def async_flush(self) -> None:
+        """Wait until the changes buffered so far are written."""
+        if self._write_task is not None:
+            await self._write_task
+
+    async def async_close(self) -> None:
+        """Write what is buffered and close the database."""
+        await self.async_flush()
+        if self._executor is None:
+            return
+        await self._async_run(self._close)
+        self._executor.shutdown(wait=False)
+        self._executor = None
+
+    @callback
+    def async_apply_delta(self, delta: TimeEntriesDelta) -> None:
+        """Buffer the changes from a sync for the next write."""
+        for entry in delta.upserted:
+            self._pending_removals.discard(entry.id)
+            self._pending_upserts[entry.id] = entry
+        for entry_id in delta.removed:
+            self._pending_upserts.pop(entry_id, None)
+            self._pending_removals.add(entry_id)
+        if self._write_task is None and self._executor is not None:
+            self._write_task = self.hass.async_create_background_task(
+                self._async_write(), "early time entry database"
+            )
+
+    async def async_entries(
+        self, start: datetime, end: datetime, activity_id: str | None = None
+    ) -> list[TimeEntry]:
+        """Return the entries overlapping start to end, oldest first."""
+        return await self._async_run(
+            self._entries, start.timestamp(), end.timestamp(), activity_id
+        )
+
+    async def async_durations(
+        self, start: datetime, end: datetime, activity_id: str | None = None
+    ) -> dict[str, float]:
+        """Return the seconds tracked per activity between start and end."""
+        return await self._async_run(
+            self._durations, start.timestamp(), end.timestamp(), activity_id
+        )
+
+    async def async_hourly_durations(
+        self, start: datetime, end: datetime
+    ) -> dict[str, dict[float, float]]:
+        """Return the seconds tracked per activity in each UTC hour of a window.
+
+        Hours are keyed by the Unix timestamp they start at; hours without
+        tracked time are left out.
+        """
+        return await self._async_run(
+            self._hourly_durations, start.timestamp(), end.timestamp()
+        )
+
+    async def _async_run(self, target: Callable[..., _T], *args: Any) -> _T:
+        """Run target on the database thread."""
+        if self._executor is None:
+            raise sqlite3.ProgrammingError("Time entry database is not open")
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, target, *args
+        )
+
+    async def _async_write(self) -> None:
+        """Write buffered changes until none are left, one transaction each."""
+        try:
+            while self._pending_upserts or self._pending_removals:
+                upserts = list(self._pending_upserts.values())
+                removals = list(self._pending_removals)
+                self._pending_upserts.clear()
+                self._pending_removals.clear()
+                try:
+                    await self._async_run(self._write, upserts, removals)
+                except sqlite3.Error as err:
+                    _LOGGER.error("Error writing EARLY time entries: %s", err)
+        finally:
+            self._write_task = None
+
+    def _open(self) -> None:
+        """Connect and create the schema (runs on the database thread)."""
+        self._created = not os.path.exists(self._path)
+        connection = sqlite3.connect(self._path)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            if connection.execute("PRAGMA user_version").fetchone()[0] == 0:
+                connection.executescript(_SCHEMA)
+                connection.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            self._max_duration = connection.execute(
+                "SELECT COALESCE(MAX(duration), 0) FROM time_entries"
+            ).fetchone()[0]
+        except sqlite3.Error:
+            connection.close()
+            raise
+        self._connection = connection
+
+    def _close(self) -> None:
+        """Close the connection (runs on the database thread)."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _write(self, upserts: list[TimeEntry], removals: list[str]) -> None:
+        """Apply changes in one transaction (runs on the database thread)."""
+        connection = self._db()
+        with connection:
+            connection.executemany(
+                "DELETE FROM time_entries WHERE id = ?",
+                [(entry_id,) for entry_id in removals],
+            )
+            connection.executemany(
+                _UPSERT,
+                [
+                    (
+                        entry.id,
+                        entry.activity_id,
+                        entry.started_at.timestamp(),
+                        entry.stopped_at.timestamp(),
+                        entry.note,
+                    )
+                    for entry in upserts
+                ],
+            )
+        self._transactions += 1
+        self._max_duration = max(
+            self._max_duration, *(entry.duration for entry in upserts), 0.0
+        )
+
+    def _entries(
+        self, start: float, end: float, activity_id: str | None
+    ) -> list[TimeEntry]:
+        """Query the entries overlapping a window (runs on the database thread)."""
+        where, params = self._overlapping(start, end, activity_id)
+        rows = self._db().execute(
+            f"SELECT {_COLUMNS} FROM time_entries WHERE {where} ORDER BY started_at",
+            params,
+        )
+        return [_entry_from_row(row) for row in rows]
+
+    def _durations(
+        self, start: float, end: float, activity_id: str | None
+    ) -> dict[str, float]:
+        """Sum tracked time within a window (runs on the database thread)."""
+        where, params = self._overlapping(start, end, activity_id)
+        rows = self._db().execute(
+            "SELECT activity_id, SUM(MIN(stopped_at, ?) - MAX(started_at, ?))"
+            f" FROM time_entries WHERE {where} GROUP BY activity_id",
+            (end, start, *params),
+        )
+        return dict(rows)
+
+    def _hourly_durations(
+        self, start: float, end: float
+    ) -> dict[str, dict[float, float]]:
+        """Split tracked time into hours (runs on the database thread)."""
+        where, params = self._overlapping(start, end, None)
+        hourly: dict[str, dict[float, float]] = {}
+        for activity_id, started_at, stopped_at in self._db().execute(
+            f"SELECT activity_id, started_at, stopped_at FROM time_entries"
+            f" WHERE {where}",
+            params,
+        ):
+            hours = hourly.setdefault(activity_id, {})
+            moment = max(started_at, start)
+            until = min(stopped_at, end)
+            while moment < until:
+                hour = moment - moment % 3600
+                step = min(hour + 3600, until)
+                hours[hour] = hours.get(hour, 0.0) + step - moment
+                moment = step
+        return hourly
+
+    def _overlapping(
+        self, start: float, end: float, activity_id: str | None
+    ) -> tuple[str, Iterable[Any]]:
+        """Return the indexed condition for entries overlapping a window."""
+        where = "started_at >= ? AND started_at < ? AND stopped_at > ?"
+        params: tuple[Any, ...] = (start - self._max_duration, end, start)
+        if activity_id is not None:
+            return f"activity_id = ? AND {where}", (activity_id, *params)
+        return where, params
+
+    def _db(self) -> sqlite3.Connection:
+        """Return the open connection."""
+        if self._connection is None:
+            raise sqlite3.ProgrammingError("Time entry database is not open")
+        return self._connection
+
+
+def _entry_from_row(row: tuple[Any, ...]) -> TimeEntry:
+    """Return the entry a database row holds."""
+    entry_id, activity_id, started_at, stopped_at, note = row
+    return TimeEntry(
+        entry_id,
+        activity_id,
+        datetime.fromtimestamp(started_at, UTC),
+        datetime.fromtimestamp(stopped_at, UTC),
+        note,
+    )
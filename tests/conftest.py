@@ -7,7 +7,11 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY
 from homeassistant.core import HomeAssistant
 
-from custom_components.early.const import CONF_API_SECRET, DOMAIN
+from custom_components.early.const import (
+    BLE_ORIENTATION_CHARACTERISTIC_UUID,
+    CONF_API_SECRET,
+    DOMAIN,
+)
 
 
 @pytest.fixture(scope="function")
@@ -18,6 +22,7 @@ def mock_hass():
     """
     hass = MagicMock(spec=HomeAssistant)
     hass.data = {}
+    hass.bus = MagicMock()
     hass.config_entries = MagicMock()
     hass.async_create_task = AsyncMock()
     hass.async_add_executor_job = AsyncMock()
@@ -186,13 +191,25 @@ def mock_ble_device():
 
 @pytest.fixture
 def mock_bleak_client():
-    """Return a mock Bleak client."""
-    with patch("custom_components.early.bluetooth.BleakClient") as mock_client:
+    """Return a mock connection establisher yielding a mock Bleak client."""
+    with patch(
+        "custom_components.early.bluetooth.establish_connection"
+    ) as mock_establish, patch(
+        "custom_components.early.bluetooth.bluetooth.async_ble_device_from_address",
+        return_value=None,
+    ):
         client = AsyncMock()
         client.connect = AsyncMock(return_value=True)
         client.disconnect = AsyncMock()
         client.is_connected = True
         client.read_gatt_char = AsyncMock(return_value=bytearray([3]))
         client.start_notify = AsyncMock()
-        mock_client.return_value = client
-        yield mock_client
+        client.clear_cache = AsyncMock(return_value=True)
+        orientation_char = MagicMock()
+        orientation_char.uuid = BLE_ORIENTATION_CHARACTERISTIC_UUID
+        client.services = MagicMock()
+        client.services.get_characteristic.side_effect = lambda uuid: (
+            orientation_char if uuid == BLE_ORIENTATION_CHARACTERISTIC_UUID else None
+        )
+        mock_establish.return_value = client
+        yield mock_establish
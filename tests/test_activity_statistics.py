@@ -0,0 +1,293 @@
+"""Test the EARLY activity statistics import."""
+
+import asyncio
+import sqlite3
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.components.recorder.models import StatisticMeanType
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.dt import UTC
+
+from custom_components.early.activity_statistics import (
+    EarlyStatisticsImporter,
+    statistic_id,
+)
+from custom_components.early.time_entries import TimeEntriesDelta, TimeEntry
+
+NOW = datetime(2026, 3, 2, 12, 20, tzinfo=UTC)
+HOUR = datetime(2026, 3, 2, 12, 0, tzinfo=UTC)
+
+
+def _hour(hours_ago):
+    """Return the start of an hour before the current one."""
+    return HOUR - timedelta(hours=hours_ago)
+
+
+@pytest.fixture
+def mock_database():
+    """Return a database with no tracked time."""
+    database = MagicMock()
+    database.async_flush = AsyncMock()
+    database.async_durations = AsyncMock(return_value={})
+    database.async_hourly_durations = AsyncMock(return_value={})
+    return database
+
+
+@pytest.fixture
+def mock_store():
+    """Patch the importer's storage."""
+    with patch("custom_components.early.activity_statistics.Store") as store_class:
+        store = store_class.return_value
+        store.async_load = AsyncMock(return_value=None)
+        store.async_save = AsyncMock()
+        yield store
+
+
+@pytest.fixture
+def mock_add_statistics():
+    """Patch the recorder's external statistics import."""
+    with patch(
+        "custom_components.early.activity_statistics.async_add_external_statistics"
+    ) as add_statistics:
+        yield add_statistics
+
+
+@pytest.fixture
+def mock_recorder():
+    """Patch the recorder instance."""
+    with patch(
+        "custom_components.early.activity_statistics.get_instance"
+    ) as get_instance:
+        get_instance.return_value.async_block_till_done = AsyncMock()
+        yield get_instance.return_value
+
+
+@pytest.fixture
+def mock_call_later():
+    """Patch the import delay."""
+    with patch(
+        "custom_components.early.activity_statistics.async_call_later"
+    ) as call_later:
+        yield call_later
+
+
+@pytest.fixture
+def mock_track_hour():
+    """Patch the hourly import."""
+    with patch(
+        "custom_components.early.activity_statistics.async_track_utc_time_change"
+    ) as track:
+        yield track
+
+
+@pytest.fixture
+def importer(
+    mock_hass,
+    mock_database,
+    mock_store,
+    mock_add_statistics,
+    mock_recorder,
+    mock_call_later,
+    mock_track_hour,
+):
+    """Return an importer running as a real task at a fixed time."""
+    mock_hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: asyncio.create_task(coro)
+    )
+    coordinator = MagicMock()
+    coordinator.get_all_activities.return_value = {"a": "Working"}
+    sync = MagicMock()
+    with patch(
+        "custom_components.early.activity_statistics.dt_util.utcnow",
+        return_value=NOW,
+    ):
+        yield EarlyStatisticsImporter(
+            mock_hass, coordinator, sync, mock_database, "test_entry_id"
+        )
+
+
+def _imported(mock_add_statistics):
+    """Return the imported rows as (statistic ID, [(start, state, sum)])."""
+    return [
+        (
+            call[0][1]["statistic_id"],
+            [(row["start"], row["state"], row["sum"]) for row in call[0][2]],
+        )
+        for call in mock_add_statistics.call_args_list
+    ]
+
+
+async def _run(importer):
+    """Run one import to completion."""
+    importer._async_start_import()
+    await importer._task
+
+
+class TestEarlyStatisticsImporter:
+    """Test the EarlyStatisticsImporter class."""
+
+    def test_statistic_id(self):
+        """Test statistic IDs are valid for any activity ID."""
+        assert statistic_id("12345") == "early:activity_12345"
+        assert statistic_id("Deep Work") == "early:activity_deep_work"
+
+    @pytest.mark.asyncio
+    async def test_backfill_in_chunks(
+        self, importer, mock_database, mock_add_statistics, mock_recorder
+    ):
+        """Test the first import backfills in bounded chunks."""
+        mock_database.async_durations.side_effect = [{}, {"a": 1800.0}]
+        mock_database.async_hourly_durations.side_effect = [
+            {"a": {_hour(200).timestamp(): 1800.0}},
+            {"a": {_hour(3).timestamp(): 3600.0}},
+        ]
+
+        with patch(
+            "custom_components.early.activity_statistics.TIME_ENTRIES_BACKFILL_DAYS",
+            14,
+        ):
+            await _run(importer)
+
+        windows = [
+            call[0] for call in mock_database.async_hourly_durations.call_args_list
+        ]
+        assert windows == [(_hour(336), _hour(168)), (_hour(168), HOUR)]
+        assert mock_recorder.async_block_till_done.call_count == 2
+        first, second = _imported(mock_add_statistics)
+        # Rows start at the first tracked hour
+        assert first[0] == "early:activity_a"
+        assert first[1][0] == (_hour(200), 0.5, 0.5)
+        assert len(first[1]) == 200 - 168
+        assert second[1][-4:] == [
+            (_hour(4), 0.0, 0.5),
+            (_hour(3), 1.0, 1.5),
+            (_hour(2), 0.0, 1.5),
+            (_hour(1), 0.0, 1.5),
+        ]
+        assert mock_add_statistics.call_args[0][1]["name"] == "EARLY Working"
+        metadata = mock_add_statistics.call_args[0][1]
+        assert metadata["mean_type"] is StatisticMeanType.NONE
+        assert metadata["unit_class"] == "duration"
+        assert metadata["unit_of_measurement"] == "h"
+        assert importer.imported_until == HOUR
+
+    @pytest.mark.asyncio
+    async def test_resume_from_last_imported_hour(
+        self, importer, mock_database, mock_store, mock_add_statistics
+    ):
+        """Test imports continue from the stored hour with the running total."""
+        mock_store.async_load.return_value = {"imported_until": _hour(2).isoformat()}
+        mock_database.async_durations.return_value = {"a": 7200.0, "b": 900.0}
+        mock_database.async_hourly_durations.return_value = {
+            "a": {_hour(1).timestamp(): 900.0}
+        }
+
+        await _run(importer)
+
+        mock_database.async_flush.assert_called_once()
+        assert mock_database.async_durations.call_args[0][1] == _hour(2)
+        assert _imported(mock_add_statistics) == [
+            ("early:activity_a", [(_hour(2), 0.0, 2.0), (_hour(1), 0.25, 2.25)]),
+            ("early:activity_b", [(_hour(2), 0.0, 0.25), (_hour(1), 0.0, 0.25)]),
+        ]
+        assert mock_add_statistics.call_args[0][1]["name"] == "EARLY b"
+        assert mock_store.async_delay_save.call_args[0][0]() == {
+            "imported_until": HOUR.isoformat()
+        }
+
+    @pytest.mark.asyncio
+    async def test_changed_entries_reimported(
+        self,
+        importer,
+        mock_database,
+        mock_store,
+        mock_add_statistics,
+        mock_call_later,
+    ):
+        """Test hours changed by a sync are imported again."""
+        mock_store.async_load.return_value = {"imported_until": HOUR.isoformat()}
+        removed = TimeEntry("1", "b", _hour(3), _hour(2))
+        moved = TimeEntry("2", "a", _hour(1), HOUR)
+
+        importer._async_entries_changed(
+            TimeEntriesDelta(upserted=[moved], removed=["1"], previous=[removed])
+        )
+        importer._async_entries_changed(TimeEntriesDelta())
+
+        mock_call_later.assert_called_once()
+        mock_call_later.call_args[0][2](None)
+        await importer._task
+
+        assert mock_database.async_hourly_durations.call_args[0] == (_hour(3), HOUR)
+        # The activity that lost its time is corrected down to nothing
+        assert _imported(mock_add_statistics) == [
+            (
+                "early:activity_b",
+                [(_hour(3), 0.0, 0.0), (_hour(2), 0.0, 0.0), (_hour(1), 0.0, 0.0)],
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_database_error(self, importer, mock_database, mock_add_statistics):
+        """Test a database error ends the import without losing the resume point."""
+        mock_database.async_durations.side_effect = sqlite3.OperationalError()
+
+        await _run(importer)
+
+        mock_add_statistics.assert_not_called()
+        assert importer.imported_until is None
+        assert importer._task is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error", [sqlite3.OperationalError(), HomeAssistantError("Recorder busy")]
+    )
+    async def test_failed_import_keeps_changed_hours(
+        self, importer, mock_database, mock_store, mock_add_statistics, error
+    ):
+        """Test changed hours are imported by the next run after a failure."""
+        mock_store.async_load.return_value = {"imported_until": HOUR.isoformat()}
+        removed = TimeEntry("1", "b", _hour(3), _hour(2))
+        importer._async_entries_changed(
+            TimeEntriesDelta(removed=["1"], previous=[removed])
+        )
+        mock_add_statistics.side_effect = error
+
+        await _run(importer)
+
+        assert importer._changed_from == _hour(3)
+        assert importer._changed_activities == {"b"}
+        mock_add_statistics.side_effect = None
+        mock_add_statistics.reset_mock()
+
+        await _run(importer)
+
+        assert mock_database.async_hourly_durations.call_args[0] == (_hour(3), HOUR)
+        assert _imported(mock_add_statistics)[0][0] == "early:activity_b"
+        assert importer._changed_from is None
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(
+        self, importer, mock_store, mock_track_hour, mock_call_later
+    ):
+        """Test the importer follows the sync and the clock until stopped."""
+        importer.async_start()
+        await importer._task
+        importer._async_entries_changed(
+            TimeEntriesDelta(upserted=[TimeEntry("1", "a", _hour(1), HOUR)])
+        )
+
+        importer._sync.async_add_listener.assert_called_once_with(
+            importer._async_entries_changed
+        )
+        assert mock_track_hour.call_args[1] == {"minute": 5, "second": 0}
+        await importer.async_stop()
+
+        importer._sync.async_add_listener.return_value.assert_called_once()
+        mock_track_hour.return_value.assert_called_once()
+        mock_call_later.return_value.assert_called_once()
+        mock_store.async_save.assert_called_once_with(
+            {"imported_until": HOUR.isoformat()}
+        )
@@ -1,14 +1,19 @@
 """Test the EARLY Bluetooth support."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 from bleak.exc import BleakError
 
 from custom_components.early.bluetooth import (
+    ConnectionState,
     EarlyBluetoothDevice,
     async_discover_devices,
+    async_get_discovery_cache,
 )
+from custom_components.early.const import DATA_DISCOVERY_CACHE
+from custom_components.early.scheduler import EarlyConnectionScheduler
 
 
 class TestEarlyBluetoothDevice:
@@ -44,6 +49,35 @@ class TestEarlyBluetoothDevice:
 
         assert device.name == "EARLY Tracker"
 
+    def test_device_without_ble_device(self, mock_hass):
+        """Test a device created before the tracker has been seen."""
+        device = EarlyBluetoothDevice(
+            mock_hass, None, None, address="AA:BB:CC:DD:EE:FF", name="Desk Cube"
+        )
+
+        assert device.name == "Desk Cube"
+        assert device.address == "AA:BB:CC:DD:EE:FF"
+        assert device.rssi is None
+        assert device.is_connected is False
+
+    @pytest.mark.asyncio
+    async def test_connect_before_first_advertisement(self, mock_hass):
+        """Test connecting fails cleanly when no path to the tracker is known."""
+        device = EarlyBluetoothDevice(
+            mock_hass, None, None, address="AA:BB:CC:DD:EE:FF"
+        )
+
+        with patch(
+            "custom_components.early.bluetooth.bluetooth.async_ble_device_from_address",
+            return_value=None,
+        ), patch(
+            "custom_components.early.bluetooth.establish_connection"
+        ) as mock_establish:
+            result = await device.connect()
+
+        assert result is False
+        mock_establish.assert_not_called()
+
     def test_register_callback(self, mock_hass, mock_ble_device, mock_service_info):
         """Test registering a callback."""
         device = EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
@@ -90,7 +124,7 @@ class TestEarlyBluetoothDevice:
     def test_fire_callbacks_one_fails(
         self, mock_hass, mock_ble_device, mock_service_info
     ):
-        """Test firing callbacks when one fails."""
+        """Test a failing callback does not stop the others."""
         device = EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
         callback1 = MagicMock(side_effect=Exception("Callback error"))
         callback2 = MagicMock()
@@ -98,14 +132,68 @@ class TestEarlyBluetoothDevice:
         device.register_callback(callback1)
         device.register_callback(callback2)
 
-        # When first callback raises exception, it should propagate
-        # and subsequent callbacks won't be called
-        with pytest.raises(Exception, match="Callback error"):
-            device._fire_callbacks()
+        device._fire_callbacks()
 
-        # Verify first callback was called but second was not
         callback1.assert_called_once()
-        callback2.assert_not_called()
+        callback2.assert_called_once()
+
+    def test_register_callback_returns_unsubscribe(
+        self, mock_hass, mock_ble_device, mock_service_info
+    ):
+        """Test the handle returned by register_callback unsubscribes."""
+        device = EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
+        callback = MagicMock()
+
+        unsubscribe = device.register_callback(callback)
+        unsubscribe()
+        unsubscribe()
+
+        assert callback not in device._callbacks
+        device._fire_callbacks()
+        callback.assert_not_called()
+
+    def test_register_callback_twice_is_idempotent(
+        self, mock_hass, mock_ble_device, mock_service_info
+    ):
+        """Test re-registering the same callback does not call it twice."""
+        device = EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
+        callback = MagicMock()
+
+        device.register_callback(callback)
+        device.register_callback(callback)
+        device._fire_callbacks()
+
+        callback.assert_called_once()
+        assert device.listener_counts == {"orientation": 1, "rssi": 0, "battery": 0}
+
+    def test_callback_may_unsubscribe_while_firing(
+        self, mock_hass, mock_ble_device, mock_service_info
+    ):
+        """Test a callback can remove itself during dispatch."""
+        device = EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
+        callback2 = MagicMock()
+        unsubscribe = device.register_callback(lambda: unsubscribe())
+        device.register_callback(callback2)
+
+        device._fire_callbacks()
+
+        callback2.assert_called_once()
+        assert len(device._callbacks) == 1
+
+    def test_fire_callbacks_sends_dispatcher_signal(
+        self, mock_hass, mock_ble_device, mock_service_info
+    ):
+        """Test updates are also sent as dispatcher signals."""
+        device = EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
+
+        with patch(
+            "custom_components.early.bluetooth.async_dispatcher_send"
+        ) as mock_send:
+            device._fire_callbacks()
+
+        mock_send.assert_called_once_with(
+            mock_hass, "early_orientation_updated_AA:BB:CC:DD:EE:FF"
+        )
 
     @pytest.mark.asyncio
     async def test_connect_success(
@@ -130,26 +218,79 @@ class TestEarlyBluetoothDevice:
         await device.connect()
 
         # Second connection should return True without reconnecting
-        with patch("custom_components.early.bluetooth.BleakClient") as mock_client:
-            result = await device.connect()
-            assert result is True
-            # BleakClient should not be called again
-            mock_client.assert_not_called()
+        result = await device.connect()
+        assert result is True
+        # No new connection should be established
+        mock_bleak_client.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_connect_failure(self, mock_hass, mock_ble_device, mock_service_info):
         """Test connection failure."""
         device = EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
 
-        with patch("custom_components.early.bluetooth.BleakClient") as mock_client:
-            client = AsyncMock()
-            client.connect = AsyncMock(side_effect=BleakError("Connection failed"))
-            mock_client.return_value = client
-
+        with patch(
+            "custom_components.early.bluetooth.establish_connection",
+            AsyncMock(side_effect=BleakError("Connection failed")),
+        ), patch(
+            "custom_components.early.bluetooth.bluetooth.async_ble_device_from_address",
+            return_value=None,
+        ):
             result = await device.connect()
 
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_connect_uses_best_ble_device(
+        self, mock_hass, mock_ble_device, mock_service_info, mock_bleak_client
+    ):
+        """Test connecting through the best current path for the address."""
+        device = EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
+        best_device = MagicMock()
+        best_device.address = "AA:BB:CC:DD:EE:FF"
+
+        with patch(
+            "custom_components.early.bluetooth.bluetooth.async_ble_device_from_address",
+            return_value=best_device,
+        ) as mock_from_address:
+            result = await device.connect()
+
+        assert result is True
+        mock_from_address.assert_called_with(
+            mock_hass, "AA:BB:CC:DD:EE:FF", connectable=True
+        )
+        args, kwargs = mock_bleak_client.call_args
+        assert args[1] is best_device
+        assert kwargs["disconnected_callback"] == device._on_disconnect
+        assert kwargs["ble_device_callback"] == device._async_best_ble_device
+
+    @pytest.mark.asyncio
+    async def test_connect_falls_back_to_known_device(
+        self, mock_hass, mock_ble_device, mock_service_info, mock_bleak_client
+    ):
+        """Test the setup device is used when no connectable path is known."""
+        device = EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
+
+        await device.connect()
+
+        assert mock_bleak_client.call_args[0][1] is mock_ble_device
+
+    @pytest.mark.asyncio
+    async def test_connect_timeout(self, mock_hass, mock_ble_device, mock_service_info):
+        """Test exceeding the connection time budget fails the attempt."""
+        device = EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
+
+        with patch(
+            "custom_components.early.bluetooth.establish_connection",
+            AsyncMock(side_effect=TimeoutError),
+        ), patch(
+            "custom_components.early.bluetooth.bluetooth.async_ble_device_from_address",
+            return_value=None,
+        ):
+            result = await device.connect()
+
+        assert result is False
+        assert device._client is None
+
     @pytest.mark.asyncio
     async def test_disconnect_success(
         self, mock_hass, mock_ble_device, mock_service_info, mock_bleak_client
@@ -244,7 +385,9 @@ class TestEarlyBluetoothDevice:
         self, mock_hass, mock_ble_device, mock_service_info
     ):
         """Test orientation change callback."""
-        device = EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
+        device = EarlyBluetoothDevice(
+            mock_hass, mock_ble_device, mock_service_info, settle_time=0
+        )
         callback = MagicMock()
         device.register_callback(callback)
 
@@ -282,6 +425,84 @@ class TestEarlyBluetoothDevice:
 
         callback.assert_not_called()
 
+    def test_on_orientation_changed_burst_is_coalesced(
+        self, mock_hass, mock_ble_device, mock_service_info
+    ):
+        """Test a burst of changes collapses into one trailing dispatch."""
+        device = EarlyBluetoothDevice(
+            mock_hass,
+            mock_ble_device,
+            mock_service_info,
+            min_update_interval=1.0,
+            settle_time=0,
+        )
+        callback = MagicMock()
+        device.register_callback(callback)
+
+        with patch(
+            "custom_components.early.bluetooth.async_call_later"
+        ) as mock_call_later:
+            device._on_orientation_changed(1, bytearray([1]))
+            device._on_orientation_changed(1, bytearray([2]))
+            device._on_orientation_changed(1, bytearray([3]))
+            device._on_orientation_changed(1, bytearray([4]))
+
+            # Leading edge delivered immediately, the rest share one timer
+            callback.assert_called_once()
+            mock_call_later.assert_called_once()
+            delay = mock_call_later.call_args[0][1]
+            assert 0 < delay <= 1.0
+
+            # Trailing dispatch delivers the final value
+            trailing = mock_call_later.call_args[0][2]
+            trailing(None)
+
+        assert callback.call_count == 2
+        assert device.orientation == 4
+        assert device._cancel_pending_dispatch is None
+
+    def test_on_orientation_changed_after_quiet_period(
+        self, mock_hass, mock_ble_device, mock_service_info
+    ):
+        """Test a change after the interval has elapsed is delivered immediately."""
+        device = EarlyBluetoothDevice(
+            mock_hass,
+            mock_ble_device,
+            mock_service_info,
+            min_update_interval=1.0,
+            settle_time=0,
+        )
+        callback = MagicMock()
+        device.register_callback(callback)
+
+        clock = [100.0]
+        with patch(
+            "custom_components.early.bluetooth.time.monotonic",
+            side_effect=lambda: clock[0],
+        ), patch(
+            "custom_components.early.bluetooth.async_call_later"
+        ) as mock_call_later:
+            device._on_orientation_changed(1, bytearray([1]))
+            clock[0] = 102.0
+            device._on_orientation_changed(1, bytearray([2]))
+
+        assert callback.call_count == 2
+        mock_call_later.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_pending_dispatch(
+        self, mock_hass, mock_ble_device, mock_service_info
+    ):
+        """Test disconnecting cancels a scheduled trailing dispatch."""
+        device = EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
+        cancel = MagicMock()
+        device._cancel_pending_dispatch = cancel
+
+        await device.disconnect()
+
+        cancel.assert_called_once()
+        assert device._cancel_pending_dispatch is None
+
     def test_on_disconnect(self, mock_hass, mock_ble_device, mock_service_info):
         """Test disconnection callback."""
         device = EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
@@ -332,57 +553,1446 @@ class TestEarlyBluetoothDevice:
         assert EarlyBluetoothDevice.match_device(service_info) is False
 
 
-class TestAsyncDiscoverDevices:
-    """Test the async_discover_devices function."""
+class TestConnectionManager:
+    """Test the EarlyBluetoothDevice reconnect manager."""
+
+    @pytest.fixture
+    def mock_service_info(self, mock_ble_device):
+        """Return a mock Bluetooth service info."""
+        service_info = MagicMock()
+        service_info.name = "Timeular ZEI"
+        service_info.address = "AA:BB:CC:DD:EE:FF"
+        service_info.rssi = -50
+        service_info.device = mock_ble_device
+        return service_info
+
+    @pytest.fixture
+    def device(self, mock_hass, mock_ble_device, mock_service_info):
+        """Return a device with reconnect timers patched out and no watchdog."""
+        device = EarlyBluetoothDevice(
+            mock_hass, mock_ble_device, mock_service_info, liveness_interval=0
+        )
+        mock_hass.async_create_background_task = MagicMock(
+            side_effect=lambda coro, name: coro.close()
+        )
+        return device
+
+    @pytest.fixture
+    def mock_call_later(self):
+        """Patch async_call_later in the bluetooth module."""
+        with patch("custom_components.early.bluetooth.async_call_later") as mock:
+            yield mock
+
+    def test_start_when_connected(self, device, mock_call_later):
+        """Test starting the manager on an established connection."""
+        device._client = MagicMock()
+        device._client.is_connected = True
+
+        device.async_start()
+
+        assert device.connection_state == ConnectionState.CONNECTED
+        mock_call_later.assert_not_called()
+
+    def test_start_when_disconnected(self, device, mock_call_later):
+        """Test starting the manager schedules an immediate attempt."""
+        device.async_start()
+
+        assert device.connection_state == ConnectionState.WAITING
+        mock_call_later.assert_called_once()
+        assert mock_call_later.call_args[0][1] == 0
+
+    def test_disconnect_while_managed_schedules_reconnect(
+        self, device, mock_call_later
+    ):
+        """Test an unexpected disconnect schedules a reconnect."""
+        client = MagicMock()
+        client.is_connected = True
+        device._client = client
+        device.async_start()
+        callback = MagicMock()
+        device.register_callback(callback)
+
+        device._on_disconnect(client)
+
+        assert device._client is None
+        assert device.connection_state == ConnectionState.WAITING
+        assert device._disconnected_at is not None
+        callback.assert_called_once()
+        mock_call_later.assert_called_once()
+
+    def test_disconnect_while_stopped_does_not_reconnect(self, device, mock_call_later):
+        """Test a disconnect before the manager starts does not reconnect."""
+        client = MagicMock()
+        device._client = client
+
+        device._on_disconnect(client)
+
+        assert device.connection_state == ConnectionState.STOPPED
+        mock_call_later.assert_not_called()
+
+    def test_disconnect_from_stale_client_ignored(self, device, mock_call_later):
+        """Test a late callback from a replaced client is ignored."""
+        current = MagicMock()
+        device._client = current
+        device.async_start()
+        mock_call_later.reset_mock()
+
+        device._on_disconnect(MagicMock())
+
+        assert device._client is current
+        mock_call_later.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_discover_devices_found(self, mock_hass):
-        """Test discovering devices."""
-        service_info1 = MagicMock()
-        service_info1.name = "Timeular ZEI 1"
-        service_info1.service_uuids = []
+    async def test_reconnect_failure_backs_off_exponentially(
+        self, device, mock_call_later
+    ):
+        """Test failed reconnects double the delay each time."""
+        device._state = ConnectionState.WAITING
+        device.connect = AsyncMock(return_value=False)
 
-        service_info2 = MagicMock()
-        service_info2.name = "Other Device"
-        service_info2.service_uuids = []
+        delays = []
+        with patch("custom_components.early.bluetooth.random.uniform", return_value=0):
+            for attempts in (1, 2, 3, 4):
+                device._failed_attempts = attempts
+                await device._async_reconnect()
+                delays.append(mock_call_later.call_args[0][1])
 
-        service_info3 = MagicMock()
-        service_info3.name = "Timeular ZEI 2"
-        service_info3.service_uuids = []
+        assert delays == [1.0, 2.0, 4.0, 8.0]
+
+    @pytest.mark.asyncio
+    async def test_reconnect_backoff_is_capped(self, device, mock_call_later):
+        """Test the backoff delay never exceeds the maximum."""
+        device._state = ConnectionState.WAITING
+        device._failed_attempts = 50
+        device.connect = AsyncMock(return_value=False)
+
+        with patch("custom_components.early.bluetooth.random.uniform", return_value=0):
+            await device._async_reconnect()
+
+        assert mock_call_later.call_args[0][1] == 300.0
+
+    @pytest.mark.asyncio
+    async def test_reconnect_success_records_latency(
+        self, device, mock_bleak_client, mock_call_later
+    ):
+        """Test a successful reconnect records latency metrics."""
+        device._state = ConnectionState.WAITING
+        device._disconnected_at = 100.0
 
         with patch(
-            "custom_components.early.bluetooth.bluetooth.async_discovered_service_info",
-            return_value=[service_info1, service_info2, service_info3],
+            "custom_components.early.bluetooth.time.monotonic", return_value=103.5
         ):
-            devices = await async_discover_devices(mock_hass)
+            await device._async_reconnect()
 
-            assert len(devices) == 2
-            assert service_info1 in devices
-            assert service_info3 in devices
-            assert service_info2 not in devices
+        assert device.connection_state == ConnectionState.CONNECTED
+        stats = device.connection_stats
+        assert stats["reconnect_count"] == 1
+        assert stats["last_reconnect_latency"] == 3.5
+        assert stats["average_reconnect_latency"] == 3.5
+        assert stats["failed_attempts"] == 0
+        mock_call_later.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_discover_devices_none_found(self, mock_hass):
-        """Test discovering devices with none found."""
-        service_info = MagicMock()
-        service_info.name = "Other Device"
-        service_info.service_uuids = []
+    async def test_reconnect_skipped_when_stopped(self, device, mock_call_later):
+        """Test a timer firing after disconnect() does nothing."""
+        device.connect = AsyncMock()
+
+        await device._async_reconnect()
+
+        device.connect.assert_not_called()
+
+    def test_reconnect_timer_starts_background_task(self, device, mock_hass):
+        """Test the reconnect timer runs the attempt as a background task."""
+        device._async_reconnect_timer(None)
+
+        mock_hass.async_create_background_task.assert_called_once()
+
+    def test_advertisement_while_waiting_reconnects_now(
+        self, device, mock_call_later, mock_service_info
+    ):
+        """Test an advertisement cuts a pending backoff short."""
+        cancel = MagicMock()
+        device._state = ConnectionState.WAITING
+        device._cancel_reconnect = cancel
+
+        device.async_handle_advertisement(mock_service_info, MagicMock())
+
+        cancel.assert_called_once()
+        mock_call_later.assert_called_once()
+        assert mock_call_later.call_args[0][1] == 0
+
+    def test_advertisement_within_cooldown_ignored(
+        self, device, mock_call_later, mock_service_info
+    ):
+        """Test advertisements right after an attempt do not retry again."""
+        device._state = ConnectionState.WAITING
+        device._last_attempt = 100.0
 
         with patch(
-            "custom_components.early.bluetooth.bluetooth.async_discovered_service_info",
-            return_value=[service_info],
+            "custom_components.early.bluetooth.time.monotonic", return_value=101.0
         ):
-            devices = await async_discover_devices(mock_hass)
+            device.async_handle_advertisement(mock_service_info, MagicMock())
 
-            assert len(devices) == 0
+        mock_call_later.assert_not_called()
+
+    def test_advertisement_while_connected_updates_data(
+        self, device, mock_call_later, mock_ble_device
+    ):
+        """Test advertisements while connected only refresh cached data."""
+        device._state = ConnectionState.CONNECTED
+        service_info = MagicMock()
+        service_info.rssi = -70
+        service_info.device = mock_ble_device
+
+        device.async_handle_advertisement(service_info, MagicMock())
+
+        assert device._advertisement_data is service_info
+        mock_call_later.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_discover_devices_empty(self, mock_hass):
-        """Test discovering devices with empty list."""
+    async def test_disconnect_stops_manager(self, device, mock_call_later):
+        """Test disconnect() stops the manager and cancels the timer."""
+        cancel = MagicMock()
+        device._state = ConnectionState.WAITING
+        device._cancel_reconnect = cancel
+
+        await device.disconnect()
+
+        assert device.connection_state == ConnectionState.STOPPED
+        cancel.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_connects_share_one_attempt(
+        self, device, mock_bleak_client
+    ):
+        """Test the connect lock prevents parallel connection attempts."""
+        results = await asyncio.gather(device.connect(), device.connect())
+
+        assert results == [True, True]
+        mock_bleak_client.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_releases_half_open_client(
+        self, device, mock_bleak_client
+    ):
+        """Test a client left connected by a failed setup step is released."""
+        client = mock_bleak_client.return_value
+        client.start_notify = AsyncMock(side_effect=BleakError("Notify failed"))
+
+        result = await device.connect()
+
+        assert result is False
+        assert device._client is None
+        client.disconnect.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_connect_takes_scheduler_slot(
+        self, mock_hass, mock_ble_device, mock_bleak_client
+    ):
+        """Test attempts queue on the source, first connections ahead of retries."""
+        mock_ble_device.details = {"source": "proxy-1"}
+        scheduler = EarlyConnectionScheduler(spacing=0)
+        device = EarlyBluetoothDevice(
+            mock_hass, mock_ble_device, MagicMock(), scheduler=scheduler
+        )
+
+        with patch.object(
+            scheduler, "async_slot", wraps=scheduler.async_slot
+        ) as mock_slot:
+            await device.connect()
+            mock_bleak_client.return_value.is_connected = False
+            await device.connect()
+
+        assert mock_slot.call_args_list == [
+            call("proxy-1", never_connected=True),
+            call("proxy-1", never_connected=False),
+        ]
+        assert scheduler.stats == {"proxy-1": {"active": 0, "queued": 0}}
+
+
+class TestLivenessWatchdog:
+    """Test the link-liveness watchdog."""
+
+    @pytest.fixture
+    def device(self, mock_hass, mock_ble_device):
+        """Return a managed, connected device with a 300 s watchdog."""
+        device = EarlyBluetoothDevice(
+            mock_hass,
+            mock_ble_device,
+            MagicMock(rssi=-50),
+            liveness_interval=300,
+            settle_time=0,
+        )
+        mock_hass.async_create_background_task = MagicMock(
+            side_effect=lambda coro, name: coro.close()
+        )
+        client = MagicMock()
+        client.is_connected = True
+        client.read_gatt_char = AsyncMock(return_value=bytearray([3]))
+        client.disconnect = AsyncMock()
+        device._client = client
+        device._state = ConnectionState.CONNECTED
+        return device
+
+    @pytest.fixture
+    def clock(self):
+        """Patch the monotonic clock to a controllable value."""
+        clock = [1000.0]
         with patch(
-            "custom_components.early.bluetooth.bluetooth.async_discovered_service_info",
-            return_value=[],
+            "custom_components.early.bluetooth.time.monotonic",
+            side_effect=lambda: clock[0],
         ):
-            devices = await async_discover_devices(mock_hass)
+            yield clock
 
-            assert len(devices) == 0
+    @pytest.fixture
+    def mock_call_later(self):
+        """Patch async_call_later."""
+        with patch(
+            "custom_components.early.bluetooth.async_call_later"
+        ) as mock_call_later:
+            yield mock_call_later
+
+    @pytest.mark.asyncio
+    async def test_armed_on_managed_connect(
+        self, mock_hass, mock_ble_device, mock_bleak_client, mock_call_later
+    ):
+        """Test a managed connection arms the watchdog."""
+        device = EarlyBluetoothDevice(
+            mock_hass, mock_ble_device, MagicMock(rssi=-50), liveness_interval=120
+        )
+        device._state = ConnectionState.WAITING
+
+        await device.connect()
+
+        mock_call_later.assert_called_once_with(
+            mock_hass, 120, device._async_watchdog_timer
+        )
+
+    def test_disabled_with_zero_interval(self, device, mock_call_later):
+        """Test an interval of 0 turns the watchdog off."""
+        device._liveness_interval = 0
+
+        device._async_schedule_watchdog(0)
+
+        mock_call_later.assert_not_called()
+
+    def test_recent_data_skips_probe(self, device, clock, mock_call_later):
+        """Test a link with recent notifications is not probed."""
+        device._last_read = clock[0] - 100
+
+        device._async_watchdog_timer(None)
+
+        device.hass.async_create_background_task.assert_not_called()
+        assert mock_call_later.call_args[0][1] == 200
+
+    def test_quiet_link_is_probed(self, device, clock, mock_call_later):
+        """Test a link quiet for the full interval is probed."""
+        device._last_read = clock[0] - 300
+
+        device._async_watchdog_timer(None)
+
+        device.hass.async_create_background_task.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_successful_probe_rearms(self, device, clock, mock_call_later):
+        """Test a successful probe records data and re-arms the watchdog."""
+        device._last_read = clock[0] - 300
+
+        await device._async_probe_liveness()
+
+        assert device._last_read == clock[0]
+        assert device.orientation == 3
+        assert device.connection_stats["liveness_probes"] == 1
+        assert device.connection_stats["liveness_failures"] == 0
+        mock_call_later.assert_called_once_with(
+            device.hass, 300, device._async_watchdog_timer
+        )
+
+    @pytest.mark.asyncio
+    async def test_probe_is_not_a_notification(self, device, clock, mock_call_later):
+        """Test a probe read is not captured or counted as a notification."""
+        device._capture = MagicMock()
+        device._on_demand = True
+        callback = MagicMock()
+        device.register_callback(callback)
+
+        await device._async_probe_liveness()
+
+        device._capture.record.assert_not_called()
+        assert device._notification_count == 0
+        assert device._session_deadline == 0.0
+        # A face the notifications missed is still reported
+        assert device.orientation == 3
+        callback.assert_called_once()
+
+        await device._async_probe_liveness()
+
+        callback.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_forces_reconnect(self, device, mock_call_later):
+        """Test a failed probe tears the link down and reconnects."""
+        client = device._client
+        client.read_gatt_char.side_effect = BleakError("Not connected")
+
+        await device._async_probe_liveness()
+
+        client.disconnect.assert_called_once()
+        assert device._client is None
+        assert device.connection_state == ConnectionState.WAITING
+        assert device.connection_stats["liveness_failures"] == 1
+        assert mock_call_later.call_args[0][2] == device._async_reconnect_timer
+
+    @pytest.mark.asyncio
+    async def test_probe_timeout_forces_reconnect(self, device, mock_call_later):
+        """Test a probe that never answers is treated as a dead link."""
+        client = device._client
+        client.read_gatt_char.side_effect = TimeoutError
+        client.disconnect.side_effect = BleakError("Disconnect failed")
+
+        await device._async_probe_liveness()
+
+        assert device._client is None
+        assert device.connection_state == ConnectionState.WAITING
+
+    def test_disconnect_cancels_watchdog(self, device, mock_call_later):
+        """Test a dropped link cancels the pending check."""
+        device._async_schedule_watchdog(300)
+
+        device._on_disconnect(device._client)
+
+        mock_call_later.return_value.assert_called_once()
+
+
+class TestSettleFilter:
+    """Test the orientation settle filter."""
+
+    @pytest.fixture
+    def device(self, mock_hass, mock_ble_device):
+        """Return a device with a 250 ms settle window and no dwell time."""
+        return EarlyBluetoothDevice(
+            mock_hass, mock_ble_device, MagicMock(rssi=-50), settle_time=250
+        )
+
+    @pytest.fixture
+    def clock(self):
+        """Patch the monotonic clock to a controllable value."""
+        clock = [100.0]
+        with patch(
+            "custom_components.early.bluetooth.time.monotonic",
+            side_effect=lambda: clock[0],
+        ):
+            yield clock
+
+    @pytest.fixture
+    def mock_call_later(self):
+        """Patch async_call_later."""
+        with patch(
+            "custom_components.early.bluetooth.async_call_later"
+        ) as mock_call_later:
+            yield mock_call_later
+
+    def test_face_committed_after_settling(self, device, clock, mock_call_later):
+        """Test a new face is only reported once the window has passed."""
+        callback = MagicMock()
+        device.register_callback(callback)
+
+        device._on_orientation_changed(1, bytearray([3]))
+
+        assert device.raw_orientation == 3
+        assert device.orientation == 0
+        callback.assert_not_called()
+        assert mock_call_later.call_args[0][1] == pytest.approx(0.25)
+
+        clock[0] += 0.25
+        mock_call_later.call_args[0][2](None)
+
+        assert device.orientation == 3
+        callback.assert_called_once()
+
+    def test_settled_faces_recorded_in_history(self, device, clock, mock_call_later):
+        """Test only settled faces are appended to the history."""
+        device._handle_orientation_value(bytearray([1]))
+        device._on_orientation_changed(1, bytearray([2]))
+        clock[0] += 0.1
+        device._on_orientation_changed(1, bytearray([3]))
+        clock[0] += 0.25
+        mock_call_later.call_args[0][2](None)
+        device._handle_orientation_value(bytearray([3]))
+
+        assert list(device.orientation_history.snapshot()) == [
+            (100.0, 1),
+            (100.35, 3),
+        ]
+
+    def test_turning_restarts_window(self, device, clock, mock_call_later):
+        """Test faces passed through while turning are never committed."""
+        callback = MagicMock()
+        device.register_callback(callback)
+        cancels = [MagicMock(), MagicMock(), MagicMock()]
+        mock_call_later.side_effect = cancels
+
+        device._on_orientation_changed(1, bytearray([2]))
+        clock[0] += 0.1
+        device._on_orientation_changed(1, bytearray([5]))
+        clock[0] += 0.1
+        device._on_orientation_changed(1, bytearray([7]))
+
+        cancels[0].assert_called_once()
+        cancels[1].assert_called_once()
+        mock_call_later.call_args[0][2](None)
+
+        assert device.orientation == 7
+        callback.assert_called_once()
+
+    def test_transient_face_reverted(self, device, clock, mock_call_later):
+        """Test returning to the committed face drops the pending change."""
+        cancel = MagicMock()
+        mock_call_later.return_value = cancel
+        device._orientation = device._raw_orientation = 4
+
+        device._on_orientation_changed(1, bytearray([5]))
+        device._on_orientation_changed(1, bytearray([4]))
+
+        cancel.assert_called_once()
+        assert device._cancel_settle is None
+        assert device.orientation == 4
+        assert device.raw_orientation == 4
+
+    def test_hysteresis_holds_committed_face(
+        self, mock_hass, mock_ble_device, clock, mock_call_later
+    ):
+        """Test a committed face is kept for at least the hysteresis time."""
+        device = EarlyBluetoothDevice(
+            mock_hass,
+            mock_ble_device,
+            MagicMock(rssi=-50),
+            settle_time=100,
+            settle_hysteresis=2000,
+        )
+        device._handle_orientation_value(bytearray([4]))
+
+        clock[0] += 0.5
+        device._on_orientation_changed(1, bytearray([6]))
+
+        assert mock_call_later.call_args[0][1] == pytest.approx(1.5)
+
+    def test_zero_settle_time_commits_immediately(
+        self, mock_hass, mock_ble_device, mock_call_later
+    ):
+        """Test the filter can be disabled."""
+        device = EarlyBluetoothDevice(
+            mock_hass, mock_ble_device, MagicMock(rssi=-50), settle_time=0
+        )
+
+        device._on_orientation_changed(1, bytearray([6]))
+
+        assert device.orientation == 6
+        mock_call_later.assert_not_called()
+
+    def test_read_commits_without_settling(self, device, mock_call_later):
+        """Test a read reports a face at rest and cancels a pending change."""
+        cancel = MagicMock()
+        mock_call_later.return_value = cancel
+        device._on_orientation_changed(1, bytearray([5]))
+
+        device._handle_orientation_value(bytearray([2]))
+
+        cancel.assert_called_once()
+        assert device.orientation == 2
+        assert device.raw_orientation == 2
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_settle(self, device, mock_call_later):
+        """Test disconnecting drops a pending change."""
+        cancel = MagicMock()
+        mock_call_later.return_value = cancel
+        device._on_orientation_changed(1, bytearray([5]))
+
+        await device.disconnect()
+
+        cancel.assert_called_once()
+
+
+class TestSignalStrength:
+    """Test smoothing and publishing of advertisement RSSI."""
+
+    @pytest.fixture
+    def mock_service_info(self, mock_ble_device):
+        """Return a mock Bluetooth service info."""
+        service_info = MagicMock()
+        service_info.rssi = -50
+        service_info.device = mock_ble_device
+        return service_info
+
+    @pytest.fixture
+    def device(self, mock_hass, mock_ble_device, mock_service_info):
+        """Return a device whose setup advertisement had RSSI -50."""
+        return EarlyBluetoothDevice(mock_hass, mock_ble_device, mock_service_info)
+
+    @pytest.fixture(autouse=True)
+    def mock_track_interval(self):
+        """Patch the RSSI sampling timer."""
+        with patch(
+            "custom_components.early.bluetooth.async_track_time_interval"
+        ) as track:
+            yield track
+
+    @pytest.fixture
+    def clock(self):
+        """Patch the monotonic clock to a controllable value."""
+        clock = [1000.0]
+        with patch(
+            "custom_components.early.bluetooth.time.monotonic",
+            side_effect=lambda: clock[0],
+        ):
+            yield clock
+
+    def test_initial_rssi_from_setup_advertisement(self, device):
+        """Test the setup advertisement seeds the value."""
+        assert device.rssi == -50
+
+    def test_first_advertisement_seeds_average(self, mock_hass):
+        """Test a tracker first seen later publishes its first reading."""
+        device = EarlyBluetoothDevice(
+            mock_hass, None, None, address="AA:BB:CC:DD:EE:FF"
+        )
+        callback = MagicMock()
+        device.register_rssi_callback(callback)
+
+        device._async_update_rssi(-72)
+
+        assert device.rssi == -72
+        callback.assert_called_once()
+
+    def test_readings_are_smoothed(self, device, clock):
+        """Test a single outlier only moves the value part of the way."""
+        device._async_update_rssi(-90)
+
+        assert device._smoothed_rssi == pytest.approx(-58.0)
+        assert device.rssi == -58
+
+    def test_small_changes_not_published(self, device, clock):
+        """Test changes below the threshold do not fire callbacks."""
+        callback = MagicMock()
+        device.register_rssi_callback(callback)
+
+        device._async_update_rssi(-55)
+
+        callback.assert_not_called()
+        assert device.rssi == -50
+
+    def test_publish_rate_limited(self, device, clock):
+        """Test the value is published at most once per interval."""
+        callback = MagicMock()
+        device.register_rssi_callback(callback)
+
+        device._async_update_rssi(-90)
+        clock[0] += 5
+        device._async_update_rssi(-90)
+
+        callback.assert_called_once()
+        assert device.rssi == -58
+
+        clock[0] += 30
+        device._async_update_rssi(-90)
+
+        assert callback.call_count == 2
+        assert device.rssi == -70
+
+    def test_advertisement_updates_rssi(self, device, clock, mock_service_info):
+        """Test advertisements feed the average."""
+        mock_service_info.rssi = -90
+
+        device.async_handle_advertisement(mock_service_info, MagicMock())
+
+        assert device.rssi == -58
+
+    def test_unregister_rssi_callback(self, device, clock):
+        """Test an unregistered callback is no longer called."""
+        callback = MagicMock()
+        device.register_rssi_callback(callback)
+        device.unregister_rssi_callback(callback)
+
+        device._async_update_rssi(-90)
+
+        callback.assert_not_called()
+
+    def test_latest_advertisement_sampled(
+        self, device, clock, mock_track_interval, mock_ble_device
+    ):
+        """Test RSSI-only changes and a silent tracker are still sampled."""
+        callback = MagicMock()
+        remove = device.register_rssi_callback(callback)
+        mock_track_interval.assert_called_once()
+        sample = mock_track_interval.call_args[0][1]
+        latest = MagicMock(rssi=-90, device=mock_ble_device)
+
+        with patch(
+            "custom_components.early.bluetooth.bluetooth.async_last_service_info",
+            side_effect=lambda hass, address, connectable: latest,
+        ) as last_service_info:
+            sample(None)
+            assert device.rssi == -58
+            assert last_service_info.call_args[1] == {"connectable": False}
+
+            # The same advertisement is only counted once
+            clock[0] += 30
+            sample(None)
+            assert device._smoothed_rssi == pytest.approx(-58.0)
+
+            latest = MagicMock(rssi=-90, device=mock_ble_device)
+            sample(None)
+            assert device.rssi == -64
+
+        assert callback.call_count == 2
+        remove()
+        mock_track_interval.return_value.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_sampling_stops_on_disconnect(self, device, mock_track_interval):
+        """Test disconnecting stops sampling until the manager restarts."""
+        device.register_rssi_callback(MagicMock())
+
+        await device.disconnect()
+        mock_track_interval.return_value.assert_called_once()
+
+        with patch("custom_components.early.bluetooth.async_call_later"):
+            device.async_start()
+        assert mock_track_interval.call_count == 2
+
+
+class TestConnectHandshake:
+    """Test the subscribe-then-read connection handshake."""
+
+    @pytest.fixture
+    def device(self, mock_hass, mock_ble_device):
+        """Return a persistent device with reporting unthrottled."""
+        return EarlyBluetoothDevice(
+            mock_hass,
+            mock_ble_device,
+            MagicMock(rssi=-50),
+            min_update_interval=0,
+            scheduler=EarlyConnectionScheduler(spacing=0),
+            settle_time=0,
+            liveness_interval=0,
+        )
+
+    @pytest.mark.asyncio
+    async def test_subscribes_before_reading(self, device, mock_bleak_client):
+        """Test the subscription is in place before the initial read."""
+        client = mock_bleak_client.return_value
+        manager = MagicMock()
+        manager.attach_mock(client.start_notify, "start_notify")
+        manager.attach_mock(client.read_gatt_char, "read_gatt_char")
+
+        await device.connect()
+
+        assert [c[0] for c in manager.mock_calls] == [
+            "start_notify",
+            "read_gatt_char",
+        ]
+        assert device.orientation == 3
+
+    @pytest.mark.asyncio
+    async def test_notification_during_read_wins(self, device, mock_bleak_client):
+        """Test a flip notified while the read is in flight is not overwritten."""
+        client = mock_bleak_client.return_value
+
+        async def _read(char):
+            # The tracker reports the new face before the stale read returns
+            device._on_orientation_changed(0, bytearray([5]))
+            return bytearray([3])
+
+        client.read_gatt_char = AsyncMock(side_effect=_read)
+
+        await device.connect()
+
+        assert device.orientation == 5
+        assert device.raw_orientation == 5
+
+    @pytest.mark.asyncio
+    async def test_orientation_and_battery_reads_overlap(
+        self, device, mock_bleak_client
+    ):
+        """Test the initial reads are issued without waiting for each other."""
+        client = mock_bleak_client.return_value
+        battery_char = MagicMock(properties=["read"])
+        orientation_char = MagicMock()
+        client.services.get_characteristic.side_effect = {
+            "00002a19-0000-1000-8000-00805f9b34fb": battery_char,
+            "c7e70012-c847-11e6-8175-8c89a55d403c": orientation_char,
+        }.get
+        in_flight = 0
+        peak = 0
+
+        async def _read(char):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return bytearray([80]) if char is battery_char else bytearray([2])
+
+        client.read_gatt_char = AsyncMock(side_effect=_read)
+
+        with patch("custom_components.early.bluetooth.async_call_later"):
+            await device.connect()
+
+        assert peak == 2
+        assert device.orientation == 2
+        assert device.battery_level == 80
+
+    @pytest.mark.asyncio
+    async def test_first_state_latency_recorded(self, device, mock_bleak_client):
+        """Test the time from attempt start to first orientation is measured."""
+        clock = [100.0]
+
+        async def _read(char):
+            clock[0] = 100.4
+            return bytearray([3])
+
+        mock_bleak_client.return_value.read_gatt_char = AsyncMock(side_effect=_read)
+
+        with patch(
+            "custom_components.early.bluetooth.time.monotonic",
+            side_effect=lambda: clock[0],
+        ):
+            await device.connect()
+
+        stats = device.connection_stats
+        assert stats["last_first_state_latency"] == pytest.approx(0.4)
+        assert stats["average_first_state_latency"] == pytest.approx(0.4)
+
+    @pytest.mark.asyncio
+    async def test_first_state_latency_counts_once(self, device, mock_bleak_client):
+        """Test later notifications do not overwrite the handshake latency."""
+        await device.connect()
+        latency = device.connection_stats["last_first_state_latency"]
+
+        device._on_orientation_changed(0, bytearray([4]))
+
+        assert device.connection_stats["last_first_state_latency"] == latency
+        assert device._first_state_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_read_keeps_subscription(self, device, mock_bleak_client):
+        """Test a failed initial read falls back to the first notification."""
+        client = mock_bleak_client.return_value
+        client.read_gatt_char = AsyncMock(side_effect=BleakError("Read failed"))
+
+        assert await device.connect() is True
+        assert device.connection_stats["last_first_state_latency"] is None
+
+        device._on_orientation_changed(0, bytearray([6]))
+
+        assert device.orientation == 6
+        assert device.connection_stats["last_first_state_latency"] is not None
+
+
+class TestGattCache:
+    """Test GATT handle caching across reconnects."""
+
+    @pytest.fixture
+    def device(self, mock_hass, mock_ble_device):
+        """Return a device seen through a known proxy."""
+        mock_ble_device.details = {"source": "proxy-1"}
+        return EarlyBluetoothDevice(
+            mock_hass,
+            mock_ble_device,
+            MagicMock(),
+            scheduler=EarlyConnectionScheduler(spacing=0),
+        )
+
+    @pytest.mark.asyncio
+    async def test_first_connect_resolves_handles(self, device, mock_bleak_client):
+        """Test the first connection resolves and caches the characteristic."""
+        client = mock_bleak_client.return_value
+
+        await device.connect()
+
+        orientation_char = client.services.get_characteristic(
+            "c7e70012-c847-11e6-8175-8c89a55d403c"
+        )
+        assert device._orientation_char is orientation_char
+        assert device._gatt_cache_source == "proxy-1"
+        client.start_notify.assert_called_once_with(
+            orientation_char, device._on_orientation_changed
+        )
+
+    @pytest.mark.asyncio
+    async def test_reconnect_reuses_handles(self, device, mock_bleak_client):
+        """Test a reconnect skips characteristic lookup."""
+        client = mock_bleak_client.return_value
+        await device.connect()
+        client.is_connected = False
+        client.services.get_characteristic.reset_mock()
+
+        await device.connect()
+
+        client.services.get_characteristic.assert_not_called()
+        assert client.start_notify.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_handles_invalidated(self, device, mock_bleak_client):
+        """Test a failed handle lookup clears the cache and rediscovers."""
+        client = mock_bleak_client.return_value
+        stale_char = MagicMock()
+        device._orientation_char = stale_char
+        device._gatt_cache_source = "proxy-1"
+
+        def _start_notify(char, callback):
+            if char is stale_char:
+                raise BleakError("Characteristic not found")
+
+        client.start_notify = AsyncMock(side_effect=_start_notify)
+
+        result = await device.connect()
+
+        assert result is True
+        client.clear_cache.assert_called_once()
+        # Rediscovery needs a fresh connection, not the stale services
+        client.disconnect.assert_called_once()
+        assert mock_bleak_client.call_count == 2
+        assert device._orientation_char is not stale_char
+        assert device._orientation_char is not None
+        assert client.start_notify.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_different_source_rediscovers(self, device, mock_bleak_client):
+        """Test handles cached through another adapter are not reused."""
+        client = mock_bleak_client.return_value
+        device._orientation_char = MagicMock()
+        device._gatt_cache_source = "proxy-2"
+
+        await device.connect()
+
+        client.services.get_characteristic.assert_called()
+        assert device._gatt_cache_source == "proxy-1"
+
+    @pytest.mark.asyncio
+    async def test_missing_characteristic_fails_connect(
+        self, device, mock_bleak_client
+    ):
+        """Test a tracker without the orientation characteristic fails."""
+        client = mock_bleak_client.return_value
+        client.services.get_characteristic.side_effect = lambda uuid: None
+
+        result = await device.connect()
+
+        assert result is False
+        assert device._orientation_char is None
+
+    @pytest.mark.asyncio
+    async def test_firmware_revision_read_on_resolution(
+        self, device, mock_bleak_client
+    ):
+        """Test the firmware revision is read once when handles are resolved."""
+        client = mock_bleak_client.return_value
+        orientation_char = MagicMock()
+        firmware_char = MagicMock()
+        client.services.get_characteristic.side_effect = {
+            "00002a26-0000-1000-8000-00805f9b34fb": firmware_char,
+            "c7e70012-c847-11e6-8175-8c89a55d403c": orientation_char,
+        }.get
+        client.read_gatt_char = AsyncMock(
+            side_effect=lambda char: (
+                bytearray(b"2.1.0\x00") if char is firmware_char else bytearray([1])
+            )
+        )
+
+        await device.connect()
+
+        assert device.firmware_revision == "2.1.0"
+        assert device.orientation == 1
+
+    @pytest.mark.asyncio
+    async def test_firmware_update_rediscovers(self, device, mock_bleak_client):
+        """Test handles cached under another firmware revision are not reused."""
+        client = mock_bleak_client.return_value
+        firmware_char = MagicMock()
+        client.services.get_characteristic.side_effect = {
+            "00002a26-0000-1000-8000-00805f9b34fb": firmware_char,
+            "c7e70012-c847-11e6-8175-8c89a55d403c": MagicMock(),
+        }.get
+        revision = bytearray(b"2.1.0")
+        client.read_gatt_char = AsyncMock(
+            side_effect=lambda char: (
+                revision if char is firmware_char else bytearray([1])
+            )
+        )
+        await device.connect()
+        client.is_connected = False
+
+        # Same firmware: the cached handles are reused
+        await device.connect()
+        assert mock_bleak_client.call_count == 2
+        client.clear_cache.assert_not_called()
+
+        client.is_connected = False
+        revision = bytearray(b"2.2.0")
+        client.services.get_characteristic.reset_mock()
+        await device.connect()
+
+        # Checked alongside the initial reads; no extra connection is made
+        client.clear_cache.assert_called_once()
+        assert mock_bleak_client.call_count == 3
+        assert device.firmware_revision == "2.2.0"
+        client.services.get_characteristic.assert_not_called()
+
+        # The next connection rediscovers the handles
+        client.is_connected = False
+        await device.connect()
+        assert mock_bleak_client.call_count == 4
+        client.services.get_characteristic.assert_called()
+        client.clear_cache.assert_called_once()
+
+
+class TestBatteryLevel:
+    """Test battery level reads over the orientation connection."""
+
+    @pytest.fixture
+    def battery_char(self, mock_bleak_client):
+        """Expose a Battery Level characteristic on the mock client."""
+        client = mock_bleak_client.return_value
+        orientation_char = MagicMock()
+        battery_char = MagicMock()
+        battery_char.properties = ["read"]
+        client.services.get_characteristic.side_effect = {
+            "c7e70012-c847-11e6-8175-8c89a55d403c": orientation_char,
+            "00002a19-0000-1000-8000-00805f9b34fb": battery_char,
+        }.get
+        client.read_gatt_char = AsyncMock(
+            side_effect=lambda char: (
+                bytearray([87]) if char is battery_char else bytearray([1])
+            )
+        )
+        return battery_char
+
+    @pytest.fixture
+    def mock_call_later(self):
+        """Patch async_call_later."""
+        with patch(
+            "custom_components.early.bluetooth.async_call_later"
+        ) as mock_call_later:
+            yield mock_call_later
+
+    @pytest.fixture
+    def device(self, mock_hass, mock_ble_device):
+        """Return a persistent-mode device."""
+        return EarlyBluetoothDevice(mock_hass, mock_ble_device, MagicMock(rssi=-50))
+
+    @pytest.mark.asyncio
+    async def test_read_after_connect(self, device, battery_char, mock_call_later):
+        """Test the level is read on connect and polled on a slow cadence."""
+        callback = MagicMock()
+        device.register_battery_callback(callback)
+
+        await device.connect()
+
+        assert device.battery_level == 87
+        callback.assert_called_once()
+        mock_call_later.assert_called_once_with(
+            device.hass, 10800, device._async_battery_poll_timer
+        )
+
+    @pytest.mark.asyncio
+    async def test_notifications_replace_polling(
+        self, device, battery_char, mock_bleak_client, mock_call_later
+    ):
+        """Test a notifying characteristic is subscribed instead of polled."""
+        battery_char.properties = ["read", "notify"]
+
+        await device.connect()
+
+        mock_bleak_client.return_value.start_notify.assert_any_call(
+            battery_char, device._on_battery_changed
+        )
+        mock_call_later.assert_not_called()
+
+        device._on_battery_changed(1, bytearray([42]))
+        assert device.battery_level == 42
+
+    @pytest.mark.asyncio
+    async def test_not_reread_on_quick_reconnect(
+        self, device, battery_char, mock_bleak_client, mock_call_later
+    ):
+        """Test a reconnect within the poll interval skips the read."""
+        client = mock_bleak_client.return_value
+        await device.connect()
+        client.is_connected = False
+        client.read_gatt_char.reset_mock()
+
+        await device.connect()
+
+        assert battery_char not in [
+            c[0][0] for c in client.read_gatt_char.call_args_list
+        ]
+        mock_call_later.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_service_ignored(self, device, mock_bleak_client):
+        """Test firmware without the Battery Service still connects."""
+        result = await device.connect()
+
+        assert result is True
+        assert device.battery_level is None
+
+    @pytest.mark.asyncio
+    async def test_read_error_does_not_fail_connect(
+        self, device, battery_char, mock_bleak_client, mock_call_later
+    ):
+        """Test a battery read error is not a connection failure."""
+        client = mock_bleak_client.return_value
+
+        def _read(char):
+            if char is battery_char:
+                raise BleakError("Read not permitted")
+            return bytearray([1])
+
+        client.read_gatt_char = AsyncMock(side_effect=_read)
+
+        assert await device.connect() is True
+        assert device.battery_level is None
+
+    def test_poll_timer_reads_when_connected(self, device, mock_call_later):
+        """Test the periodic timer re-reads over the held connection."""
+        device.hass.async_create_background_task = MagicMock(
+            side_effect=lambda coro, name: coro.close()
+        )
+        device._client = MagicMock(is_connected=True)
+
+        device._async_battery_poll_timer(None)
+
+        device.hass.async_create_background_task.assert_called_once()
+        mock_call_later.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_poll(self, device, battery_char, mock_call_later):
+        """Test stopping the device cancels the periodic read."""
+        await device.connect()
+
+        await device.disconnect()
+
+        mock_call_later.return_value.assert_called_once()
+
+
+class TestOnDemandMode:
+    """Test the duty-cycled on-demand connection mode."""
+
+    @pytest.fixture
+    def device(self, mock_hass, mock_ble_device):
+        """Return an on-demand device that reads without lingering."""
+        mock_hass.async_create_background_task = MagicMock(
+            side_effect=lambda coro, name: coro.close()
+        )
+        return EarlyBluetoothDevice(
+            mock_hass,
+            mock_ble_device,
+            MagicMock(rssi=-60),
+            connection_mode="on_demand",
+            poll_interval=300,
+            linger_time=0,
+            settle_time=0,
+        )
+
+    @pytest.fixture
+    def mock_call_later(self):
+        """Patch async_call_later in the bluetooth module."""
+        with patch("custom_components.early.bluetooth.async_call_later") as mock:
+            yield mock
+
+    def test_start_schedules_first_session(self, device, mock_call_later):
+        """Test starting the manager schedules an immediate session."""
+        device.async_start()
+
+        assert device.connection_state == ConnectionState.IDLE
+        assert mock_call_later.call_args[0][1] == 0
+
+    def test_session_timer_starts_background_task(self, device, mock_hass):
+        """Test the session timer runs the session in the background."""
+        device._state = ConnectionState.IDLE
+
+        device._async_session_timer(None)
+
+        mock_hass.async_create_background_task.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_read_only_session(self, device, mock_bleak_client, mock_call_later):
+        """Test a session without linger reads once and releases the slot."""
+        client = mock_bleak_client.return_value
+        device._state = ConnectionState.IDLE
+        callback = MagicMock()
+        device.register_callback(callback)
+
+        await device._async_run_session()
+
+        client.start_notify.assert_not_called()
+        client.disconnect.assert_called_once()
+        assert device.orientation == 3
+        assert device.available is True
+        assert device.connection_state == ConnectionState.IDLE
+        assert mock_call_later.call_args[0][1] == 300
+        callback.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_lingering_session_subscribes(
+        self, device, mock_bleak_client, mock_call_later
+    ):
+        """Test a session with linger stays subscribed until the window ends."""
+        client = mock_bleak_client.return_value
+        device._linger_time = 0.05
+        device._state = ConnectionState.IDLE
+
+        async with asyncio.timeout(1):
+            await device._async_run_session()
+
+        client.start_notify.assert_called_once()
+        client.disconnect.assert_called_once()
+        assert device.connection_state == ConnectionState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_disconnect_ends_linger(
+        self, device, mock_bleak_client, mock_call_later
+    ):
+        """Test a drop mid-linger releases the slot without waiting it out."""
+        client = mock_bleak_client.return_value
+        device._linger_time = 30
+        device._state = ConnectionState.IDLE
+
+        session = asyncio.create_task(device._async_run_session())
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert not session.done()
+        client.start_notify.assert_called_once()
+
+        client.is_connected = False
+        device._on_disconnect(client)
+        async with asyncio.timeout(1):
+            await session
+
+        assert device.connection_state == ConnectionState.IDLE
+        assert mock_call_later.call_args[0][1] == 300
+
+    def test_notification_extends_linger(self, device):
+        """Test a notification pushes the session deadline out."""
+        device._linger_time = 30
+        device._session_deadline = 0.0
+
+        with patch(
+            "custom_components.early.bluetooth.time.monotonic", return_value=500.0
+        ):
+            device._on_orientation_changed(1, bytearray([2]))
+
+        assert device._session_deadline == 530.0
+
+    @pytest.mark.asyncio
+    async def test_failed_session_reschedules(self, device, mock_call_later):
+        """Test a failed session waits for the next poll."""
+        device._state = ConnectionState.IDLE
+        device.connect = AsyncMock(return_value=False)
+
+        await device._async_run_session()
+
+        assert device.connection_state == ConnectionState.IDLE
+        assert mock_call_later.call_args[0][1] == 300
+        assert device.available is False
+
+    def test_advertisement_starts_session(
+        self, device, mock_call_later, mock_ble_device
+    ):
+        """Test an advertisement while idle starts a session."""
+        device._state = ConnectionState.IDLE
+        service_info = MagicMock()
+        service_info.rssi = -60
+        service_info.device = mock_ble_device
+
+        device.async_handle_advertisement(service_info, MagicMock())
+
+        assert mock_call_later.call_args[0][1] == 0
+
+    def test_advertisement_within_cooldown_ignored(
+        self, device, mock_call_later, mock_ble_device
+    ):
+        """Test advertisements right after a session are ignored."""
+        device._state = ConnectionState.IDLE
+        device._session_ended = 100.0
+        service_info = MagicMock()
+        service_info.rssi = -60
+        service_info.device = mock_ble_device
+
+        with patch(
+            "custom_components.early.bluetooth.time.monotonic", return_value=120.0
+        ):
+            device.async_handle_advertisement(service_info, MagicMock())
+
+        mock_call_later.assert_not_called()
+
+    def test_advertisement_during_session_ignored(
+        self, device, mock_call_later, mock_ble_device
+    ):
+        """Test advertisements do not start overlapping sessions."""
+        device._state = ConnectionState.CONNECTED
+        service_info = MagicMock()
+        service_info.rssi = -60
+        service_info.device = mock_ble_device
+
+        device.async_handle_advertisement(service_info, MagicMock())
+
+        mock_call_later.assert_not_called()
+
+    def test_disconnect_does_not_reconnect(self, device, mock_call_later):
+        """Test a drop during a session does not start the reconnect manager."""
+        client = MagicMock()
+        device._client = client
+        device._state = ConnectionState.CONNECTED
+
+        device._on_disconnect(client)
+
+        assert device._client is None
+        mock_call_later.assert_not_called()
+
+    def test_availability_window(self, device):
+        """Test the last read stays valid for two poll intervals."""
+        device._last_read = 1000.0
+
+        with patch(
+            "custom_components.early.bluetooth.time.monotonic", return_value=1500.0
+        ):
+            assert device.available is True
+        with patch(
+            "custom_components.early.bluetooth.time.monotonic", return_value=1700.0
+        ):
+            assert device.available is False
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_session(self, device):
+        """Test unloading cancels a running session."""
+        task = MagicMock()
+        cancel = MagicMock()
+        device._session_task = task
+        device._cancel_session = cancel
+        device._state = ConnectionState.IDLE
+
+        await device.disconnect()
+
+        task.cancel.assert_called_once()
+        cancel.assert_called_once()
+        assert device.connection_state == ConnectionState.STOPPED
+
+
+class TestAsyncDiscoverDevices:
+    """Test the async_discover_devices function."""
+
+    @pytest.fixture(autouse=True)
+    def mock_callbacks(self):
+        """Patch the advertisement and unavailability subscriptions."""
+        with patch(
+            "custom_components.early.bluetooth.bluetooth.async_register_callback"
+        ) as register, patch(
+            "custom_components.early.bluetooth.bluetooth.async_track_unavailable"
+        ) as track_unavailable:
+            yield MagicMock(register=register, track_unavailable=track_unavailable)
+
+    @pytest.mark.asyncio
+    async def test_discover_devices_found(self, mock_hass):
+        """Test discovering devices."""
+        service_info1 = MagicMock()
+        service_info1.name = "Timeular ZEI 1"
+        service_info1.service_uuids = []
+
+        service_info2 = MagicMock()
+        service_info2.name = "Other Device"
+        service_info2.service_uuids = []
+
+        service_info3 = MagicMock()
+        service_info3.name = "Timeular ZEI 2"
+        service_info3.service_uuids = []
+
+        with patch(
+            "custom_components.early.bluetooth.bluetooth.async_discovered_service_info",
+            return_value=[service_info1, service_info2, service_info3],
+        ):
+            devices = await async_discover_devices(mock_hass)
+
+            assert len(devices) == 2
+            assert service_info1 in devices
+            assert service_info3 in devices
+            assert service_info2 not in devices
+
+    @pytest.mark.asyncio
+    async def test_discover_devices_none_found(self, mock_hass):
+        """Test discovering devices with none found."""
+        service_info = MagicMock()
+        service_info.name = "Other Device"
+        service_info.service_uuids = []
+
+        with patch(
+            "custom_components.early.bluetooth.bluetooth.async_discovered_service_info",
+            return_value=[service_info],
+        ):
+            devices = await async_discover_devices(mock_hass)
+
+            assert len(devices) == 0
+
+    @pytest.mark.asyncio
+    async def test_discover_devices_empty(self, mock_hass):
+        """Test discovering devices with empty list."""
+        with patch(
+            "custom_components.early.bluetooth.bluetooth.async_discovered_service_info",
+            return_value=[],
+        ):
+            devices = await async_discover_devices(mock_hass)
+
+            assert len(devices) == 0
+
+    @pytest.mark.asyncio
+    async def test_discover_devices_scans_once(self, mock_hass):
+        """Test later queries are served from the cache, not a rescan."""
+        service_info = MagicMock()
+        service_info.name = "Timeular ZEI 1"
+        service_info.service_uuids = []
+
+        with patch(
+            "custom_components.early.bluetooth.bluetooth.async_discovered_service_info",
+            return_value=[service_info],
+        ) as discovered:
+            assert await async_discover_devices(mock_hass) == [service_info]
+            assert await async_discover_devices(mock_hass) == [service_info]
+
+        discovered.assert_called_once()
+        assert mock_hass.data[DATA_DISCOVERY_CACHE] is async_get_discovery_cache(
+            mock_hass
+        )
+
+    @pytest.mark.asyncio
+    async def test_discover_devices_follows_advertisements(
+        self, mock_hass, mock_callbacks
+    ):
+        """Test trackers are added by callback and dropped when unavailable."""
+        with patch(
+            "custom_components.early.bluetooth.bluetooth.async_discovered_service_info",
+            return_value=[],
+        ):
+            cache = async_get_discovery_cache(mock_hass)
+
+        # One callback for the name prefix, one for the service UUID
+        assert mock_callbacks.register.call_count == 2
+        on_advertisement = mock_callbacks.register.call_args[0][1]
+
+        service_info = MagicMock(address="AA:BB:CC:DD:EE:FF")
+        service_info.name = "Timeular ZEI"
+        on_advertisement(service_info, MagicMock())
+        on_advertisement(service_info, MagicMock())
+
+        assert await async_discover_devices(mock_hass) == [service_info]
+        mock_callbacks.track_unavailable.assert_called_once()
+        on_unavailable = mock_callbacks.track_unavailable.call_args[0][1]
+
+        on_unavailable(service_info)
+
+        assert await async_discover_devices(mock_hass) == []
+        mock_callbacks.track_unavailable.return_value.assert_called_once()
+
+        cache.async_stop()
+        assert mock_callbacks.register.return_value.call_count == 2
@@ -4,14 +4,17 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT
+from homeassistant.const import PERCENTAGE, SIGNAL_STRENGTH_DECIBELS_MILLIWATT
 
 from custom_components.early.bluetooth import EarlyBluetoothDevice
 from custom_components.early.bluetooth_sensor import (
+    EarlyTrackerBatterySensor,
     EarlyTrackerCurrentActivitySensor,
     EarlyTrackerOrientationSensor,
     EarlyTrackerRSSISensor,
+    EarlyTrackerSideDwellSensor,
     async_setup_bluetooth_entry,
+    async_setup_hub_entry,
 )
 from custom_components.early.const import DOMAIN
 from custom_components.early.sensor import EarlyAPICoordinator
@@ -91,6 +94,7 @@ class TestEarlyTrackerOrientationSensor:
         attributes = sensor.extra_state_attributes
 
         assert attributes["orientation"] == 3
+        assert attributes["raw_orientation"] == 0
         assert attributes["device_address"] == "AA:BB:CC:DD:EE:FF"
 
     def test_sensor_available_connected(
@@ -135,32 +139,42 @@ class TestEarlyTrackerOrientationSensor:
     async def test_sensor_will_remove_from_hass(
         self, mock_bluetooth_device_for_sensor, mock_config_entry_bt
     ):
-        """Test sensor removal."""
+        """Test sensor removal unsubscribes from the device."""
         sensor = EarlyTrackerOrientationSensor(
             mock_bluetooth_device_for_sensor, mock_config_entry_bt
         )
-        mock_bluetooth_device_for_sensor.unregister_callback = MagicMock()
+        await sensor.async_added_to_hass()
 
-        await sensor.async_will_remove_from_hass()
+        sensor._call_on_remove_callbacks()
 
-        mock_bluetooth_device_for_sensor.unregister_callback.assert_called_once()
+        assert len(mock_bluetooth_device_for_sensor._callbacks) == 0
 
-    def test_sensor_callback_registration(
+    @pytest.mark.asyncio
+    async def test_sensor_callback_registration(
         self, mock_bluetooth_device_for_sensor, mock_config_entry_bt
     ):
-        """Test callback is registered during initialization."""
-        mock_bluetooth_device_for_sensor.register_callback = MagicMock()
-
+        """Test callback is registered when the entity is added."""
         sensor = EarlyTrackerOrientationSensor(
             mock_bluetooth_device_for_sensor, mock_config_entry_bt
         )
+        assert len(mock_bluetooth_device_for_sensor._callbacks) == 0
 
-        mock_bluetooth_device_for_sensor.register_callback.assert_called_once()
+        await sensor.async_added_to_hass()
+
+        assert sensor._handle_orientation_change in (
+            mock_bluetooth_device_for_sensor._callbacks
+        )
 
 
 class TestEarlyTrackerRSSISensor:
     """Test the EarlyTrackerRSSISensor class."""
 
+    @pytest.fixture(autouse=True)
+    def mock_track_interval(self):
+        """Patch the device's RSSI sampling timer."""
+        with patch("custom_components.early.bluetooth.async_track_time_interval"):
+            yield
+
     @pytest.fixture
     def mock_bluetooth_device(self, mock_hass, mock_ble_device):
         """Return a mock Bluetooth device."""
@@ -194,6 +208,7 @@ class TestEarlyTrackerRSSISensor:
             == SIGNAL_STRENGTH_DECIBELS_MILLIWATT
         )
         assert sensor._attr_entity_registry_enabled_default is False
+        assert sensor.should_poll is False
 
     def test_sensor_device_info(self, mock_bluetooth_device, mock_config_entry_bt):
         """Test sensor device info."""
@@ -233,6 +248,111 @@ class TestEarlyTrackerRSSISensor:
 
         assert sensor.available is False
 
+    @pytest.mark.asyncio
+    async def test_sensor_writes_state_on_rssi_change(
+        self, mock_bluetooth_device, mock_config_entry_bt
+    ):
+        """Test a published signal strength change writes state."""
+        sensor = EarlyTrackerRSSISensor(mock_bluetooth_device, mock_config_entry_bt)
+        sensor.async_write_ha_state = MagicMock()
+        await sensor.async_added_to_hass()
+
+        mock_bluetooth_device._async_update_rssi(-80)
+
+        sensor.async_write_ha_state.assert_called_once()
+        assert sensor.native_value == -56
+
+    @pytest.mark.asyncio
+    async def test_sensor_will_remove_from_hass(
+        self, mock_bluetooth_device, mock_config_entry_bt
+    ):
+        """Test sensor removal."""
+        sensor = EarlyTrackerRSSISensor(mock_bluetooth_device, mock_config_entry_bt)
+        await sensor.async_added_to_hass()
+
+        sensor._call_on_remove_callbacks()
+
+        assert len(mock_bluetooth_device._rssi_callbacks) == 0
+
+
+class TestEarlyTrackerBatterySensor:
+    """Test the EarlyTrackerBatterySensor class."""
+
+    @pytest.fixture
+    def mock_config_entry_bt(self):
+        """Return a mock Bluetooth config entry."""
+        entry = MagicMock()
+        entry.entry_id = "test_bt_entry"
+        entry.data = {"address": "AA:BB:CC:DD:EE:FF"}
+        return entry
+
+    def test_sensor_initialization(
+        self, mock_bluetooth_device_for_sensor, mock_config_entry_bt
+    ):
+        """Test sensor initialization."""
+        sensor = EarlyTrackerBatterySensor(
+            mock_bluetooth_device_for_sensor, mock_config_entry_bt
+        )
+
+        assert sensor._attr_name == "Timeular ZEI Battery"
+        assert sensor._attr_unique_id == "AA:BB:CC:DD:EE:FF_battery"
+        assert sensor._attr_device_class == SensorDeviceClass.BATTERY
+        assert sensor._attr_native_unit_of_measurement == PERCENTAGE
+        assert sensor.should_poll is False
+
+    def test_sensor_native_value(
+        self, mock_bluetooth_device_for_sensor, mock_config_entry_bt
+    ):
+        """Test the sensor reports the device's last battery level."""
+        mock_bluetooth_device_for_sensor._battery_level = 64
+        sensor = EarlyTrackerBatterySensor(
+            mock_bluetooth_device_for_sensor, mock_config_entry_bt
+        )
+
+        assert sensor.native_value == 64
+
+    def test_sensor_unavailable_until_read(
+        self, mock_bluetooth_device_for_sensor, mock_config_entry_bt
+    ):
+        """Test the sensor is unavailable before the first read."""
+        mock_bluetooth_device_for_sensor._client = MagicMock(is_connected=True)
+        sensor = EarlyTrackerBatterySensor(
+            mock_bluetooth_device_for_sensor, mock_config_entry_bt
+        )
+
+        assert sensor.available is False
+        mock_bluetooth_device_for_sensor._battery_level = 64
+        assert sensor.available is True
+
+    @pytest.mark.asyncio
+    async def test_sensor_writes_state_on_change(
+        self, mock_bluetooth_device_for_sensor, mock_config_entry_bt
+    ):
+        """Test a new battery level writes state."""
+        sensor = EarlyTrackerBatterySensor(
+            mock_bluetooth_device_for_sensor, mock_config_entry_bt
+        )
+        sensor.async_write_ha_state = MagicMock()
+        await sensor.async_added_to_hass()
+
+        mock_bluetooth_device_for_sensor._handle_battery_value(bytearray([50]))
+
+        sensor.async_write_ha_state.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_sensor_will_remove_from_hass(
+        self, mock_bluetooth_device_for_sensor, mock_config_entry_bt
+    ):
+        """Test sensor removal."""
+        sensor = EarlyTrackerBatterySensor(
+            mock_bluetooth_device_for_sensor, mock_config_entry_bt
+        )
+        await sensor.async_added_to_hass()
+
+        sensor._call_on_remove_callbacks()
+
+        assert len(mock_bluetooth_device_for_sensor._battery_callbacks) == 0
+
 
 class TestBluetoothSensorPlatformSetup:
     """Test the Bluetooth sensor platform setup."""
@@ -263,42 +383,72 @@ class TestBluetoothSensorPlatformSetup:
             with patch(
                 "custom_components.early.bluetooth_sensor.EarlyBluetoothDevice.connect",
                 return_value=True,
-            ):
+            ), patch(
+                "custom_components.early.bluetooth_sensor.EarlyBluetoothDevice.async_start"
+            ) as mock_start:
                 await async_setup_bluetooth_entry(
                     mock_hass, config_entry, async_add_entities
                 )
 
+                mock_start.assert_called_once()
                 async_add_entities.assert_called_once()
                 entities = async_add_entities.call_args[0][0]
-                assert len(entities) == 2
+                # Orientation, RSSI, Battery, and one time-today sensor per side
+                assert len(entities) == 11
                 assert isinstance(entities[0], EarlyTrackerOrientationSensor)
                 assert isinstance(entities[1], EarlyTrackerRSSISensor)
+                assert isinstance(entities[2], EarlyTrackerBatterySensor)
+                assert all(
+                    isinstance(entity, EarlyTrackerSideDwellSensor)
+                    for entity in entities[3:]
+                )
 
     @pytest.mark.asyncio
     async def test_async_setup_bluetooth_entry_no_service_info(self, mock_hass):
-        """Test setup fails when service info not found."""
+        """Test a tracker not seen since boot is still set up."""
         config_entry = MagicMock()
         config_entry.entry_id = "test_bt_entry"
+        config_entry.title = "Timeular ZEI"
         config_entry.data = {"address": "AA:BB:CC:DD:EE:FF"}
+        config_entry.options = {}
+
+        mock_hass.data[DOMAIN] = {config_entry.entry_id: {"bluetooth_devices": {}}}
 
         async_add_entities = AsyncMock()
 
         with patch(
             "custom_components.early.bluetooth_sensor.bluetooth.async_last_service_info",
             return_value=None,
-        ):
+        ), patch(
+            "custom_components.early.bluetooth_sensor.EarlyBluetoothDevice.async_start"
+        ) as mock_start:
             await async_setup_bluetooth_entry(
                 mock_hass, config_entry, async_add_entities
             )
 
-            async_add_entities.assert_not_called()
+        async_add_entities.assert_called_once()
+        entities = async_add_entities.call_args[0][0]
+        assert len(entities) == 11
+        assert all(entity.available is False for entity in entities[:3])
+        assert entities[0]._attr_unique_id == "AA:BB:CC:DD:EE:FF_orientation"
+        assert entities[0]._attr_name == "Timeular ZEI Orientation"
+        assert entities[1].native_value is None
+
+        ble_device = mock_hass.data[DOMAIN][config_entry.entry_id]["bluetooth_devices"][
+            "AA:BB:CC:DD:EE:FF"
+        ]
+        assert ble_device.address == "AA:BB:CC:DD:EE:FF"
+        mock_start.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_async_setup_bluetooth_entry_connection_failed(self, mock_hass):
-        """Test setup fails when connection fails."""
+    async def test_async_setup_bluetooth_entry_does_not_wait_for_connect(
+        self, mock_hass
+    ):
+        """Test setup leaves connecting to the background manager."""
         config_entry = MagicMock()
         config_entry.entry_id = "test_bt_entry"
         config_entry.data = {"address": "AA:BB:CC:DD:EE:FF"}
+        config_entry.options = {}
 
         mock_hass.data[DOMAIN] = {config_entry.entry_id: {"bluetooth_devices": {}}}
 
@@ -312,16 +462,22 @@ class TestBluetoothSensorPlatformSetup:
         with patch(
             "custom_components.early.bluetooth_sensor.bluetooth.async_last_service_info",
             return_value=service_info,
-        ):
-            with patch(
-                "custom_components.early.bluetooth_sensor.EarlyBluetoothDevice.connect",
-                return_value=False,
-            ):
-                await async_setup_bluetooth_entry(
-                    mock_hass, config_entry, async_add_entities
-                )
+        ), patch(
+            "custom_components.early.bluetooth_sensor.EarlyBluetoothDevice.connect",
+        ) as mock_connect, patch(
+            "custom_components.early.bluetooth_sensor.EarlyBluetoothDevice.async_start"
+        ) as mock_start:
+            await async_setup_bluetooth_entry(
+                mock_hass, config_entry, async_add_entities
+            )
 
-                async_add_entities.assert_not_called()
+        mock_connect.assert_not_called()
+        mock_start.assert_called_once()
+        async_add_entities.assert_called_once()
+        assert (
+            "AA:BB:CC:DD:EE:FF"
+            in mock_hass.data[DOMAIN][config_entry.entry_id]["bluetooth_devices"]
+        )
 
     @pytest.mark.asyncio
     async def test_async_setup_bluetooth_entry_with_api_credentials(
@@ -367,17 +523,193 @@ class TestBluetoothSensorPlatformSetup:
             with patch(
                 "custom_components.early.bluetooth_sensor.EarlyBluetoothDevice.connect",
                 return_value=True,
-            ):
+            ), patch(
+                "custom_components.early.bluetooth_sensor.EarlyBluetoothDevice.async_start"
+            ) as mock_start:
                 await async_setup_bluetooth_entry(
                     mock_hass, config_entry, async_add_entities
                 )
 
+                mock_start.assert_called_once()
                 async_add_entities.assert_called_once()
                 entities = async_add_entities.call_args[0][0]
-                assert len(entities) == 3  # Orientation, RSSI, and Current Activity
+                # Orientation, RSSI, Battery, Current Activity, and side times
+                assert len(entities) == 12
                 assert isinstance(entities[0], EarlyTrackerOrientationSensor)
                 assert isinstance(entities[1], EarlyTrackerRSSISensor)
-                assert isinstance(entities[2], EarlyTrackerCurrentActivitySensor)
+                assert isinstance(entities[2], EarlyTrackerBatterySensor)
+                assert isinstance(entities[3], EarlyTrackerCurrentActivitySensor)
+
+    @pytest.mark.asyncio
+    async def test_async_setup_bluetooth_entry_cube_tracking(
+        self, mock_hass, mock_api_token_response, mock_activities_response
+    ):
+        """Test cube-driven tracking is started when enabled."""
+        config_entry = MagicMock()
+        config_entry.entry_id = "test_bt_entry"
+        config_entry.data = {"address": "AA:BB:CC:DD:EE:FF"}
+        config_entry.options = {
+            "api_key": "test_key",
+            "api_secret": "test_secret",
+            "cube_tracking": True,
+        }
+
+        mock_hass.data[DOMAIN] = {config_entry.entry_id: {"bluetooth_devices": {}}}
+
+        token_response = MagicMock()
+        token_response.json.return_value = mock_api_token_response
+        activities_response = MagicMock()
+        activities_response.json.return_value = mock_activities_response
+        mock_hass.async_add_executor_job.side_effect = [
+            token_response,
+            activities_response,
+        ]
+
+        with patch(
+            "custom_components.early.bluetooth_sensor.bluetooth.async_last_service_info",
+            return_value=None,
+        ), patch(
+            "custom_components.early.bluetooth_sensor.EarlyBluetoothDevice.async_start"
+        ), patch(
+            "custom_components.early.bluetooth_sensor.EarlyCubeTracking"
+        ) as mock_cube_tracking, patch(
+            "custom_components.early.bluetooth_sensor.EarlyTrackingJournal"
+        ) as mock_journal:
+            await async_setup_bluetooth_entry(mock_hass, config_entry, MagicMock())
+
+        mock_journal.assert_called_once_with(
+            mock_hass, mock_cube_tracking.call_args[0][2], "test_bt_entry"
+        )
+        mock_journal.return_value.async_start.assert_called_once()
+        assert mock_cube_tracking.call_args[0][3] is mock_journal.return_value
+        assert (
+            mock_hass.data[DOMAIN]["test_bt_entry"]["journal"]
+            is mock_journal.return_value
+        )
+        config_entry.async_on_unload.assert_any_call(
+            mock_journal.return_value.async_stop
+        )
+        mock_cube_tracking.return_value.async_start.assert_called_once()
+        config_entry.async_on_unload.assert_any_call(
+            mock_cube_tracking.return_value.async_stop
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_setup_bluetooth_entry_capture(self, mock_hass):
+        """Test notification capture is started when enabled."""
+        config_entry = MagicMock()
+        config_entry.entry_id = "test_bt_entry"
+        config_entry.data = {"address": "AA:BB:CC:DD:EE:FF"}
+        config_entry.options = {"capture_notifications": True}
+
+        mock_hass.data[DOMAIN] = {config_entry.entry_id: {"bluetooth_devices": {}}}
+
+        with patch(
+            "custom_components.early.bluetooth_sensor.bluetooth.async_last_service_info",
+            return_value=None,
+        ), patch(
+            "custom_components.early.bluetooth_sensor.EarlyBluetoothDevice.async_start"
+        ), patch(
+            "custom_components.early.bluetooth_sensor.EarlyNotificationCapture"
+        ) as mock_capture:
+            await async_setup_bluetooth_entry(mock_hass, config_entry, MagicMock())
+
+        mock_capture.assert_called_once_with(mock_hass, "AA:BB:CC:DD:EE:FF")
+        device = mock_hass.data[DOMAIN]["test_bt_entry"]["bluetooth_devices"][
+            "AA:BB:CC:DD:EE:FF"
+        ]
+        assert device.capture is mock_capture.return_value
+        config_entry.async_on_unload.assert_any_call(
+            mock_capture.return_value.async_stop
+        )
+
+
+class TestEarlyTrackerSideDwellSensor:
+    """Test the EarlyTrackerSideDwellSensor class."""
+
+    @pytest.fixture
+    def dwell(self):
+        """Return a mock dwell tracker."""
+        dwell = MagicMock()
+        dwell.seconds.return_value = 125.4
+        return dwell
+
+    def test_sensor_initialization(self, mock_bluetooth_device_for_sensor, dwell):
+        """Test sensor initialization."""
+        sensor = EarlyTrackerSideDwellSensor(
+            mock_bluetooth_device_for_sensor, MagicMock(), dwell, 3
+        )
+
+        assert sensor._attr_name == "Timeular ZEI Side 3 Today"
+        assert sensor._attr_unique_id == "AA:BB:CC:DD:EE:FF_side_3_today"
+        assert sensor._attr_device_class == SensorDeviceClass.DURATION
+        assert sensor.native_value == 125
+        assert sensor.should_poll is False
+        dwell.seconds.assert_called_with(3)
+
+    @pytest.mark.asyncio
+    async def test_sensor_writes_only_changes(
+        self, mock_bluetooth_device_for_sensor, dwell
+    ):
+        """Test updates write state only when this side's total moved."""
+        sensor = EarlyTrackerSideDwellSensor(
+            mock_bluetooth_device_for_sensor, MagicMock(), dwell, 3
+        )
+        sensor.async_write_ha_state = MagicMock()
+        await sensor.async_added_to_hass()
+        handler = dwell.register_callback.call_args[0][0]
+
+        handler()
+        sensor.async_write_ha_state.assert_not_called()
+
+        dwell.seconds.return_value = 185.0
+        handler()
+        sensor.async_write_ha_state.assert_called_once()
+
+
+class TestHubPlatformSetup:
+    """Test setting up trackers for a hub entry."""
+
+    @pytest.mark.asyncio
+    async def test_hub_trackers_share_platform_and_coordinator(self, mock_hass):
+        """Test adopted trackers get entities on the hub's platform."""
+        config_entry = MagicMock()
+        config_entry.entry_id = "hub_entry"
+        config_entry.options = {}
+        mock_hass.data[DOMAIN] = {config_entry.entry_id: {"bluetooth_devices": {}}}
+        coordinator = MagicMock()
+        async_add_entities = MagicMock()
+
+        with patch(
+            "custom_components.early.bluetooth_sensor.EarlyTrackerHub"
+        ) as mock_hub, patch(
+            "custom_components.early.bluetooth_sensor.bluetooth.async_last_service_info",
+            return_value=None,
+        ), patch(
+            "custom_components.early.bluetooth_sensor.EarlyBluetoothDevice.async_start"
+        ):
+            await async_setup_hub_entry(
+                mock_hass, config_entry, coordinator, async_add_entities
+            )
+            hub = mock_hub.return_value
+            add_tracker = mock_hub.call_args[0][2]
+            for address in ("AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02"):
+                device = add_tracker(address, "Timeular ZEI")
+                assert device.address == address
+
+        hub.async_start.assert_called_once()
+        assert mock_hass.data[DOMAIN][config_entry.entry_id]["hub"] is hub
+        assert async_add_entities.call_count == 2
+        entities = async_add_entities.call_args[0][0]
+        activity = [
+            entity
+            for entity in entities
+            if isinstance(entity, EarlyTrackerCurrentActivitySensor)
+        ]
+        assert activity[0]._coordinator is coordinator
+        assert set(
+            mock_hass.data[DOMAIN][config_entry.entry_id]["bluetooth_devices"]
+        ) == {"AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02"}
 
 
 class TestEarlyTrackerCurrentActivitySensor:
@@ -546,24 +878,25 @@ class TestEarlyTrackerCurrentActivitySensor:
     async def test_sensor_will_remove_from_hass(
         self, mock_bluetooth_device, mock_config_entry_bt, mock_coordinator
     ):
-        """Test sensor removal."""
+        """Test sensor removal unsubscribes from the device."""
         sensor = EarlyTrackerCurrentActivitySensor(
             mock_bluetooth_device, mock_config_entry_bt, mock_coordinator
         )
-        mock_bluetooth_device.unregister_callback = MagicMock()
+        await sensor.async_added_to_hass()
 
-        await sensor.async_will_remove_from_hass()
+        sensor._call_on_remove_callbacks()
 
-        mock_bluetooth_device.unregister_callback.assert_called_once()
+        assert len(mock_bluetooth_device._callbacks) == 0
 
-    def test_sensor_callback_registration(
+    @pytest.mark.asyncio
+    async def test_sensor_callback_registration(
         self, mock_bluetooth_device, mock_config_entry_bt, mock_coordinator
     ):
-        """Test callback is registered during initialization."""
-        mock_bluetooth_device.register_callback = MagicMock()
-
+        """Test callback is registered when the entity is added."""
         sensor = EarlyTrackerCurrentActivitySensor(
             mock_bluetooth_device, mock_config_entry_bt, mock_coordinator
         )
 
-        mock_bluetooth_device.register_callback.assert_called_once()
+        await sensor.async_added_to_hass()
+
+        assert sensor._handle_orientation_change in mock_bluetooth_device._callbacks
@@ -0,0 +1,216 @@
+"""Test the EARLY notification capture and replay."""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.early.bluetooth import EarlyBluetoothDevice
+from custom_components.early.capture import (
+    EarlyNotificationCapture,
+    async_replay_capture,
+    read_capture,
+)
+from custom_components.early.const import CAPTURE_DIRECTORY
+
+
+@pytest.fixture
+def hass(mock_hass, tmp_path):
+    """Return a mock hass with a real config directory and executor."""
+    mock_hass.config = MagicMock()
+    mock_hass.config.path = lambda *parts: os.path.join(tmp_path, *parts)
+    mock_hass.async_add_executor_job = AsyncMock(
+        side_effect=lambda target, *args: target(*args)
+    )
+    return mock_hass
+
+
+@pytest.fixture
+def clock():
+    """Patch the monotonic clock used by the capture."""
+    now = [1000.0]
+    with patch(
+        "custom_components.early.capture.time.monotonic",
+        side_effect=lambda: now[0],
+    ):
+        yield now
+
+
+@pytest.fixture
+def mock_call_later():
+    """Patch the flush timer."""
+    with patch("custom_components.early.capture.async_call_later") as call_later:
+        yield call_later
+
+
+class TestEarlyNotificationCapture:
+    """Test recording notifications to a capture file."""
+
+    @pytest.mark.asyncio
+    async def test_capture_round_trip(self, hass, clock, mock_call_later):
+        """Test recorded notifications read back with their timing."""
+        capture = EarlyNotificationCapture(hass, "AA:BB:CC:DD:EE:FF")
+        capture.record(1000.5, bytearray([3]))
+        capture.record(1002.0, bytearray([5]))
+        await capture.async_stop()
+
+        assert os.path.dirname(capture.path).endswith(CAPTURE_DIRECTORY)
+        assert os.path.basename(capture.path).startswith("aabbccddeeff-")
+        assert capture.records == 2
+        assert read_capture(capture.path) == [(0.5, b"\x03"), (2.0, b"\x05")]
+        # Header plus one 10-byte record per single-byte notification
+        assert os.path.getsize(capture.path) == 12 + 2 * 10
+
+    @pytest.mark.asyncio
+    async def test_flush_timer(self, hass, clock, mock_call_later):
+        """Test one flush is scheduled for a burst and appends to the file."""
+        capture = EarlyNotificationCapture(hass, "AA:BB:CC:DD:EE:FF")
+        capture.record(1000.1, bytearray([1]))
+        capture.record(1000.2, bytearray([2]))
+
+        mock_call_later.assert_called_once()
+        flush = hass.async_create_background_task
+        mock_call_later.call_args[0][2](None)
+        await flush.call_args[0][0]
+
+        capture.record(1000.3, bytearray([3]))
+        assert mock_call_later.call_count == 2
+        await capture.async_stop()
+
+        assert [payload for _, payload in read_capture(capture.path)] == [
+            b"\x01",
+            b"\x02",
+            b"\x03",
+        ]
+        mock_call_later.return_value.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_size_limit(self, hass, clock, mock_call_later):
+        """Test recording stops at the size limit."""
+        capture = EarlyNotificationCapture(hass, "AA:BB:CC:DD:EE:FF", max_bytes=32)
+        for face in range(5):
+            capture.record(1000.0, bytearray([face]))
+        await capture.async_stop()
+
+        assert capture.records == 2
+        assert len(read_capture(capture.path)) == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_without_records(self, hass, clock, mock_call_later):
+        """Test stopping writes the header so the capture is readable."""
+        capture = EarlyNotificationCapture(hass, "AA:BB:CC:DD:EE:FF")
+        await capture.async_stop()
+        capture.record(1001.0, bytearray([1]))
+
+        assert read_capture(capture.path) == []
+        assert capture.records == 0
+
+    def test_read_truncated_capture(self, tmp_path):
+        """Test a record cut short ends the capture."""
+        path = tmp_path / "capture.ezc"
+        path.write_bytes(
+            b"EZC1"
+            + bytes(8)
+            + bytes(8)
+            + b"\x01\x04"
+            + bytes(8)
+            + b"\x05"  # Length byte without its payload
+        )
+
+        assert read_capture(str(path)) == [(0.0, b"\x04")]
+
+    def test_read_not_a_capture(self, tmp_path):
+        """Test reading a file that is not a capture."""
+        path = tmp_path / "capture.ezc"
+        path.write_bytes(b"not a capture")
+
+        with pytest.raises(ValueError):
+            read_capture(str(path))
+
+    def test_device_records_notifications(self, mock_hass, mock_ble_device):
+        """Test the device records every raw notification, even empty ones."""
+        capture = MagicMock()
+        device = EarlyBluetoothDevice(
+            mock_hass, mock_ble_device, None, settle_time=0, capture=capture
+        )
+
+        device._on_orientation_changed(0, bytearray([4]))
+        device._on_orientation_changed(0, bytearray())
+
+        assert [args[0][1] for args in capture.record.call_args_list] == [
+            bytearray([4]),
+            bytearray(),
+        ]
+        assert device.capture is capture
+
+
+class TestReplayCapture:
+    """Test replaying a capture through a device."""
+
+    @pytest.fixture
+    def device(self, mock_hass, mock_ble_device):
+        """Return a device that commits every face immediately."""
+        return EarlyBluetoothDevice(
+            mock_hass, mock_ble_device, None, min_update_interval=0, settle_time=0
+        )
+
+    @pytest.mark.asyncio
+    async def test_replay_accelerated(self, device):
+        """Test a replay at speed 0 feeds every notification in order."""
+        with patch("custom_components.early.capture.asyncio.sleep") as mock_sleep:
+            await async_replay_capture(
+                device, [(10.0, b"\x02"), (20.0, b"\x05"), (30.0, b"\x07")], speed=0
+            )
+
+        mock_sleep.assert_not_called()
+        assert device.orientation == 7
+        assert [face for _, face in device.orientation_history.snapshot()] == [
+            2,
+            5,
+            7,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_replay_timing(self, device):
+        """Test a replay keeps the captured spacing, scaled by speed."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        await async_replay_capture(device, [(5.0, b"\x02"), (5.1, b"\x03")], speed=2.0)
+
+        assert loop.time() - start >= 0.05
+        assert device.orientation == 3
+
+    @pytest.mark.asyncio
+    async def test_replay_not_recorded(
+        self, mock_hass, mock_ble_device, hass, clock, mock_call_later
+    ):
+        """Test a replay is not recorded into the tracker's own capture."""
+        capture = EarlyNotificationCapture(hass, "AA:BB:CC:DD:EE:FF")
+        device = EarlyBluetoothDevice(
+            mock_hass,
+            mock_ble_device,
+            None,
+            min_update_interval=0,
+            settle_time=0,
+            capture=capture,
+        )
+        device._on_orientation_changed(0, bytearray([1]))
+
+        await async_replay_capture(device, [(0.0, b"\x02"), (1.0, b"\x03")], speed=0)
+        device._on_orientation_changed(0, bytearray([4]))
+
+        assert device.orientation == 4
+        await capture.async_stop()
+        assert [payload for _, payload in read_capture(capture.path)] == [
+            b"\x01",
+            b"\x04",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_replay_nothing(self, device):
+        """Test replaying an empty capture."""
+        await async_replay_capture(device, [])
+
+        assert device.orientation == 0
@@ -8,12 +8,27 @@ from homeassistant.const import CONF_API_KEY
 from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.early.config_flow import (
+    STEP_USER_DATA_SCHEMA,
     CannotConnect,
     ConfigFlow,
     InvalidAuth,
+    OptionsFlowHandler,
     validate_input,
 )
-from custom_components.early.const import CONF_API_SECRET, DOMAIN
+from custom_components.early.const import (
+    CONF_API_SECRET,
+    CONF_CONNECTION_MODE,
+    CONF_HUB,
+    CONF_LINGER_TIME,
+    CONF_LIVENESS_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_POLL_INTERVAL,
+    CONF_SETTLE_HYSTERESIS,
+    CONF_SETTLE_TIME,
+    CONNECTION_MODE_ON_DEMAND,
+    CONNECTION_MODE_PERSISTENT,
+    DOMAIN,
+)
 
 
 class TestConfigFlow:
@@ -316,6 +331,30 @@ class TestConfigFlow:
                     mock_set_unique.assert_called_once_with(discovery_info.address)
                     mock_abort.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_bluetooth_managed_by_hub(self, mock_hass):
+        """Test discovery aborts when a hub entry adopts trackers itself."""
+        flow = ConfigFlow()
+        flow.hass = mock_hass
+        hub_entry = MagicMock(data={CONF_API_KEY: "key", CONF_HUB: True})
+
+        discovery_info = MagicMock()
+        discovery_info.address = "AA:BB:CC:DD:EE:FF"
+
+        with patch.object(flow, "async_set_unique_id"), patch.object(
+            flow, "_abort_if_unique_id_configured"
+        ), patch.object(flow, "_async_current_entries", return_value=[hub_entry]):
+            result = await flow.async_step_bluetooth(discovery_info)
+
+        assert result["type"] == FlowResultType.ABORT
+        assert result["reason"] == "managed_by_hub"
+
+    def test_user_schema_hub_defaults_off(self):
+        """Test hub mode is opt-in on the account form."""
+        data = STEP_USER_DATA_SCHEMA({CONF_API_KEY: "key", CONF_API_SECRET: "secret"})
+
+        assert data[CONF_HUB] is False
+
     @pytest.mark.asyncio
     async def test_bluetooth_api_step_shows_form(self, mock_hass, mock_ble_device):
         """Test bluetooth API step shows form."""
@@ -470,3 +509,63 @@ class TestConfigFlow:
 
             assert result["type"] == FlowResultType.FORM
             assert result["errors"] == {"base": "cannot_connect"}
+
+
+class TestOptionsFlow:
+    """Test the Bluetooth tracker options flow."""
+
+    def _flow(self, mock_hass, config_entry):
+        """Return an options flow bound to config_entry."""
+        flow = OptionsFlowHandler()
+        flow.hass = mock_hass
+        return flow, patch.object(
+            OptionsFlowHandler, "config_entry", config_entry, create=True
+        )
+
+    def test_supports_options_flow(
+        self, mock_config_entry, mock_bluetooth_config_entry
+    ):
+        """Test only entries that manage trackers offer options."""
+        assert ConfigFlow.async_supports_options_flow(mock_bluetooth_config_entry)
+        assert not ConfigFlow.async_supports_options_flow(mock_config_entry)
+        hub_entry = MagicMock(data={**mock_config_entry.data, CONF_HUB: True})
+        assert ConfigFlow.async_supports_options_flow(hub_entry)
+
+    @pytest.mark.asyncio
+    async def test_options_form_defaults(self, mock_hass, mock_bluetooth_config_entry):
+        """Test the form defaults to persistent mode."""
+        flow, bound = self._flow(mock_hass, mock_bluetooth_config_entry)
+
+        with bound:
+            result = await flow.async_step_init()
+
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "init"
+        defaults = result["data_schema"]({})
+        assert defaults[CONF_CONNECTION_MODE] == CONNECTION_MODE_PERSISTENT
+        assert defaults[CONF_SETTLE_TIME] == 250
+        assert defaults[CONF_SETTLE_HYSTERESIS] == 0
+        assert defaults[CONF_LIVENESS_INTERVAL] == 300
+
+    @pytest.mark.asyncio
+    async def test_options_preserve_api_credentials(
+        self, mock_hass, mock_bluetooth_config_entry_with_api
+    ):
+        """Test saving options keeps the API credentials."""
+        flow, bound = self._flow(mock_hass, mock_bluetooth_config_entry_with_api)
+
+        with bound:
+            result = await flow.async_step_init(
+                user_input={
+                    CONF_CONNECTION_MODE: CONNECTION_MODE_ON_DEMAND,
+                    CONF_POLL_INTERVAL: 600,
+                    CONF_LINGER_TIME: 0,
+                    CONF_MIN_UPDATE_INTERVAL: 0.5,
+                }
+            )
+
+        assert result["type"] == FlowResultType.CREATE_ENTRY
+        assert result["data"][CONF_CONNECTION_MODE] == CONNECTION_MODE_ON_DEMAND
+        assert result["data"][CONF_POLL_INTERVAL] == 600
+        assert result["data"][CONF_API_KEY] == "test_api_key"
+        assert result["data"][CONF_API_SECRET] == "test_api_secret"
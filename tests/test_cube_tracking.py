@@ -0,0 +1,334 @@
+"""Test EARLY cube-driven tracking."""
+
+import asyncio
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import requests
+from homeassistant.util import dt as dt_util
+
+from custom_components.early.bluetooth import EarlyBluetoothDevice
+from custom_components.early.cube_tracking import EarlyCubeTracking
+
+
+@pytest.fixture
+def mock_device():
+    """Return a connected tracker wrapper."""
+    device = MagicMock(spec=EarlyBluetoothDevice)
+    device.address = "AA:BB:CC:DD:EE:FF"
+    device.available = True
+    device.orientation = 0
+    return device
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Return a coordinator with sides 1 and 2 mapped."""
+    coordinator = MagicMock()
+    coordinator.get_all_activities.return_value = {
+        "activity_1": "Working",
+        "activity_2": "Meeting",
+    }
+    coordinator.get_activity_id_by_device_side.side_effect = {
+        1: "activity_1",
+        2: "activity_2",
+    }.get
+    # Nothing is running until a test says otherwise via _running()
+    coordinator.async_get_current_tracking = AsyncMock(return_value=None)
+    coordinator.start_tracking = AsyncMock()
+    coordinator.stop_tracking = AsyncMock()
+    coordinator.async_fetch_activities = AsyncMock()
+    return coordinator
+
+
+@pytest.fixture
+def cube_tracking(mock_hass, mock_device, mock_coordinator):
+    """Return cube tracking running its commands as real tasks."""
+    mock_hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: asyncio.create_task(coro)
+    )
+    cube_tracking = EarlyCubeTracking(mock_hass, mock_device, mock_coordinator)
+    cube_tracking.async_start()
+    return cube_tracking
+
+
+def _running(mock_coordinator, activity_id):
+    """Set the activity the API reports as running."""
+    mock_coordinator.async_get_current_tracking.return_value = (
+        {"activity": {"id": activity_id}} if activity_id else None
+    )
+
+
+def _flip(cube_tracking, mock_device, side):
+    """Report a settled side to cube tracking."""
+    mock_device.orientation = side
+    cube_tracking._async_orientation_changed()
+
+
+class TestEarlyCubeTracking:
+    """Test the EarlyCubeTracking class."""
+
+    def test_start_registers_callback(self, cube_tracking, mock_device):
+        """Test cube tracking follows orientation callbacks."""
+        mock_device.register_callback.assert_called_once_with(
+            cube_tracking._async_orientation_changed
+        )
+
+    def test_stop_unregisters_callback(self, cube_tracking, mock_device):
+        """Test stopping removes the callback through its handle."""
+        cube_tracking.async_stop()
+
+        mock_device.register_callback.return_value.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_mapped_side_starts_tracking(
+        self, cube_tracking, mock_device, mock_coordinator
+    ):
+        """Test flipping to a mapped side starts its activity."""
+        _flip(cube_tracking, mock_device, 1)
+        await cube_tracking._task
+
+        mock_coordinator.start_tracking.assert_called_once_with("activity_1")
+        mock_coordinator.stop_tracking.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resting_side_stops_tracking(
+        self, cube_tracking, mock_device, mock_coordinator
+    ):
+        """Test returning the tracker to its base stops tracking."""
+        _running(mock_coordinator, "activity_1")
+        mock_device.orientation = 1
+        cube_tracking._side = 1
+
+        _flip(cube_tracking, mock_device, 0)
+        await cube_tracking._task
+
+        mock_coordinator.stop_tracking.assert_called_once()
+        mock_coordinator.start_tracking.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unmapped_side_stops_tracking(
+        self, cube_tracking, mock_device, mock_coordinator
+    ):
+        """Test a side without an activity stops tracking."""
+        _running(mock_coordinator, "activity_2")
+
+        _flip(cube_tracking, mock_device, 7)
+        await cube_tracking._task
+
+        mock_coordinator.stop_tracking.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_already_tracking_is_not_restarted(
+        self, cube_tracking, mock_device, mock_coordinator
+    ):
+        """Test the first side is reconciled against the API state."""
+        _running(mock_coordinator, "activity_2")
+
+        _flip(cube_tracking, mock_device, 2)
+        await cube_tracking._task
+
+        mock_coordinator.start_tracking.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_running_activity_fetched_once(
+        self, cube_tracking, mock_device, mock_coordinator
+    ):
+        """Test the API is asked for the running activity, not the poll cache."""
+        _running(mock_coordinator, "activity_1")
+
+        _flip(cube_tracking, mock_device, 1)
+        await cube_tracking._task
+        _flip(cube_tracking, mock_device, 2)
+        await cube_tracking._task
+
+        mock_coordinator.async_get_current_tracking.assert_called_once()
+        mock_coordinator.start_tracking.assert_called_once_with("activity_2")
+
+    @pytest.mark.asyncio
+    async def test_running_activity_unknown_when_offline(
+        self, cube_tracking, mock_device, mock_coordinator
+    ):
+        """Test the side is sent when the running activity can't be fetched."""
+        mock_coordinator.async_get_current_tracking.side_effect = (
+            requests.exceptions.ConnectionError()
+        )
+
+        _flip(cube_tracking, mock_device, 1)
+        await cube_tracking._task
+
+        mock_coordinator.start_tracking.assert_called_once_with("activity_1")
+
+    @pytest.mark.asyncio
+    async def test_rapid_flips_last_writer_wins(
+        self, cube_tracking, mock_device, mock_coordinator
+    ):
+        """Test flips during an API call collapse into the final side."""
+        release = asyncio.Event()
+
+        async def _slow_start(activity_id):
+            await release.wait()
+
+        mock_coordinator.start_tracking.side_effect = _slow_start
+
+        _flip(cube_tracking, mock_device, 1)
+        await asyncio.sleep(0)
+        _flip(cube_tracking, mock_device, 5)
+        _flip(cube_tracking, mock_device, 0)
+        _flip(cube_tracking, mock_device, 2)
+        task = cube_tracking._task
+        release.set()
+        await task
+
+        assert mock_coordinator.start_tracking.call_args_list == [
+            (("activity_1",),),
+            (("activity_2",),),
+        ]
+        mock_coordinator.stop_tracking.assert_not_called()
+        assert cube_tracking._task is None
+
+    @pytest.mark.asyncio
+    async def test_repeated_callbacks_ignored(
+        self, cube_tracking, mock_device, mock_coordinator
+    ):
+        """Test callbacks without a side change send nothing."""
+        _flip(cube_tracking, mock_device, 1)
+        await cube_tracking._task
+
+        cube_tracking._async_orientation_changed()
+
+        assert cube_tracking._task is None
+        mock_coordinator.start_tracking.assert_called_once()
+
+    def test_unavailable_device_ignored(
+        self, cube_tracking, mock_device, mock_coordinator
+    ):
+        """Test callbacks fired on disconnect send nothing."""
+        mock_device.available = False
+
+        cube_tracking._async_orientation_changed()
+
+        assert cube_tracking._task is None
+
+    @pytest.mark.asyncio
+    async def test_activities_fetched_when_missing(
+        self, cube_tracking, mock_device, mock_coordinator
+    ):
+        """Test the side index is loaded before the first lookup."""
+        mock_coordinator.get_all_activities.return_value = {}
+
+        _flip(cube_tracking, mock_device, 1)
+        await cube_tracking._task
+
+        mock_coordinator.async_fetch_activities.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_command_reconciles_next_time(
+        self, cube_tracking, mock_device, mock_coordinator
+    ):
+        """Test a failed call falls back to the API state for the next flip."""
+        mock_coordinator.start_tracking.side_effect = (
+            requests.exceptions.ConnectionError()
+        )
+
+        _flip(cube_tracking, mock_device, 1)
+        await cube_tracking._task
+        mock_coordinator.start_tracking.side_effect = None
+        _running(mock_coordinator, "activity_2")
+        _flip(cube_tracking, mock_device, 2)
+        await cube_tracking._task
+
+        assert mock_coordinator.start_tracking.call_count == 1
+
+
+class TestCubeTrackingJournal:
+    """Test cube-driven tracking with an offline journal."""
+
+    @pytest.fixture
+    def mock_journal(self):
+        """Return an empty journal."""
+        journal = MagicMock()
+        journal.pending = 0
+        journal.async_append = AsyncMock()
+        return journal
+
+    @pytest.fixture
+    def cube_tracking(self, mock_hass, mock_device, mock_coordinator, mock_journal):
+        """Return cube tracking with a journal."""
+        mock_hass.async_create_background_task = MagicMock(
+            side_effect=lambda coro, name: asyncio.create_task(coro)
+        )
+        cube_tracking = EarlyCubeTracking(
+            mock_hass, mock_device, mock_coordinator, mock_journal
+        )
+        cube_tracking.async_start()
+        return cube_tracking
+
+    @pytest.mark.asyncio
+    async def test_failed_command_journaled(
+        self, cube_tracking, mock_device, mock_coordinator, mock_journal
+    ):
+        """Test a failed command is journaled with when the side came up."""
+        mock_coordinator.start_tracking.side_effect = (
+            requests.exceptions.ConnectionError()
+        )
+        mock_device.orientation_history.latest.return_value = (
+            time.monotonic() - 30,
+            1,
+        )
+
+        before = dt_util.utcnow()
+        _flip(cube_tracking, mock_device, 1)
+        await cube_tracking._task
+
+        side, activity_id, at = mock_journal.async_append.call_args[0]
+        assert (side, activity_id) == (1, "activity_1")
+        assert before - timedelta(seconds=31) < at < before - timedelta(seconds=29)
+
+    @pytest.mark.asyncio
+    async def test_flips_join_pending_journal(
+        self, cube_tracking, mock_device, mock_coordinator, mock_journal
+    ):
+        """Test flips while the journal is pending are kept in order behind it."""
+        mock_journal.pending = 1
+
+        _flip(cube_tracking, mock_device, 2)
+        await cube_tracking._task
+        _flip(cube_tracking, mock_device, 0)
+        await cube_tracking._task
+
+        mock_coordinator.start_tracking.assert_not_called()
+        mock_coordinator.stop_tracking.assert_not_called()
+        assert [args[0][:2] for args in mock_journal.async_append.call_args_list] == [
+            (2, "activity_2"),
+            (0, None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rejected_command_not_journaled(
+        self, cube_tracking, mock_device, mock_coordinator, mock_journal
+    ):
+        """Test a command the API rejects is dropped, not retried forever."""
+        mock_coordinator.start_tracking.side_effect = requests.exceptions.HTTPError(
+            response=MagicMock(status_code=404)
+        )
+
+        _flip(cube_tracking, mock_device, 1)
+        await cube_tracking._task
+
+        mock_journal.async_append.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_activities_journaled(
+        self, cube_tracking, mock_device, mock_coordinator, mock_journal
+    ):
+        """Test a side is journaled unresolved when activities can't be loaded."""
+        mock_coordinator.get_all_activities.return_value = {}
+
+        _flip(cube_tracking, mock_device, 1)
+        await cube_tracking._task
+
+        mock_coordinator.stop_tracking.assert_not_called()
+        assert mock_journal.async_append.call_args[0][:2] == (1, None)
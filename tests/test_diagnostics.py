@@ -0,0 +1,95 @@
+"""Test the EARLY diagnostics."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.early.bluetooth import EarlyBluetoothDevice
+from custom_components.early.const import DOMAIN
+from custom_components.early.diagnostics import async_get_config_entry_diagnostics
+from custom_components.early.scheduler import async_get_connection_scheduler
+
+
+class TestDiagnostics:
+    """Test the config entry diagnostics."""
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_redacts_credentials(
+        self, mock_hass, mock_bluetooth_config_entry_with_api
+    ):
+        """Test API credentials are redacted."""
+        mock_hass.data[DOMAIN] = {
+            mock_bluetooth_config_entry_with_api.entry_id: {"bluetooth_devices": {}}
+        }
+
+        result = await async_get_config_entry_diagnostics(
+            mock_hass, mock_bluetooth_config_entry_with_api
+        )
+
+        assert result["entry"]["data"] == {"address": "AA:BB:CC:DD:EE:FF"}
+        assert result["entry"]["options"]["api_key"] == "**REDACTED**"
+        assert result["entry"]["options"]["api_secret"] == "**REDACTED**"
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_bluetooth_device(
+        self, mock_hass, mock_ble_device, mock_bluetooth_config_entry
+    ):
+        """Test connection metrics are reported per tracker."""
+        device = EarlyBluetoothDevice(mock_hass, mock_ble_device, MagicMock())
+        device._orientation = 4
+        mock_hass.data[DOMAIN] = {
+            mock_bluetooth_config_entry.entry_id: {
+                "bluetooth_devices": {"AA:BB:CC:DD:EE:FF": device}
+            }
+        }
+
+        result = await async_get_config_entry_diagnostics(
+            mock_hass, mock_bluetooth_config_entry
+        )
+
+        tracker = result["bluetooth_devices"]["AA:BB:CC:DD:EE:FF"]
+        assert tracker["connected"] is False
+        assert tracker["orientation"] == 4
+        assert tracker["connection"]["state"] == "stopped"
+        assert tracker["connection"]["reconnect_count"] == 0
+        assert tracker["connection"]["liveness_probes"] == 0
+        assert tracker["connection"]["last_first_state_latency"] is None
+        assert tracker["listeners"] == {"orientation": 0, "rssi": 0, "battery": 0}
+        assert tracker["history"]["capacity"] == 1024
+        assert tracker["history"]["total_events"] == 0
+        assert tracker["history"]["recent"] == []
+        assert tracker["capture"] is None
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_without_entry_data(self, mock_hass, mock_config_entry):
+        """Test diagnostics for an entry that has not been set up."""
+        result = await async_get_config_entry_diagnostics(mock_hass, mock_config_entry)
+
+        assert result["bluetooth_devices"] == {}
+        assert result["time_entries"] is None
+        assert result["time_entry_database"] is None
+        assert result["connection_scheduler"] == {}
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_time_entries(self, mock_hass, mock_config_entry):
+        """Test the time-entries sync state is reported."""
+        sync = MagicMock()
+        sync.stats = {"cursor": None, "last_fetched": 0}
+        mock_hass.data[DOMAIN] = {mock_config_entry.entry_id: {"time_entries": sync}}
+
+        result = await async_get_config_entry_diagnostics(mock_hass, mock_config_entry)
+
+        assert result["time_entries"] == {"cursor": None, "last_fetched": 0}
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_connection_scheduler(
+        self, mock_hass, mock_bluetooth_config_entry
+    ):
+        """Test shared connection slot usage is reported."""
+        scheduler = async_get_connection_scheduler(mock_hass)
+        async with scheduler.async_slot("proxy-1"):
+            result = await async_get_config_entry_diagnostics(
+                mock_hass, mock_bluetooth_config_entry
+            )
+
+        assert result["connection_scheduler"] == {"proxy-1": {"active": 1, "queued": 0}}
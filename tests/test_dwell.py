@@ -0,0 +1,157 @@
+"""Test the EARLY per-side dwell time tracker."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.early.bluetooth import EarlyBluetoothDevice
+from custom_components.early.dwell import EarlyDwellTracker
+
+DAY = datetime(2024, 3, 1, 12, 0)
+
+
+@pytest.fixture
+def clock():
+    """Patch the monotonic clock for the device and the dwell tracker."""
+    clock = [1000.0]
+    with patch(
+        "custom_components.early.bluetooth.time.monotonic",
+        side_effect=lambda: clock[0],
+    ), patch(
+        "custom_components.early.dwell.time.monotonic",
+        side_effect=lambda: clock[0],
+    ):
+        yield clock
+
+
+@pytest.fixture
+def wall_clock():
+    """Patch local wall-clock time for the midnight reset."""
+    now = [DAY]
+    with patch(
+        "custom_components.early.dwell.dt_util.now", side_effect=lambda: now[0]
+    ), patch(
+        "custom_components.early.dwell.dt_util.start_of_local_day",
+        side_effect=lambda value: value.replace(hour=0, minute=0, second=0),
+    ):
+        yield now
+
+
+@pytest.fixture
+def device(mock_hass, mock_ble_device, clock):
+    """Return a connected device with immediate dispatch and settling."""
+    device = EarlyBluetoothDevice(
+        mock_hass,
+        mock_ble_device,
+        MagicMock(rssi=-50),
+        min_update_interval=0,
+        settle_time=0,
+    )
+    device._client = MagicMock(is_connected=True)
+    return device
+
+
+@pytest.fixture
+def dwell(mock_hass, device, wall_clock):
+    """Return a started dwell tracker."""
+    dwell = EarlyDwellTracker(mock_hass, device)
+    dwell.async_start()
+    yield dwell
+    dwell.async_stop()
+
+
+class TestEarlyDwellTracker:
+    """Test the EarlyDwellTracker class."""
+
+    def test_running_face_accumulates_on_read(self, device, dwell, clock):
+        """Test the face that is up counts its open interval when read."""
+        device._on_orientation_changed(0, bytearray([2]))
+        clock[0] += 90
+
+        assert dwell.running_face == 2
+        assert dwell.seconds(2) == pytest.approx(90)
+        assert dwell.seconds(3) == 0
+
+    def test_face_change_closes_interval(self, device, dwell, clock):
+        """Test a committed change credits the previous face."""
+        device._on_orientation_changed(0, bytearray([2]))
+        clock[0] += 60
+        device._on_orientation_changed(0, bytearray([5]))
+        clock[0] += 30
+        device._on_orientation_changed(0, bytearray([2]))
+        clock[0] += 15
+
+        assert dwell.seconds(2) == pytest.approx(75)
+        assert dwell.seconds(5) == pytest.approx(30)
+
+    def test_totals_do_not_scan_history(self, device, dwell, clock):
+        """Test totals are read without iterating the orientation history."""
+        device._on_orientation_changed(0, bytearray([1]))
+        clock[0] += 10
+
+        with patch.object(
+            type(device.orientation_history), "snapshot", side_effect=AssertionError
+        ):
+            assert dwell.seconds(1) == pytest.approx(10)
+
+    def test_time_away_not_counted(self, device, dwell, clock):
+        """Test a disconnected tracker does not accumulate time."""
+        device._on_orientation_changed(0, bytearray([4]))
+        clock[0] += 20
+        device._client = None
+        device._fire_callbacks()
+        clock[0] += 600
+        device._client = MagicMock(is_connected=True)
+        device._fire_callbacks()
+        clock[0] += 5
+
+        assert dwell.seconds(4) == pytest.approx(25)
+
+    def test_reset_at_midnight(self, device, dwell, clock, wall_clock):
+        """Test totals restart at local midnight, splitting the running face."""
+        device._on_orientation_changed(0, bytearray([3]))
+        clock[0] += 120
+        device._on_orientation_changed(0, bytearray([6]))
+        # 11:59:00 PM until 00:01:00 AM with side 6 up
+        wall_clock[0] = DAY.replace(hour=23, minute=59)
+        clock[0] += 60
+        wall_clock[0] = DAY.replace(hour=0, minute=1) + timedelta(days=1)
+        clock[0] += 120
+
+        assert dwell.seconds(3) == 0
+        assert dwell.seconds(6) == pytest.approx(60)
+
+    def test_tick_notifies_while_face_up(self, mock_hass, device, dwell):
+        """Test the shared tick refreshes listeners only while a face is up."""
+        device._client = None
+        device._fire_callbacks()
+        listener = MagicMock()
+        with patch(
+            "custom_components.early.dwell.async_track_time_interval"
+        ) as mock_track:
+            dwell.register_callback(listener)
+        tick = mock_track.call_args[0][1]
+
+        tick(None)
+        listener.assert_not_called()
+
+        device._client = MagicMock(is_connected=True)
+        device._fire_callbacks()
+        listener.reset_mock()
+        tick(None)
+        listener.assert_called_once()
+
+    def test_one_tick_for_all_listeners(self, dwell):
+        """Test listeners share one timer, cancelled with the last of them."""
+        with patch(
+            "custom_components.early.dwell.async_track_time_interval"
+        ) as mock_track:
+            remove_first = dwell.register_callback(MagicMock())
+            remove_second = dwell.register_callback(MagicMock())
+
+            mock_track.assert_called_once()
+            remove_first()
+            mock_track.return_value.assert_not_called()
+            remove_second()
+            mock_track.return_value.assert_called_once()
@@ -0,0 +1,85 @@
+"""Test the EARLY orientation history ring buffer."""
+
+import pytest
+
+from custom_components.early.history import EarlyOrientationHistory
+
+
+class TestEarlyOrientationHistory:
+    """Test the EarlyOrientationHistory class."""
+
+    def test_empty(self):
+        """Test a new history holds no events."""
+        history = EarlyOrientationHistory(capacity=4)
+
+        assert len(history) == 0
+        assert history.latest() is None
+        assert list(history.snapshot()) == []
+
+    def test_append_in_order(self):
+        """Test events are returned oldest first."""
+        history = EarlyOrientationHistory(capacity=4)
+        history.append(1.0, 3)
+        history.append(2.5, 5)
+
+        assert len(history) == 2
+        assert history.latest() == (2.5, 5)
+        assert list(history.snapshot()) == [(1.0, 3), (2.5, 5)]
+
+    def test_wraps_at_capacity(self):
+        """Test the oldest events are overwritten once full."""
+        history = EarlyOrientationHistory(capacity=3)
+        for second in range(5):
+            history.append(float(second), second + 1)
+
+        assert len(history) == 3
+        assert history.total == 5
+        assert list(history.snapshot()) == [(2.0, 3), (3.0, 4), (4.0, 5)]
+
+    def test_memory_is_bounded(self):
+        """Test storage is preallocated and does not grow with events."""
+        history = EarlyOrientationHistory(capacity=8)
+        size = (len(history._timestamps), len(history._faces))
+        for second in range(1000):
+            history.append(float(second), second % 9)
+
+        assert (len(history._timestamps), len(history._faces)) == size
+
+    def test_snapshot_excludes_later_events(self):
+        """Test events appended after the snapshot are not included."""
+        history = EarlyOrientationHistory(capacity=4)
+        history.append(1.0, 1)
+        snapshot = history.snapshot()
+
+        history.append(2.0, 2)
+
+        assert len(snapshot) == 1
+        assert list(snapshot) == [(1.0, 1)]
+
+    def test_snapshot_skips_overwritten_events(self):
+        """Test events overwritten after the snapshot are dropped, not corrupted."""
+        history = EarlyOrientationHistory(capacity=3)
+        for second in range(3):
+            history.append(float(second), second + 1)
+        snapshot = history.snapshot()
+
+        history.append(3.0, 4)
+        history.append(4.0, 5)
+
+        assert list(snapshot) == [(2.0, 3)]
+
+    def test_recent_and_since(self):
+        """Test the tail and time-window helpers."""
+        history = EarlyOrientationHistory(capacity=8)
+        for second in range(5):
+            history.append(float(second), second + 1)
+        snapshot = history.snapshot()
+
+        assert snapshot.recent(2) == [(3.0, 4), (4.0, 5)]
+        assert snapshot.recent(10) == list(snapshot)
+        assert snapshot.since(3.0) == [(3.0, 4), (4.0, 5)]
+
+    def test_invalid_capacity(self):
+        """Test a history must hold at least one event."""
+        with pytest.raises(ValueError):
+            EarlyOrientationHistory(capacity=0)
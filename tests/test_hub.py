@@ -0,0 +1,197 @@
+"""Test the EARLY tracker hub."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.components.bluetooth import BluetoothChange
+
+from custom_components.early.const import BLE_SERVICE_UUID, DEVICE_NAME_PREFIX, DOMAIN
+from custom_components.early.hub import EarlyTrackerHub
+
+
+def _service_info(address, name="Timeular ZEI"):
+    """Return a mock advertisement."""
+    service_info = MagicMock()
+    service_info.address = address
+    service_info.name = name
+    service_info.service_uuids = []
+    return service_info
+
+
+@pytest.fixture
+def hub_entry(mock_hass):
+    """Return a hub entry with its hass data in place."""
+    entry = MagicMock()
+    entry.entry_id = "hub_entry"
+    mock_hass.data[DOMAIN] = {entry.entry_id: {"bluetooth_devices": {}}}
+    mock_hass.config_entries.async_entries.return_value = [entry]
+    return entry
+
+
+@pytest.fixture
+def add_tracker(mock_hass, hub_entry):
+    """Return a tracker factory that records devices like the platform does."""
+    devices = mock_hass.data[DOMAIN][hub_entry.entry_id]["bluetooth_devices"]
+
+    def _add(address, name):
+        devices[address] = MagicMock(address=address, name=name)
+        return devices[address]
+
+    return MagicMock(side_effect=_add)
+
+
+@pytest.fixture
+def mock_bluetooth():
+    """Patch the Bluetooth and device registry helpers used by the hub."""
+    with patch(
+        "custom_components.early.hub.async_get_discovery_cache"
+    ) as discovery_cache, patch(
+        "custom_components.early.hub.bluetooth.async_register_callback"
+    ) as register, patch(
+        "custom_components.early.hub.dr.async_get"
+    ), patch(
+        "custom_components.early.hub.dr.async_entries_for_config_entry",
+        return_value=[],
+    ) as registered:
+        discovery_cache.return_value.service_infos = []
+        yield MagicMock(
+            discovery_cache=discovery_cache, register=register, registered=registered
+        )
+
+
+class TestEarlyTrackerHub:
+    """Test the EarlyTrackerHub class."""
+
+    def test_one_subscription_for_all_trackers(
+        self, mock_hass, hub_entry, add_tracker, mock_bluetooth
+    ):
+        """Test one callback per matcher is registered and unloaded."""
+        hub = EarlyTrackerHub(mock_hass, hub_entry, add_tracker)
+
+        hub.async_start()
+
+        matchers = [call[0][2] for call in mock_bluetooth.register.call_args_list]
+        assert [matcher.get("local_name") for matcher in matchers] == [
+            f"{DEVICE_NAME_PREFIX}*",
+            None,
+        ]
+        assert [matcher.get("service_uuid") for matcher in matchers] == [
+            None,
+            BLE_SERVICE_UUID,
+        ]
+        assert {call[0][1] for call in mock_bluetooth.register.call_args_list} == {
+            hub._async_handle_bluetooth_event
+        }
+        assert hub_entry.async_on_unload.call_count == 2
+
+    def test_new_tracker_adopted(
+        self, mock_hass, hub_entry, add_tracker, mock_bluetooth
+    ):
+        """Test the first advertisement of a tracker sets it up."""
+        hub = EarlyTrackerHub(mock_hass, hub_entry, add_tracker)
+        hub.async_start()
+        callback = mock_bluetooth.register.call_args[0][1]
+        service_info = _service_info("AA:BB:CC:DD:EE:01", "Timeular ZEI 01")
+
+        callback(service_info, BluetoothChange.ADVERTISEMENT)
+
+        add_tracker.assert_called_once_with("AA:BB:CC:DD:EE:01", "Timeular ZEI 01")
+        device = hub._devices["AA:BB:CC:DD:EE:01"]
+        device.async_handle_advertisement.assert_called_once_with(
+            service_info, BluetoothChange.ADVERTISEMENT
+        )
+        assert hub.addresses == ["AA:BB:CC:DD:EE:01"]
+
+    def test_nameless_tracker_adopted_by_service_uuid(
+        self, mock_hass, hub_entry, add_tracker, mock_bluetooth
+    ):
+        """Test a tracker advertising only its service UUID is set up."""
+        hub = EarlyTrackerHub(mock_hass, hub_entry, add_tracker)
+        hub.async_start()
+        callback = mock_bluetooth.register.call_args[0][1]
+        service_info = _service_info("AA:BB:CC:DD:EE:01", None)
+        service_info.service_uuids = [BLE_SERVICE_UUID.lower()]
+
+        callback(service_info, BluetoothChange.ADVERTISEMENT)
+
+        add_tracker.assert_called_once_with("AA:BB:CC:DD:EE:01", DEVICE_NAME_PREFIX)
+
+    def test_known_tracker_dispatched_by_address(
+        self, mock_hass, hub_entry, add_tracker, mock_bluetooth
+    ):
+        """Test advertisements of managed trackers reach only that tracker."""
+        hub = EarlyTrackerHub(mock_hass, hub_entry, add_tracker)
+        hub.async_start()
+        callback = mock_bluetooth.register.call_args[0][1]
+        for address in ("AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02"):
+            callback(_service_info(address), BluetoothChange.ADVERTISEMENT)
+        add_tracker.reset_mock()
+        first = hub._devices["AA:BB:CC:DD:EE:01"]
+        second = hub._devices["AA:BB:CC:DD:EE:02"]
+        second.async_handle_advertisement.reset_mock()
+
+        callback(_service_info("AA:BB:CC:DD:EE:01"), BluetoothChange.ADVERTISEMENT)
+
+        add_tracker.assert_not_called()
+        assert first.async_handle_advertisement.call_count == 2
+        second.async_handle_advertisement.assert_not_called()
+
+    def test_other_devices_ignored(
+        self, mock_hass, hub_entry, add_tracker, mock_bluetooth
+    ):
+        """Test devices that are not ZEI trackers are never adopted."""
+        mock_bluetooth.discovery_cache.return_value.service_infos = [
+            _service_info("11:22:33:44:55:66", "Some Speaker")
+        ]
+        hub = EarlyTrackerHub(mock_hass, hub_entry, add_tracker)
+
+        hub.async_start()
+
+        add_tracker.assert_not_called()
+
+    def test_tracker_with_own_entry_skipped(
+        self, mock_hass, hub_entry, add_tracker, mock_bluetooth
+    ):
+        """Test a tracker set up as its own entry is left alone."""
+        mock_hass.config_entries.async_entries.return_value = [
+            hub_entry,
+            MagicMock(unique_id="AA:BB:CC:DD:EE:01"),
+        ]
+        mock_bluetooth.discovery_cache.return_value.service_infos = [
+            _service_info("AA:BB:CC:DD:EE:01")
+        ]
+        hub = EarlyTrackerHub(mock_hass, hub_entry, add_tracker)
+
+        hub.async_start()
+
+        add_tracker.assert_not_called()
+
+    def test_trackers_in_range_adopted_at_start(
+        self, mock_hass, hub_entry, add_tracker, mock_bluetooth
+    ):
+        """Test trackers already advertising are set up on start."""
+        mock_bluetooth.discovery_cache.return_value.service_infos = [
+            _service_info("AA:BB:CC:DD:EE:01")
+        ]
+        hub = EarlyTrackerHub(mock_hass, hub_entry, add_tracker)
+
+        hub.async_start()
+
+        add_tracker.assert_called_once_with("AA:BB:CC:DD:EE:01", "Timeular ZEI")
+
+    def test_registered_trackers_restored(
+        self, mock_hass, hub_entry, add_tracker, mock_bluetooth
+    ):
+        """Test trackers from earlier runs are set up while out of range."""
+        tracker = MagicMock(
+            identifiers={(DOMAIN, "AA:BB:CC:DD:EE:01")},
+            connections={("bluetooth", "AA:BB:CC:DD:EE:01")},
+        )
+        tracker.name = "Desk Cube"
+        account = MagicMock(identifiers={(DOMAIN, "account")}, connections=set())
+        mock_bluetooth.registered.return_value = [tracker, account]
+        hub = EarlyTrackerHub(mock_hass, hub_entry, add_tracker)
+
+        hub.async_start()
+
+        add_tracker.assert_called_once_with("AA:BB:CC:DD:EE:01", "Desk Cube")
@@ -6,9 +6,14 @@ import pytest
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 
-from custom_components.early import async_setup_entry, async_unload_entry
+from custom_components.early import (
+    _async_update_listener,
+    async_remove_entry,
+    async_setup_entry,
+    async_unload_entry,
+)
 from custom_components.early.bluetooth import EarlyBluetoothDevice
-from custom_components.early.const import DOMAIN
+from custom_components.early.const import DATA_DISCOVERY_CACHE, DOMAIN
 
 
 class TestIntegrationSetup:
@@ -58,6 +63,50 @@ class TestIntegrationSetup:
             )
             mock_register.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_bluetooth_advertisement_dispatched_to_device(
+        self, mock_hass, mock_bluetooth_config_entry
+    ):
+        """Test advertisements are forwarded to the tracker's device wrapper."""
+        mock_hass.config_entries.async_forward_entry_setups = AsyncMock(
+            return_value=True
+        )
+
+        with patch(
+            "homeassistant.components.bluetooth.async_register_callback"
+        ) as mock_register:
+            mock_register.return_value = MagicMock()
+            await async_setup_entry(mock_hass, mock_bluetooth_config_entry)
+
+        mock_device = MagicMock(spec=EarlyBluetoothDevice)
+        mock_hass.data[DOMAIN][mock_bluetooth_config_entry.entry_id][
+            "bluetooth_devices"
+        ]["AA:BB:CC:DD:EE:FF"] = mock_device
+
+        bluetooth_callback = mock_register.call_args[0][1]
+        service_info = MagicMock()
+        service_info.address = "AA:BB:CC:DD:EE:FF"
+        change = MagicMock()
+
+        bluetooth_callback(service_info, change)
+
+        mock_device.async_handle_advertisement.assert_called_once_with(
+            service_info, change
+        )
+
+    @pytest.mark.asyncio
+    async def test_options_update_reloads_entry(
+        self, mock_hass, mock_bluetooth_config_entry
+    ):
+        """Test changing tracker options reloads the entry."""
+        mock_hass.config_entries.async_reload = AsyncMock()
+
+        await _async_update_listener(mock_hass, mock_bluetooth_config_entry)
+
+        mock_hass.config_entries.async_reload.assert_called_once_with(
+            mock_bluetooth_config_entry.entry_id
+        )
+
     @pytest.mark.asyncio
     async def test_async_setup_entry_existing_domain(
         self, mock_hass, mock_config_entry
@@ -95,6 +144,26 @@ class TestIntegrationSetup:
             mock_config_entry, [Platform.SENSOR, Platform.SWITCH]
         )
 
+    @pytest.mark.asyncio
+    async def test_async_unload_last_entry_stops_discovery(
+        self, mock_hass, mock_config_entry
+    ):
+        """Test unloading the last entry stops the discovery cache."""
+        cache = MagicMock()
+        mock_hass.data[DATA_DISCOVERY_CACHE] = cache
+        mock_hass.data[DOMAIN] = {
+            mock_config_entry.entry_id: {
+                "config": mock_config_entry.data,
+                "bluetooth_devices": {},
+            }
+        }
+        mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+
+        assert await async_unload_entry(mock_hass, mock_config_entry) is True
+
+        cache.async_stop.assert_called_once()
+        assert DATA_DISCOVERY_CACHE not in mock_hass.data
+
     @pytest.mark.asyncio
     async def test_async_unload_entry_bluetooth(
         self, mock_hass, mock_bluetooth_config_entry
@@ -227,3 +296,51 @@ class TestIntegrationSetup:
             not hasattr(mock_other_device, "disconnect")
             or not mock_other_device.disconnect.called
         )
+
+
+class TestIntegrationRemoval:
+    """Test cleaning up after a removed entry."""
+
+    @pytest.fixture
+    def mock_hass(self, mock_hass, tmp_path):
+        """Return hass with a config directory and a working executor."""
+        mock_hass.config = MagicMock()
+        mock_hass.config.path = MagicMock(side_effect=lambda name: str(tmp_path / name))
+        mock_hass.async_add_executor_job = AsyncMock(
+            side_effect=lambda target, *args: target(*args)
+        )
+        return mock_hass
+
+    @pytest.mark.asyncio
+    async def test_remove_entry_deletes_files(
+        self, mock_hass, mock_config_entry, tmp_path
+    ):
+        """Test the stores and the database with its WAL files are deleted."""
+        database = tmp_path / "early_time_entries.test_entry_id.db"
+        database.write_bytes(b"")
+        (tmp_path / "early_time_entries.test_entry_id.db-wal").write_bytes(b"")
+        other = tmp_path / "early_time_entries.other_entry_id.db"
+        other.write_bytes(b"")
+
+        with patch("custom_components.early.Store") as mock_store:
+            mock_store.return_value.async_remove = AsyncMock()
+            await async_remove_entry(mock_hass, mock_config_entry)
+
+        assert [store_call[0][2] for store_call in mock_store.call_args_list] == [
+            "early.journal.test_entry_id",
+            "early.time_entries.test_entry_id",
+            "early.statistics.test_entry_id",
+        ]
+        assert mock_store.return_value.async_remove.await_count == 3
+        assert sorted(path.name for path in tmp_path.iterdir()) == [other.name]
+
+    @pytest.mark.asyncio
+    async def test_remove_entry_without_files(
+        self, mock_hass, mock_bluetooth_config_entry
+    ):
+        """Test removing an entry that never wrote anything succeeds."""
+        with patch("custom_components.early.Store") as mock_store:
+            mock_store.return_value.async_remove = AsyncMock()
+            await async_remove_entry(mock_hass, mock_bluetooth_config_entry)
+
+        assert mock_store.return_value.async_remove.await_count == 3
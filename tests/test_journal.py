@@ -0,0 +1,325 @@
+"""Test the EARLY offline tracking journal."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import requests
+from homeassistant.util.dt import UTC
+
+from custom_components.early.journal import EarlyTrackingJournal
+
+T0 = datetime(2026, 3, 2, 9, 0, tzinfo=UTC)
+
+
+def _at(minutes):
+    """Return the time minutes after T0."""
+    return T0 + timedelta(minutes=minutes)
+
+
+def _http_error(status):
+    """Return the error the coordinator raises for an HTTP status."""
+    return requests.exceptions.HTTPError(response=MagicMock(status_code=status))
+
+
+def _api_time(minutes):
+    """Return the time minutes after T0 as the API formats it."""
+    return _at(minutes).strftime("%Y-%m-%dT%H:%M:%S.000")
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Return a coordinator with sides 1 and 2 mapped and nothing running."""
+    coordinator = MagicMock()
+    coordinator.get_all_activities.return_value = {
+        "activity_1": "Working",
+        "activity_2": "Meeting",
+    }
+    coordinator.get_activity_id_by_device_side.side_effect = {
+        1: "activity_1",
+        2: "activity_2",
+    }.get
+    coordinator.async_fetch_activities = AsyncMock()
+    coordinator.async_get_current_tracking = AsyncMock(return_value=None)
+    coordinator.async_get_time_entries = AsyncMock(return_value=[])
+    coordinator.async_create_time_entry = AsyncMock()
+    coordinator.async_update_time_entry = AsyncMock()
+    coordinator.start_tracking = AsyncMock()
+    coordinator.stop_tracking = AsyncMock()
+    return coordinator
+
+
+@pytest.fixture
+def mock_store():
+    """Patch the journal's storage."""
+    with patch("custom_components.early.journal.Store") as store_class:
+        store = store_class.return_value
+        store.async_load = AsyncMock(return_value=None)
+        store.async_save = AsyncMock()
+        yield store
+
+
+@pytest.fixture
+def mock_call_later():
+    """Patch the retry timer."""
+    with patch("custom_components.early.journal.async_call_later") as call_later:
+        yield call_later
+
+
+@pytest.fixture
+def journal(mock_hass, mock_coordinator, mock_store, mock_call_later):
+    """Return a journal running its replay as a real task."""
+    mock_hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: asyncio.create_task(coro)
+    )
+    return EarlyTrackingJournal(mock_hass, mock_coordinator, "test_entry_id")
+
+
+async def _replay(journal):
+    """Run a replay to completion."""
+    journal._async_start_sync()
+    await journal._task
+
+
+class TestEarlyTrackingJournal:
+    """Test the EarlyTrackingJournal class."""
+
+    @pytest.mark.asyncio
+    async def test_first_change_waits_for_retry(
+        self, journal, mock_call_later, mock_store
+    ):
+        """Test the change from a failed request is retried later."""
+        await journal.async_append(1, "activity_1", _at(60))
+
+        assert journal.pending == 1
+        assert journal._task is None
+        mock_call_later.assert_called_once()
+        mock_store.async_delay_save.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_changes_while_offline_wait(self, journal, mock_call_later):
+        """Test later changes queue behind the scheduled retry."""
+        await journal.async_append(1, "activity_1", _at(60))
+        await journal.async_append(2, "activity_2", _at(90))
+
+        assert journal.pending == 2
+        assert journal._task is None
+        mock_call_later.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_replay_outage(self, journal, mock_coordinator, mock_call_later):
+        """Test an outage replays as the timesheet the cube described."""
+        # Running from before the outage until it is stopped
+        mock_coordinator.async_get_current_tracking.side_effect = [
+            {"activity": {"id": "activity_2"}, "startedAt": _api_time(0)},
+            None,
+        ]
+        await journal.async_append(1, "activity_1", _at(60))
+        await journal.async_append(0, None, _at(90))
+        await journal.async_append(2, "activity_2", _at(120))
+
+        mock_call_later.call_args[0][2](None)
+        await journal._task
+
+        mock_coordinator.stop_tracking.assert_called_once_with(stopped_at=_at(60))
+        mock_coordinator.async_get_time_entries.assert_called_once_with(
+            _at(60), _at(120)
+        )
+        mock_coordinator.async_create_time_entry.assert_called_once_with(
+            "activity_1", _at(60), _at(90)
+        )
+        mock_coordinator.start_tracking.assert_called_once_with(
+            "activity_2", started_at=_at(120)
+        )
+        assert journal.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_replay_is_idempotent(self, journal, mock_coordinator):
+        """Test entries already sent are kept or patched, not duplicated."""
+        mock_coordinator.async_get_time_entries.return_value = [
+            {
+                "id": "entry_1",
+                "activityId": "activity_1",
+                "duration": {"startedAt": _api_time(60), "stoppedAt": _api_time(90)},
+            },
+            {
+                "id": "entry_2",
+                "activityId": "activity_2",
+                "duration": {"startedAt": _api_time(90), "stoppedAt": _api_time(100)},
+            },
+        ]
+        mock_coordinator.async_get_current_tracking.return_value = {
+            "activity": {"id": "activity_1"},
+            "startedAt": _api_time(120),
+        }
+        journal._changes = [
+            {"side": 1, "activity_id": "activity_1", "at": _at(60).isoformat()},
+            {"side": 2, "activity_id": "activity_2", "at": _at(90).isoformat()},
+            {"side": 1, "activity_id": "activity_1", "at": _at(120).isoformat()},
+        ]
+
+        await _replay(journal)
+
+        mock_coordinator.async_create_time_entry.assert_not_called()
+        mock_coordinator.async_update_time_entry.assert_called_once_with(
+            "entry_2", "activity_2", _at(90), _at(120)
+        )
+        # Already running from an earlier attempt
+        mock_coordinator.stop_tracking.assert_not_called()
+        mock_coordinator.start_tracking.assert_not_called()
+        assert journal.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_replay_in_batches(self, journal, mock_coordinator):
+        """Test long outages are sent a batch of intervals at a time."""
+        journal._changes = [
+            {"side": 1 + index % 2, "activity_id": None, "at": _at(index).isoformat()}
+            for index in range(5)
+        ]
+
+        with patch("custom_components.early.journal.JOURNAL_SYNC_BATCH", 2):
+            await _replay(journal)
+
+        assert mock_coordinator.async_get_time_entries.call_count == 2
+        assert mock_coordinator.async_create_time_entry.call_args_list == [
+            (("activity_1", _at(0), _at(1)),),
+            (("activity_2", _at(1), _at(2)),),
+            (("activity_1", _at(2), _at(3)),),
+            (("activity_2", _at(3), _at(4)),),
+        ]
+        mock_coordinator.start_tracking.assert_called_once_with(
+            "activity_1", started_at=_at(4)
+        )
+
+    @pytest.mark.asyncio
+    async def test_replay_failure_keeps_changes(
+        self, journal, mock_coordinator, mock_call_later
+    ):
+        """Test a failed replay keeps the journal and retries later."""
+        mock_coordinator.async_get_current_tracking.side_effect = (
+            requests.exceptions.ConnectionError()
+        )
+        journal._changes = [
+            {"side": 1, "activity_id": "activity_1", "at": _at(60).isoformat()}
+        ]
+
+        await _replay(journal)
+
+        assert journal.pending == 1
+        mock_call_later.assert_called_once()
+        mock_coordinator.start_tracking.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_server_error_keeps_changes(
+        self, journal, mock_coordinator, mock_call_later
+    ):
+        """Test a server error is retried like an outage."""
+        mock_coordinator.start_tracking.side_effect = _http_error(503)
+        journal._changes = [
+            {"side": 1, "activity_id": "activity_1", "at": _at(60).isoformat()}
+        ]
+
+        await _replay(journal)
+
+        assert journal.pending == 1
+        mock_call_later.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_rejected_changes_dropped(
+        self, journal, mock_coordinator, mock_call_later
+    ):
+        """Test changes the API rejects are dropped without holding up the rest."""
+        mock_coordinator.async_create_time_entry.side_effect = _http_error(422)
+        mock_coordinator.start_tracking.side_effect = _http_error(404)
+        journal._changes = [
+            {"side": 1, "activity_id": "activity_1", "at": _at(0).isoformat()},
+            {"side": 2, "activity_id": "activity_2", "at": _at(30).isoformat()},
+            {"side": 1, "activity_id": "activity_1", "at": _at(60).isoformat()},
+        ]
+
+        await _replay(journal)
+
+        assert mock_coordinator.async_create_time_entry.call_count == 2
+        mock_coordinator.start_tracking.assert_called_once()
+        assert journal.pending == 0
+        mock_call_later.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_data_retried(
+        self, journal, mock_coordinator, mock_call_later
+    ):
+        """Test a bad payload schedules a retry instead of ending the replay."""
+        mock_coordinator.async_get_current_tracking.side_effect = KeyError("id")
+        journal._changes = [
+            {"side": 1, "activity_id": "activity_1", "at": _at(60).isoformat()}
+        ]
+
+        await _replay(journal)
+
+        assert journal.pending == 1
+        assert journal._task is None
+        mock_call_later.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unresolved_sides_wait_for_activities(
+        self, journal, mock_coordinator, mock_call_later
+    ):
+        """Test sides journaled without an activity are not replayed as stops."""
+        mock_coordinator.get_all_activities.return_value = {}
+        journal._changes = [{"side": 1, "activity_id": None, "at": _at(0).isoformat()}]
+
+        await _replay(journal)
+
+        mock_coordinator.async_fetch_activities.assert_called_once()
+        mock_coordinator.stop_tracking.assert_not_called()
+        assert journal.pending == 1
+        mock_call_later.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_start_replays_stored_changes(
+        self, journal, mock_store, mock_coordinator
+    ):
+        """Test changes left by a previous run are replayed at startup."""
+        mock_store.async_load.return_value = {
+            "changes": [
+                {"side": 2, "activity_id": "activity_2", "at": _at(5).isoformat()}
+            ]
+        }
+
+        journal.async_start()
+        await journal._task
+
+        mock_coordinator.start_tracking.assert_called_once_with(
+            "activity_2", started_at=_at(5)
+        )
+        assert journal.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_stored_changes_come_first(self, journal, mock_store):
+        """Test changes journaled while loading follow the stored ones."""
+        mock_store.async_load.return_value = {
+            "changes": [
+                {"side": 2, "activity_id": "activity_2", "at": _at(5).isoformat()}
+            ]
+        }
+
+        await journal.async_append(1, "activity_1", _at(10))
+
+        assert [change["side"] for change in journal._changes] == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_stop_saves(self, journal, mock_store, mock_call_later):
+        """Test stopping cancels the retry and persists the journal."""
+        await journal.async_append(1, "activity_1", _at(60))
+
+        await journal.async_stop()
+
+        mock_call_later.return_value.assert_called_once()
+        mock_store.async_save.assert_called_once_with(
+            {
+                "changes": [
+                    {"side": 1, "activity_id": "activity_1", "at": _at(60).isoformat()}
+                ]
+            }
+        )
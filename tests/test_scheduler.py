@@ -0,0 +1,154 @@
+"""Test the EARLY connection slot scheduler."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.early.const import DATA_CONNECTION_SCHEDULER
+from custom_components.early.scheduler import (
+    EarlyConnectionScheduler,
+    async_get_connection_scheduler,
+)
+
+
+class TestEarlyConnectionScheduler:
+    """Test the EarlyConnectionScheduler class."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_attempts_per_source(self):
+        """Test only max_concurrent attempts run at once on a source."""
+        scheduler = EarlyConnectionScheduler(max_concurrent=2, spacing=0)
+        running = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def attempt():
+            nonlocal running, peak
+            async with scheduler.async_slot("hci0"):
+                running += 1
+                peak = max(peak, running)
+                await release.wait()
+                running -= 1
+
+        tasks = [asyncio.create_task(attempt()) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert scheduler.stats == {"hci0": {"active": 2, "queued": 3}}
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert peak == 2
+        assert scheduler.stats == {"hci0": {"active": 0, "queued": 0}}
+
+    @pytest.mark.asyncio
+    async def test_sources_are_independent(self):
+        """Test a busy adapter does not block attempts through a proxy."""
+        scheduler = EarlyConnectionScheduler(max_concurrent=1, spacing=0)
+        release = asyncio.Event()
+
+        async def hold():
+            async with scheduler.async_slot("hci0"):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        async with scheduler.async_slot("proxy-1"):
+            assert scheduler.stats["hci0"]["active"] == 1
+
+        release.set()
+        await holder
+
+    @pytest.mark.asyncio
+    async def test_never_connected_served_first(self):
+        """Test trackers that never connected jump ahead of reconnects."""
+        scheduler = EarlyConnectionScheduler(max_concurrent=1, spacing=0)
+        release = asyncio.Event()
+        order = []
+
+        async def attempt(name, never_connected):
+            async with scheduler.async_slot("hci0", never_connected=never_connected):
+                order.append(name)
+                if name == "holder":
+                    await release.wait()
+
+        holder = asyncio.create_task(attempt("holder", False))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(attempt("reconnect-1", False)),
+            asyncio.create_task(attempt("reconnect-2", False)),
+            asyncio.create_task(attempt("new", True)),
+        ]
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(holder, *waiters)
+
+        assert order == ["holder", "new", "reconnect-1", "reconnect-2"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test cancelling a queued attempt does not leak a slot."""
+        scheduler = EarlyConnectionScheduler(max_concurrent=1, spacing=0)
+        release = asyncio.Event()
+
+        async def hold():
+            async with scheduler.async_slot("hci0"):
+                await release.wait()
+
+        async def wait():
+            async with scheduler.async_slot("hci0"):
+                pass
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(wait())
+        await asyncio.sleep(0)
+        assert scheduler.stats["hci0"]["queued"] == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        release.set()
+        await holder
+
+        assert scheduler.stats["hci0"] == {"active": 0, "queued": 0}
+
+    @pytest.mark.asyncio
+    async def test_attempt_starts_are_spaced(self):
+        """Test consecutive attempts on a source wait out the spacing."""
+        scheduler = EarlyConnectionScheduler(max_concurrent=2, spacing=1.0)
+        clock = [100.0]
+
+        with (
+            patch(
+                "custom_components.early.scheduler.time.monotonic",
+                side_effect=lambda: clock[0],
+            ),
+            patch("custom_components.early.scheduler.asyncio.sleep") as mock_sleep,
+        ):
+            async with scheduler.async_slot("hci0"):
+                pass
+            async with scheduler.async_slot("hci0"):
+                pass
+
+        mock_sleep.assert_called_once_with(1.0)
+
+    @pytest.mark.asyncio
+    async def test_failed_attempt_releases_slot(self):
+        """Test an exception inside the slot frees it."""
+        scheduler = EarlyConnectionScheduler(max_concurrent=1, spacing=0)
+
+        with pytest.raises(RuntimeError):
+            async with scheduler.async_slot("hci0"):
+                raise RuntimeError("boom")
+
+        assert scheduler.stats["hci0"]["active"] == 0
+
+    def test_async_get_connection_scheduler_shared(self, mock_hass):
+        """Test every tracker shares one scheduler per instance."""
+        scheduler = async_get_connection_scheduler(mock_hass)
+
+        assert async_get_connection_scheduler(mock_hass) is scheduler
+        assert mock_hass.data[DATA_CONNECTION_SCHEDULER] is scheduler
@@ -1,15 +1,19 @@
 """Test the EARLY sensor platform."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import requests
 
-from custom_components.early.const import DOMAIN
+from custom_components.early.const import DOMAIN, EVENT_TRACKING_CHANGED
 from custom_components.early.sensor import (
     EarlyAPICoordinator,
     EarlyCurrentTrackingSensor,
     async_setup_entry,
+    format_api_time,
+    is_rejection,
+    parse_api_time,
 )
 
 
@@ -84,6 +88,9 @@ class TestEarlyAPICoordinator:
         assert len(coordinator._activities) == 2
         assert coordinator._activities["activity_1"] == "Working"
         assert coordinator._activities["activity_2"] == "Meeting"
+        assert coordinator.get_activity_id_by_device_side(1) == "activity_1"
+        assert coordinator.get_activity_id_by_device_side(2) == "activity_2"
+        assert coordinator.get_activity_id_by_device_side(3) is None
 
     @pytest.mark.asyncio
     async def test_fetch_activities_empty(self, mock_hass, mock_api_token_response):
@@ -393,6 +400,74 @@ class TestEarlyAPICoordinator:
 
         await coordinator.stop_tracking()
 
+    @pytest.mark.asyncio
+    async def test_create_time_entry_token_refresh(self, mock_hass):
+        """Test creating a time entry renews an expired token."""
+        coordinator = EarlyAPICoordinator(mock_hass, "test_key", "test_secret")
+        coordinator._token = "expired_token"
+
+        expired_response = MagicMock()
+        expired_response.status_code = 401
+        new_token_response = MagicMock()
+        new_token_response.json.return_value = {"token": "new_bearer_token"}
+        created_response = MagicMock()
+        created_response.status_code = 201
+        created_response.json.return_value = {"id": "entry_1"}
+
+        mock_hass.async_add_executor_job.side_effect = lambda target, *args: target(
+            *args
+        )
+        with patch(
+            "custom_components.early.sensor.requests.request",
+            side_effect=[expired_response, created_response],
+        ) as mock_request, patch(
+            "custom_components.early.sensor.requests.post",
+            return_value=new_token_response,
+        ):
+            entry = await coordinator.async_create_time_entry(
+                "activity_1",
+                datetime(2026, 3, 2, 9, 0, tzinfo=timezone.utc),
+                datetime(2026, 3, 2, 10, 30, 15, 250000, tzinfo=timezone.utc),
+            )
+
+        assert entry == {"id": "entry_1"}
+        assert coordinator._token == "new_bearer_token"
+        method, endpoint = mock_request.call_args[0]
+        assert (method, endpoint.rsplit("/", 1)[-1]) == ("POST", "time-entries")
+        assert mock_request.call_args[1]["headers"] == {
+            "Authorization": "Bearer new_bearer_token"
+        }
+        assert mock_request.call_args[1]["json"] == {
+            "activityId": "activity_1",
+            "startedAt": "2026-03-02T09:00:00.000",
+            "stoppedAt": "2026-03-02T10:30:15.250",
+        }
+
+    def test_format_api_time(self):
+        """Test timestamps are sent in UTC without an offset."""
+        local = datetime(
+            2026, 3, 2, 11, 0, 0, 123456, tzinfo=timezone(timedelta(hours=2))
+        )
+
+        assert format_api_time(local) == "2026-03-02T09:00:00.123"
+        assert parse_api_time(format_api_time(local)) == local.replace(
+            microsecond=123000
+        )
+
+    def test_is_rejection(self):
+        """Test only client errors other than timeouts and throttling reject."""
+
+        def _http_error(status):
+            return requests.exceptions.HTTPError(response=MagicMock(status_code=status))
+
+        assert is_rejection(_http_error(404)) is True
+        assert is_rejection(_http_error(422)) is True
+        assert is_rejection(_http_error(429)) is False
+        assert is_rejection(_http_error(503)) is False
+        assert is_rejection(requests.exceptions.HTTPError("no token")) is False
+        assert is_rejection(requests.exceptions.ConnectionError()) is False
+        assert is_rejection(requests.exceptions.Timeout()) is False
+
     def test_get_activity_name(self, mock_hass):
         """Test getting activity name."""
         coordinator = EarlyAPICoordinator(mock_hass, "test_key", "test_secret")
@@ -488,6 +563,130 @@ class TestEarlyAPICoordinator:
         assert 3 not in coordinator._device_side_mapping  # Break not assigned
 
 
+class TestTrackingTransitionEvents:
+    """Test the tracking transition events fired by the coordinator."""
+
+    @pytest.fixture
+    def coordinator(self, mock_hass):
+        """Return a coordinator with a known activity cache."""
+        coordinator = EarlyAPICoordinator(mock_hass, "test_key", "test_secret")
+        coordinator._activities = {"activity_1": "Working", "activity_2": "Meeting"}
+        return coordinator
+
+    def test_first_snapshot_does_not_fire(
+        self, mock_hass, coordinator, mock_tracking_response_active
+    ):
+        """Test the first poll only records a baseline."""
+        coordinator._async_check_transition(mock_tracking_response_active)
+
+        mock_hass.bus.async_fire.assert_not_called()
+
+    def test_unchanged_session_does_not_fire(
+        self, mock_hass, coordinator, mock_tracking_response_active
+    ):
+        """Test polling the same session twice fires nothing."""
+        coordinator._async_check_transition(mock_tracking_response_active)
+        coordinator._async_check_transition(mock_tracking_response_active)
+
+        mock_hass.bus.async_fire.assert_not_called()
+
+    def test_stop_fires_with_duration_and_note(
+        self,
+        mock_hass,
+        coordinator,
+        mock_tracking_response_active,
+        mock_tracking_response_idle,
+    ):
+        """Test stopping a session fires an event with its duration and note."""
+        coordinator._async_check_transition(mock_tracking_response_active)
+
+        now = datetime(2025, 1, 15, 11, 17, 0, tzinfo=timezone.utc)
+        with patch("custom_components.early.sensor.utcnow", return_value=now):
+            coordinator._async_check_transition(mock_tracking_response_idle)
+
+        mock_hass.bus.async_fire.assert_called_once()
+        event_type, event_data = mock_hass.bus.async_fire.call_args[0]
+        assert event_type == EVENT_TRACKING_CHANGED
+        assert event_data["previous_activity_id"] == "activity_1"
+        assert event_data["previous_activity_name"] == "Working"
+        assert event_data["activity_id"] is None
+        assert event_data["activity_name"] is None
+        assert event_data["started_at"] is None
+        assert event_data["duration"] == 47 * 60
+        assert event_data["note"] == "Working on tests"
+
+    def test_start_fires_without_duration(
+        self,
+        mock_hass,
+        coordinator,
+        mock_tracking_response_active,
+        mock_tracking_response_idle,
+    ):
+        """Test starting from idle fires an event for the new session."""
+        coordinator._async_check_transition(mock_tracking_response_idle)
+        coordinator._async_check_transition(mock_tracking_response_active)
+
+        event_data = mock_hass.bus.async_fire.call_args[0][1]
+        assert event_data["previous_activity_id"] is None
+        assert event_data["duration"] is None
+        assert event_data["activity_id"] == "activity_1"
+        assert event_data["activity_name"] == "Working"
+        assert event_data["started_at"] == "2025-01-15T10:30:00.000Z"
+
+    def test_switch_activity_fires_once(
+        self, mock_hass, coordinator, mock_tracking_response_active
+    ):
+        """Test switching directly between activities fires a single event."""
+        coordinator._async_check_transition(mock_tracking_response_active)
+        coordinator._async_check_transition(
+            {
+                "currentTracking": {
+                    "activity": {"id": "activity_2", "name": "Meeting"},
+                    "startedAt": "2025-01-15T11:00:00.000",
+                    "note": {"text": None},
+                }
+            }
+        )
+
+        mock_hass.bus.async_fire.assert_called_once()
+        event_data = mock_hass.bus.async_fire.call_args[0][1]
+        assert event_data["previous_activity_id"] == "activity_1"
+        assert event_data["activity_id"] == "activity_2"
+        assert event_data["activity_name"] == "Meeting"
+        # The previous session ended when the new one started
+        assert event_data["duration"] == 30 * 60
+
+    def test_events_disabled(self, mock_hass, mock_tracking_response_active):
+        """Test a coordinator created without events fires none."""
+        coordinator = EarlyAPICoordinator(
+            mock_hass, "test_key", "test_secret", fire_events=False
+        )
+        coordinator._async_check_transition(mock_tracking_response_active)
+        coordinator._async_check_transition({"currentTracking": None})
+
+        mock_hass.bus.async_fire.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_poll_is_not_a_transition(
+        self, mock_hass, coordinator, mock_tracking_response_active
+    ):
+        """Test an API error between polls does not fire a stop event."""
+        import requests as req_module
+
+        coordinator._async_check_transition(mock_tracking_response_active)
+        coordinator._token = "token"
+        mock_hass.async_add_executor_job.side_effect = (
+            req_module.exceptions.ConnectionError("Network error")
+        )
+
+        await coordinator.async_update()
+        assert coordinator.tracking_data is None
+
+        coordinator._async_check_transition(mock_tracking_response_active)
+
+        mock_hass.bus.async_fire.assert_not_called()
+
+
 class TestEarlyCurrentTrackingSensor:
     """Test the EarlyCurrentTrackingSensor class."""
 
@@ -614,12 +813,23 @@ class TestSensorPlatformSetup:
     async def test_async_setup_entry_api(self, mock_hass, mock_config_entry):
         """Test setting up API sensor entry."""
         mock_hass.data[DOMAIN] = {mock_config_entry.entry_id: {}}
+        mock_hass.config = MagicMock()
+        mock_hass.config.components = {"recorder"}
         async_add_entities = AsyncMock()
 
         with patch(
             "custom_components.early.sensor.EarlyAPICoordinator.async_update",
             new_callable=AsyncMock,
-        ) as mock_update:
+        ) as mock_update, patch(
+            "custom_components.early.time_entries.EarlyTimeEntriesSync"
+        ) as mock_sync_class, patch(
+            "custom_components.early.time_entry_database.EarlyTimeEntryDatabase"
+        ) as mock_database_class, patch(
+            "custom_components.early.activity_statistics.EarlyStatisticsImporter"
+        ) as mock_statistics_class:
+            database = mock_database_class.return_value
+            database.async_open = AsyncMock(return_value=True)
+            database.created = True
             await async_setup_entry(mock_hass, mock_config_entry, async_add_entities)
 
             async_add_entities.assert_called_once()
@@ -627,6 +837,90 @@ class TestSensorPlatformSetup:
             assert len(entities) == 1
             assert isinstance(entities[0], EarlyCurrentTrackingSensor)
 
+        entry_data = mock_hass.data[DOMAIN][mock_config_entry.entry_id]
+        sync = mock_sync_class.return_value
+        mock_sync_class.assert_called_once_with(
+            mock_hass, entry_data["coordinator"], mock_config_entry.entry_id
+        )
+        assert entry_data["time_entries"] is sync
+        sync.async_start.assert_called_once()
+        assert sync.async_stop in mock_config_entry._on_unload
+        # A new database is filled by backfilling the history
+        assert entry_data["time_entry_database"] is database
+        sync.async_request_backfill.assert_called_once()
+        sync.async_add_listener.assert_called_once_with(database.async_apply_delta)
+        statistics = mock_statistics_class.return_value
+        mock_statistics_class.assert_called_once_with(
+            mock_hass,
+            entry_data["coordinator"],
+            sync,
+            database,
+            mock_config_entry.entry_id,
+        )
+        statistics.async_start.assert_called_once()
+        # Unloading stops the sync and importer before closing the database
+        assert mock_config_entry._on_unload[:4] == [
+            database.async_close,
+            sync.async_add_listener.return_value,
+            statistics.async_stop,
+            sync.async_stop,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_async_setup_entry_without_database(
+        self, mock_hass, mock_config_entry
+    ):
+        """Test time entries still sync when the database can't be opened."""
+        mock_hass.data[DOMAIN] = {mock_config_entry.entry_id: {}}
+
+        with patch(
+            "custom_components.early.sensor.EarlyAPICoordinator.async_update",
+            new_callable=AsyncMock,
+        ), patch(
+            "custom_components.early.time_entries.EarlyTimeEntriesSync"
+        ) as mock_sync_class, patch(
+            "custom_components.early.time_entry_database.EarlyTimeEntryDatabase"
+        ) as mock_database_class:
+            mock_database_class.return_value.async_open = AsyncMock(return_value=False)
+            await async_setup_entry(mock_hass, mock_config_entry, MagicMock())
+
+        sync = mock_sync_class.return_value
+        assert (
+            "time_entry_database"
+            not in mock_hass.data[DOMAIN][mock_config_entry.entry_id]
+        )
+        sync.async_add_listener.assert_not_called()
+        sync.async_start.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_setup_entry_hub(self, mock_hass):
+        """Test a hub entry sets up its trackers with the shared coordinator."""
+        config_entry = MagicMock()
+        config_entry.entry_id = "hub_entry"
+        config_entry.data = {
+            "api_key": "test_key",
+            "api_secret": "test_secret",
+            "hub": True,
+        }
+        mock_hass.data[DOMAIN] = {config_entry.entry_id: {}}
+        async_add_entities = MagicMock()
+
+        with patch(
+            "custom_components.early.sensor.EarlyAPICoordinator.async_update",
+            new_callable=AsyncMock,
+        ), patch("custom_components.early.time_entries.EarlyTimeEntriesSync"), patch(
+            "custom_components.early.time_entry_database.EarlyTimeEntryDatabase"
+        ) as mock_database_class, patch(
+            "custom_components.early.bluetooth_sensor.async_setup_hub_entry"
+        ) as mock_hub_setup:
+            mock_database_class.return_value.async_open = AsyncMock(return_value=False)
+            await async_setup_entry(mock_hass, config_entry, async_add_entities)
+
+        coordinator = mock_hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+        mock_hub_setup.assert_called_once_with(
+            mock_hass, config_entry, coordinator, async_add_entities
+        )
+
     @pytest.mark.asyncio
     async def test_async_setup_entry_bluetooth(
         self, mock_hass, mock_bluetooth_config_entry
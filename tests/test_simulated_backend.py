@@ -0,0 +1,171 @@
+"""Test EarlyBluetoothDevice against the simulated ZEI backend."""
+
+import asyncio
+
+import pytest
+
+from custom_components.early.bluetooth import ConnectionState, EarlyBluetoothDevice
+from custom_components.early.scheduler import EarlyConnectionScheduler
+
+from .zei_simulator import SimulatedZeiBackend
+
+
+@pytest.fixture
+def hass(mock_hass):
+    """Return a mock hass that runs background tasks on the event loop."""
+    mock_hass.async_create_background_task = (
+        lambda target, name: asyncio.get_running_loop().create_task(target)
+    )
+    return mock_hass
+
+
+@pytest.fixture
+def backend():
+    """Return a simulated backend routed into the integration."""
+    backend = SimulatedZeiBackend(seed=1)
+    with backend.patch():
+        yield backend
+
+
+def make_device(hass, cube, scheduler=None, **kwargs):
+    """Return a device for a virtual cube that reports every settled face."""
+    kwargs.setdefault("settle_time", 0)
+    return EarlyBluetoothDevice(
+        hass,
+        cube.ble_device,
+        None,
+        min_update_interval=0,
+        liveness_interval=0,
+        scheduler=scheduler or EarlyConnectionScheduler(spacing=0),
+        **kwargs,
+    )
+
+
+def history_faces(device):
+    """Return the faces in a device's orientation history, oldest first."""
+    return [face for _, face in device.orientation_history.snapshot()]
+
+
+class TestSimulatedBackend:
+    """Exercise the BLE path end to end without hardware."""
+
+    @pytest.mark.asyncio
+    async def test_scripted_flips(self, hass, backend):
+        """Test scripted face changes arrive as notifications."""
+        cube = backend.add_cube(faces=[2, 5, 7], flip_interval=0.005)
+        device = make_device(hass, cube)
+
+        assert await device.connect() is True
+        await asyncio.wait_for(cube.script_done.wait(), 1)
+
+        assert device.orientation == 7
+        assert device.battery_level == 80
+        assert device.firmware_revision == "1.7.0"
+        assert history_faces(device) == [1, 2, 5, 7]
+        await device.disconnect()
+        assert cube.client.is_connected is False
+
+    @pytest.mark.asyncio
+    async def test_settle_filter_on_real_timing(self, hass, backend):
+        """Test faces passed through while turning are never reported."""
+        cube = backend.add_cube(faces=[2, 3, 4], flip_interval=0.005)
+        device = make_device(hass, cube, settle_time=50)
+
+        await device.connect()
+        await asyncio.wait_for(cube.script_done.wait(), 1)
+        await asyncio.sleep(0.1)
+
+        assert device.orientation == 4
+        assert history_faces(device) == [1, 4]
+        await device.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_connect_latency(self, hass, backend):
+        """Test connect latency shows in the first-state latency."""
+        cube = backend.add_cube(connect_latency=0.05)
+        device = make_device(hass, cube)
+
+        await device.connect()
+
+        assert device.connection_stats["last_first_state_latency"] >= 0.05
+        await device.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_dropped_notifications(self, hass, backend):
+        """Test dropped notifications leave the last read face."""
+        cube = backend.add_cube(faces=[2, 3], flip_interval=0.001, drop_rate=1.0)
+        device = make_device(hass, cube)
+
+        await device.connect()
+        await asyncio.wait_for(cube.script_done.wait(), 1)
+
+        assert device.orientation == 1
+        assert cube.notifications_dropped == 2
+        assert cube.notifications_sent == 0
+        await device.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_after_link_loss(self, hass, backend):
+        """Test a lost link is reconnected and the script resumes."""
+        cube = backend.add_cube(faces=[2, 5], flip_interval=0.01, disconnect_after=1)
+        device = make_device(hass, cube)
+
+        device.async_start()
+        await asyncio.wait_for(cube.script_done.wait(), 1)
+        await asyncio.sleep(0)
+
+        assert device.orientation == 5
+        assert device.connection_state is ConnectionState.CONNECTED
+        assert device.connection_stats["reconnect_count"] == 1
+        assert cube.connections == 2
+        await device.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_connect_failures_retried(self, hass, backend):
+        """Test failed attempts are retried within one connect."""
+        cube = backend.add_cube(connect_failures=2)
+        device = make_device(hass, cube)
+
+        assert await device.connect() is True
+
+        assert cube.failed_connections == 2
+        assert device.orientation == 1
+        await device.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_connect_failure_exhausts_attempts(self, hass, backend):
+        """Test a cube that keeps failing leaves the device disconnected."""
+        cube = backend.add_cube(connect_failures=10)
+        device = make_device(hass, cube)
+
+        assert await device.connect() is False
+
+        assert device.is_connected is False
+        assert device.connection_stats["failed_attempts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_many_cubes(self, hass, backend):
+        """Test many cubes through one adapter share connection slots."""
+        cubes = backend.add_cubes(
+            50,
+            faces=[3, 6],
+            flip_interval=0.002,
+            connect_latency=0.001,
+            drop_rate=0.1,
+        )
+        scheduler = EarlyConnectionScheduler(spacing=0)
+        devices = [make_device(hass, cube, scheduler) for cube in cubes]
+
+        assert all(await asyncio.gather(*(device.connect() for device in devices)))
+        await asyncio.wait_for(
+            asyncio.gather(*(cube.script_done.wait() for cube in cubes)), 5
+        )
+
+        assert len({cube.address for cube in cubes}) == 50
+        assert scheduler.stats["hci0"] == {"active": 0, "queued": 0}
+        for device, cube in zip(devices, cubes):
+            # The last face a cube managed to deliver is the one reported
+            assert device.orientation == ([1] + history_faces(device))[-1]
+            assert len(history_faces(device)) == 1 + cube.notifications_sent
+        assert 0 < sum(cube.notifications_dropped for cube in cubes) < 100
+        await asyncio.gather(*(device.disconnect() for device in devices))
@@ -0,0 +1,292 @@
+"""Test the EARLY time-entries sync."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import requests
+from homeassistant.util.dt import UTC
+
+from custom_components.early.time_entries import (
+    EarlyTimeEntriesSync,
+    TimeEntriesDelta,
+    TimeEntry,
+)
+
+NOW = datetime(2026, 3, 2, 12, 0, tzinfo=UTC)
+
+
+def _api_entry(entry_id, activity_id, started_hours_ago, stopped_hours_ago):
+    """Return a time entry as the API reports it."""
+    return {
+        "id": entry_id,
+        "activityId": activity_id,
+        "duration": {
+            "startedAt": (NOW - timedelta(hours=started_hours_ago)).strftime(
+                "%Y-%m-%dT%H:%M:%S.000"
+            ),
+            "stoppedAt": (NOW - timedelta(hours=stopped_hours_ago)).strftime(
+                "%Y-%m-%dT%H:%M:%S.000"
+            ),
+        },
+        "note": {"text": None, "tags": [], "mentions": []},
+    }
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Return a coordinator with no time entries."""
+    coordinator = MagicMock()
+    coordinator.async_get_time_entries = AsyncMock(return_value=[])
+    return coordinator
+
+
+@pytest.fixture
+def mock_store():
+    """Patch the sync's storage."""
+    with patch("custom_components.early.time_entries.Store") as store_class:
+        store = store_class.return_value
+        store.async_load = AsyncMock(return_value=None)
+        store.async_save = AsyncMock()
+        yield store
+
+
+@pytest.fixture
+def mock_call_later():
+    """Patch the sync timer."""
+    with patch("custom_components.early.time_entries.async_call_later") as call_later:
+        yield call_later
+
+
+@pytest.fixture
+def sync(mock_hass, mock_coordinator, mock_store, mock_call_later):
+    """Return a sync running as a real task at a fixed time."""
+    mock_hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: asyncio.create_task(coro)
+    )
+    with patch("custom_components.early.time_entries.dt_util.utcnow", return_value=NOW):
+        yield EarlyTimeEntriesSync(mock_hass, mock_coordinator, "test_entry_id")
+
+
+def _stored(cursor_hours_ago, recent=()):
+    """Return stored sync state."""
+    return {
+        "cursor": (NOW - timedelta(hours=cursor_hours_ago)).isoformat(),
+        "recent": [
+            TimeEntry.from_api(entry).as_dict() for entry in recent  # type: ignore
+        ],
+    }
+
+
+async def _run(sync):
+    """Run one sync to completion."""
+    sync.async_start()
+    await sync._task
+
+
+class TestTimeEntry:
+    """Test the TimeEntry class."""
+
+    def test_from_api(self):
+        """Test an API time entry is parsed."""
+        entry = TimeEntry.from_api(_api_entry("1", "activity_1", 3, 1))
+
+        assert entry == TimeEntry(
+            "1", "activity_1", NOW - timedelta(hours=3), NOW - timedelta(hours=1)
+        )
+        assert entry.duration == 7200
+        assert TimeEntry.from_dict(entry.as_dict()) == entry
+
+    def test_from_api_incomplete(self):
+        """Test entries without a span or activity are skipped."""
+        entry = _api_entry("1", "activity_1", 3, 1)
+        del entry["duration"]["stoppedAt"]
+
+        assert TimeEntry.from_api(entry) is None
+        assert TimeEntry.from_api({"id": "2"}) is None
+
+
+class TestEarlyTimeEntriesSync:
+    """Test the EarlyTimeEntriesSync class."""
+
+    @pytest.mark.asyncio
+    async def test_backfill_in_windows(
+        self, sync, mock_coordinator, mock_store, mock_call_later
+    ):
+        """Test the first sync backfills the history one window at a time."""
+        deltas = []
+        sync.async_add_listener(deltas.append)
+        mock_coordinator.async_get_time_entries.side_effect = [
+            [_api_entry("1", "activity_1", 70 * 24, 70 * 24 - 1)],
+            [],
+            [_api_entry("2", "activity_2", 3, 1)],
+        ]
+
+        with patch(
+            "custom_components.early.time_entries.TIME_ENTRIES_BACKFILL_DAYS", 90
+        ):
+            await _run(sync)
+
+        windows = [
+            call[0] for call in mock_coordinator.async_get_time_entries.call_args_list
+        ]
+        assert windows == [
+            (NOW - timedelta(days=90), NOW - timedelta(days=60)),
+            (NOW - timedelta(days=60), NOW - timedelta(days=30)),
+            (NOW - timedelta(days=30), NOW),
+        ]
+        assert [[entry.id for entry in delta.upserted] for delta in deltas] == [
+            ["1"],
+            ["2"],
+        ]
+        assert sync.cursor == NOW
+        # Only the re-check window is kept
+        assert mock_store.async_delay_save.call_args[0][0]() == _stored(
+            0, [_api_entry("2", "activity_2", 3, 1)]
+        )
+        mock_call_later.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_incremental_from_cursor(
+        self, sync, mock_coordinator, mock_store, mock_call_later
+    ):
+        """Test later syncs fetch from the re-check window before the mark."""
+        mock_store.async_load.return_value = _stored(1)
+
+        await _run(sync)
+
+        mock_coordinator.async_get_time_entries.assert_called_once_with(
+            NOW - timedelta(hours=49), NOW
+        )
+        assert sync.cursor == NOW
+
+    @pytest.mark.asyncio
+    async def test_only_changes_are_reported(self, sync, mock_coordinator, mock_store):
+        """Test unchanged entries are not reported, and edits and deletions are."""
+        unchanged = _api_entry("1", "activity_1", 10, 9)
+        edited = _api_entry("2", "activity_1", 8, 7)
+        deleted = _api_entry("3", "activity_2", 6, 5)
+        mock_store.async_load.return_value = _stored(1, [unchanged, edited, deleted])
+        edited = _api_entry("2", "activity_2", 8, 6)
+        added = _api_entry("4", "activity_1", 1, 0.5)
+        mock_coordinator.async_get_time_entries.return_value = [
+            unchanged,
+            edited,
+            added,
+        ]
+        deltas = []
+        sync.async_add_listener(deltas.append)
+
+        await _run(sync)
+
+        assert deltas == [
+            TimeEntriesDelta(
+                upserted=[TimeEntry.from_api(edited), TimeEntry.from_api(added)],
+                removed=["3"],
+                previous=[
+                    TimeEntry.from_api(_api_entry("2", "activity_1", 8, 7)),
+                    TimeEntry.from_api(deleted),
+                ],
+            )
+        ]
+        assert sync.stats["last_fetched"] == 3
+        assert sync.stats["last_changes"] == 3
+
+    @pytest.mark.asyncio
+    async def test_old_entries_leave_recheck_window(
+        self, sync, mock_coordinator, mock_store
+    ):
+        """Test entries older than the re-check window are forgotten, not deleted."""
+        mock_store.async_load.return_value = _stored(
+            1, [_api_entry("1", "activity_1", 60, 55)]
+        )
+        deltas = []
+        sync.async_add_listener(deltas.append)
+
+        await _run(sync)
+
+        assert deltas == []
+        assert sync.stats["recent_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_requested_backfill(self, sync, mock_coordinator, mock_store):
+        """Test a backfill can be requested after the history was synced."""
+        mock_store.async_load.return_value = _stored(
+            1, [_api_entry("1", "activity_1", 3, 1)]
+        )
+        deltas = []
+        sync.async_add_listener(deltas.append)
+        mock_coordinator.async_get_time_entries.return_value = [
+            _api_entry("1", "activity_1", 3, 1)
+        ]
+
+        sync.async_request_backfill()
+        with patch(
+            "custom_components.early.time_entries.TIME_ENTRIES_BACKFILL_DAYS", 30
+        ):
+            await _run(sync)
+
+        mock_coordinator.async_get_time_entries.assert_called_once_with(
+            NOW - timedelta(days=30), NOW
+        )
+        # Known entries are handed out again for the new consumer
+        assert [entry.id for entry in deltas[0].upserted] == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_failed_backfill_resumes(
+        self, sync, mock_coordinator, mock_call_later
+    ):
+        """Test a failure keeps the windows already synced."""
+        mock_coordinator.async_get_time_entries.side_effect = [
+            [],
+            requests.exceptions.ConnectionError(),
+        ]
+
+        with patch(
+            "custom_components.early.time_entries.TIME_ENTRIES_BACKFILL_DAYS", 90
+        ):
+            await _run(sync)
+
+        assert sync.cursor == NOW - timedelta(days=60)
+        assert sync.stats["last_sync"] is None
+        mock_call_later.assert_called_once()
+
+        mock_coordinator.async_get_time_entries.reset_mock(side_effect=True)
+        mock_call_later.call_args[0][2](None)
+        await sync._task
+
+        assert mock_coordinator.async_get_time_entries.call_args_list[0][0] == (
+            NOW - timedelta(days=60, hours=48),
+            NOW - timedelta(days=30, hours=48),
+        )
+        assert sync.cursor == NOW
+
+    @pytest.mark.asyncio
+    async def test_failing_listener_isolated(self, sync, mock_coordinator):
+        """Test a failing listener does not stop the others or the sync."""
+        mock_coordinator.async_get_time_entries.return_value = [
+            _api_entry("1", "activity_1", 3, 1)
+        ]
+        deltas = []
+        sync.async_add_listener(MagicMock(side_effect=ValueError))
+        remove = sync.async_add_listener(MagicMock())
+        sync.async_add_listener(deltas.append)
+        remove()
+
+        await _run(sync)
+
+        assert len(deltas) == 1
+        assert sync.stats["listeners"] == 2
+        assert sync.cursor == NOW
+
+    @pytest.mark.asyncio
+    async def test_stop_saves(self, sync, mock_store, mock_call_later):
+        """Test stopping cancels the timer and persists the mark."""
+        mock_store.async_load.return_value = _stored(1)
+        await _run(sync)
+
+        await sync.async_stop()
+
+        mock_call_later.return_value.assert_called_once()
+        mock_store.async_save.assert_called_once_with(_stored(0))
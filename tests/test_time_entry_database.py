@@ -0,0 +1,242 @@
+"""Test the EARLY time entry database."""
+
+import asyncio
+import os
+import sqlite3
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.util.dt import UTC
+
+from custom_components.early.time_entries import TimeEntriesDelta, TimeEntry
+from custom_components.early.time_entry_database import EarlyTimeEntryDatabase
+
+T0 = datetime(2026, 3, 2, 9, 0, tzinfo=UTC)
+
+
+def _entry(entry_id, activity_id, start_hours, stop_hours):
+    """Return an entry spanning hours after T0."""
+    return TimeEntry(
+        entry_id,
+        activity_id,
+        T0 + timedelta(hours=start_hours),
+        T0 + timedelta(hours=stop_hours),
+    )
+
+
+@pytest.fixture
+def hass(mock_hass, tmp_path):
+    """Return a mock hass with a real config directory."""
+    mock_hass.config = MagicMock()
+    mock_hass.config.path = lambda *parts: os.path.join(tmp_path, *parts)
+    mock_hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: asyncio.create_task(coro)
+    )
+    return mock_hass
+
+
+@asynccontextmanager
+async def open_database(hass):
+    """Open the entry's database and close it afterwards."""
+    database = EarlyTimeEntryDatabase(hass, "test_entry_id")
+    assert await database.async_open() is True
+    try:
+        yield database
+    finally:
+        await database.async_close()
+
+
+async def _apply(database, *deltas):
+    """Apply deltas and wait for them to be written."""
+    for delta in deltas:
+        database.async_apply_delta(delta)
+    await database._write_task
+
+
+class TestEarlyTimeEntryDatabase:
+    """Test the EarlyTimeEntryDatabase class."""
+
+    @pytest.mark.asyncio
+    async def test_open_creates_database(self, hass):
+        """Test the database is created in the config directory."""
+        async with open_database(hass) as database:
+            assert database.created is True
+            assert os.path.basename(database.path) == (
+                "early_time_entries.test_entry_id.db"
+            )
+            assert os.path.exists(database.path)
+
+    @pytest.mark.asyncio
+    async def test_reopen_keeps_entries(self, hass):
+        """Test entries survive closing the database."""
+        async with open_database(hass) as database:
+            await _apply(database, TimeEntriesDelta(upserted=[_entry("1", "a", 0, 1)]))
+
+        async with open_database(hass) as database:
+            assert database.created is False
+            assert await database.async_entries(T0, T0 + timedelta(hours=1)) == [
+                _entry("1", "a", 0, 1)
+            ]
+
+    @pytest.mark.asyncio
+    async def test_open_failure(self, hass, tmp_path):
+        """Test a database that can't be opened is reported, not raised."""
+        os.makedirs(tmp_path / "early_time_entries.test_entry_id.db")
+        database = EarlyTimeEntryDatabase(hass, "test_entry_id")
+
+        assert await database.async_open() is False
+        assert database.stats["open"] is False
+        with pytest.raises(sqlite3.ProgrammingError):
+            await database.async_entries(T0, T0)
+        await database.async_close()
+
+    @pytest.mark.asyncio
+    async def test_deltas_batched_into_one_transaction(self, hass):
+        """Test deltas arriving together are written in one transaction."""
+        async with open_database(hass) as database:
+            await _apply(
+                database,
+                TimeEntriesDelta(
+                    upserted=[_entry("1", "a", 0, 1), _entry("2", "b", 1, 2)]
+                ),
+                TimeEntriesDelta(upserted=[_entry("3", "a", 2, 3)], removed=["2"]),
+                TimeEntriesDelta(upserted=[_entry("1", "b", 0, 0.5)]),
+            )
+
+            assert database.stats["transactions"] == 1
+            assert await database.async_entries(T0, T0 + timedelta(days=1)) == [
+                _entry("1", "b", 0, 0.5),
+                _entry("3", "a", 2, 3),
+            ]
+
+    @pytest.mark.asyncio
+    async def test_range_queries(self, hass):
+        """Test entries overlapping a window are returned, by activity too."""
+        start, end = T0, T0 + timedelta(hours=4)
+        async with open_database(hass) as database:
+            await _apply(
+                database,
+                TimeEntriesDelta(
+                    upserted=[
+                        _entry("long", "a", -30, 1),
+                        _entry("before", "a", -2, -1),
+                        _entry("inside", "b", 2, 3),
+                        _entry("after", "a", 5, 6),
+                    ]
+                ),
+            )
+
+            entries = await database.async_entries(start, end)
+            by_activity = await database.async_entries(start, end, "a")
+
+        assert [entry.id for entry in entries] == ["long", "inside"]
+        assert [entry.id for entry in by_activity] == ["long"]
+
+    @pytest.mark.asyncio
+    async def test_range_query_over_years(self, hass):
+        """Test a week is found among years of history."""
+        entries = [
+            _entry(
+                f"{day}-{slot}",
+                f"activity_{slot}",
+                day * 24 + slot,
+                day * 24 + slot + 1,
+            )
+            for day in range(-5 * 365, 0)
+            for slot in range(8)
+        ]
+        async with open_database(hass) as database:
+            await _apply(database, TimeEntriesDelta(upserted=entries))
+
+            week = await database.async_entries(
+                T0 - timedelta(days=7), T0, "activity_3"
+            )
+
+        assert len(week) == 7
+        assert database.stats["transactions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_durations_clipped_to_window(self, hass):
+        """Test tracked time is summed per activity within the window only."""
+        start, end = T0, T0 + timedelta(hours=4)
+        async with open_database(hass) as database:
+            await _apply(
+                database,
+                TimeEntriesDelta(
+                    upserted=[
+                        _entry("1", "a", -1, 1),
+                        _entry("2", "a", 2, 3),
+                        _entry("3", "b", 3.5, 5),
+                    ]
+                ),
+            )
+
+            assert await database.async_durations(start, end) == {
+                "a": 2 * 3600,
+                "b": 0.5 * 3600,
+            }
+            assert await database.async_durations(start, end, "b") == {"b": 0.5 * 3600}
+
+    @pytest.mark.asyncio
+    async def test_hourly_durations(self, hass):
+        """Test tracked time is split into the UTC hours it falls in."""
+        async with open_database(hass) as database:
+            await _apply(
+                database,
+                TimeEntriesDelta(
+                    upserted=[
+                        _entry("1", "a", -0.5, 1.25),
+                        _entry("2", "b", 2.5, 2.75),
+                        _entry("3", "b", 2.75, 3),
+                    ]
+                ),
+            )
+
+            hourly = await database.async_hourly_durations(T0, T0 + timedelta(hours=4))
+
+        def hour(hours):
+            return (T0 + timedelta(hours=hours)).timestamp()
+
+        assert hourly == {
+            "a": {hour(0): 3600.0, hour(1): 900.0},
+            "b": {hour(2): 1800.0},
+        }
+
+    @pytest.mark.asyncio
+    async def test_queries_use_indexes(self, hass):
+        """Test range queries walk an index instead of the whole table."""
+        async with open_database(hass) as database:
+            connection = sqlite3.connect(database.path)
+            try:
+                for activity_id in (None, "a"):
+                    where, params = database._overlapping(0.0, 1.0, activity_id)
+                    plan = " ".join(
+                        row[3]
+                        for row in connection.execute(
+                            "EXPLAIN QUERY PLAN SELECT * FROM time_entries"
+                            f" WHERE {where}",
+                            tuple(params),
+                        )
+                    )
+                    assert "USING INDEX ix_time_entries_" in plan
+            finally:
+                connection.close()
+
+    @pytest.mark.asyncio
+    async def test_close_writes_pending(self, hass):
+        """Test closing waits for buffered changes to be written."""
+        async with open_database(hass) as database:
+            database.async_apply_delta(
+                TimeEntriesDelta(upserted=[_entry("1", "a", 0, 1)])
+            )
+
+        connection = sqlite3.connect(database.path)
+        try:
+            rows = connection.execute(
+                "SELECT id, duration FROM time_entries"
+            ).fetchall()
+        finally:
+            connection.close()
+        assert rows == [("1", 3600.0)]
@@ -0,0 +1,387 @@
+"""Simulated ZEI Bluetooth backend for tests and benchmarks.
+
+Virtual cubes stand in for real trackers behind `establish_connection` and
+`async_ble_device_from_address`, so an `EarlyBluetoothDevice` runs its real
+connect, subscribe, read, notify and disconnect paths against them. Each cube
+plays a script of face changes at a configurable rate once subscribed, and can
+be made to connect slowly, fail connection attempts, drop notifications or
+lose the link. Faults draw from a seeded random generator, so every run
+injects the same faults.
+
+    backend = SimulatedZeiBackend(seed=1)
+    cube = backend.add_cube(faces=[2, 5, 7], flip_interval=0.01)
+    with backend.patch():
+        await device.connect()
+        await cube.script_done.wait()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import patch
+
+from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
+
+from custom_components.early.const import (
+    BLE_BATTERY_LEVEL_CHARACTERISTIC_UUID,
+    BLE_FIRMWARE_REVISION_CHARACTERISTIC_UUID,
+    BLE_ORIENTATION_CHARACTERISTIC_UUID,
+)
+
+NotifyCallback = Callable[[Any, bytearray], None]
+
+
+@dataclass(frozen=True)
+class SimulatedCharacteristic:
+    """A GATT characteristic of a virtual cube."""
+
+    uuid: str
+    properties: tuple[str, ...]
+
+
+ORIENTATION = SimulatedCharacteristic(
+    BLE_ORIENTATION_CHARACTERISTIC_UUID, ("read", "notify", "indicate")
+)
+BATTERY_LEVEL = SimulatedCharacteristic(
+    BLE_BATTERY_LEVEL_CHARACTERISTIC_UUID, ("read", "notify")
+)
+FIRMWARE_REVISION = SimulatedCharacteristic(
+    BLE_FIRMWARE_REVISION_CHARACTERISTIC_UUID, ("read",)
+)
+
+
+class SimulatedServices:
+    """The discovered GATT services of a virtual cube."""
+
+    def __init__(self, characteristics: Sequence[SimulatedCharacteristic]) -> None:
+        """Initialize the services."""
+        self._characteristics = {char.uuid: char for char in characteristics}
+
+    def get_characteristic(self, uuid: str) -> SimulatedCharacteristic | None:
+        """Return the characteristic with uuid, if the cube has it."""
+        return self._characteristics.get(uuid)
+
+
+class SimulatedZeiClient:
+    """A connection to a virtual cube, standing in for a BleakClient."""
+
+    def __init__(
+        self,
+        cube: SimulatedZeiCube,
+        disconnected_callback: Callable[[SimulatedZeiClient], None] | None,
+    ) -> None:
+        """Initialize a connected client."""
+        self._cube = cube
+        self._disconnected_callback = disconnected_callback
+        self._notify_callbacks: dict[str, NotifyCallback] = {}
+        self.is_connected = True
+        self.services = SimulatedServices(cube.characteristics)
+
+    async def read_gatt_char(self, char: SimulatedCharacteristic | str) -> bytearray:
+        """Read a characteristic after the cube's GATT latency."""
+        uuid = _uuid(char)
+        await asyncio.sleep(self._cube.gatt_latency)
+        if not self.is_connected:
+            raise BleakError("Not connected")
+        return self._cube.read(uuid)
+
+    async def start_notify(
+        self, char: SimulatedCharacteristic | str, callback: NotifyCallback
+    ) -> None:
+        """Subscribe to a characteristic; orientation starts the script."""
+        uuid = _uuid(char)
+        await asyncio.sleep(self._cube.gatt_latency)
+        if not self.is_connected:
+            raise BleakError("Not connected")
+        if self._cube.services.get_characteristic(uuid) is None:
+            raise BleakError(f"Characteristic {uuid} not found")
+        self._notify_callbacks[uuid] = callback
+        if uuid == BLE_ORIENTATION_CHARACTERISTIC_UUID:
+            self._cube.start_script()
+
+    async def disconnect(self) -> bool:
+        """Close the connection."""
+        self._cube.release(self)
+        return True
+
+    async def clear_cache(self) -> bool:
+        """Clear the (nonexistent) service cache."""
+        return True
+
+    def notify(self, uuid: str, value: bytearray) -> bool:
+        """Deliver a notification if subscribed; return whether it was."""
+        if (
+            not self.is_connected
+            or (callback := self._notify_callbacks.get(uuid)) is None
+        ):
+            return False
+        callback(self._cube.services.get_characteristic(uuid), value)
+        return True
+
+    def close(self) -> None:
+        """Mark the link down and tell the owner, as Bleak does."""
+        if not self.is_connected:
+            return
+        self.is_connected = False
+        self._notify_callbacks.clear()
+        if self._disconnected_callback is not None:
+            self._disconnected_callback(self)
+
+
+class SimulatedZeiCube:
+    """A virtual ZEI tracker with a script of face changes and injected faults."""
+
+    def __init__(
+        self,
+        address: str,
+        *,
+        name: str = "Timeular ZEI",
+        source: str = "hci0",
+        face: int = 1,
+        faces: Sequence[int] = (),
+        flip_interval: float = 1.0,
+        battery: int | None = 80,
+        firmware: str = "1.7.0",
+        connect_latency: float = 0.0,
+        gatt_latency: float = 0.0,
+        connect_failures: int = 0,
+        drop_rate: float = 0.0,
+        disconnect_after: int | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the cube.
+
+        faces are played one every flip_interval seconds once a client
+        subscribes to orientation, resuming where they left off after a
+        reconnect. The first connect_failures attempts fail, each notification
+        is dropped with probability drop_rate, and the link is lost after
+        disconnect_after notifications.
+        """
+        self.address = address
+        self.name = name
+        self.source = source
+        self.face = face
+        self.faces = list(faces)
+        self.flip_interval = flip_interval
+        self.battery = battery
+        self.firmware = firmware
+        self.connect_latency = connect_latency
+        self.gatt_latency = gatt_latency
+        self.connect_failures = connect_failures
+        self.drop_rate = drop_rate
+        self.disconnect_after = disconnect_after
+        self._rng = rng or random.Random()
+        self.client: SimulatedZeiClient | None = None
+        self.script_done = asyncio.Event()
+        self._script_position = 0
+        self._script_task: asyncio.Task | None = None
+        # Counters for assertions and benchmarks
+        self.connections = 0
+        self.failed_connections = 0
+        self.notifications_sent = 0
+        self.notifications_dropped = 0
+
+    @property
+    def characteristics(self) -> list[SimulatedCharacteristic]:
+        """Return the characteristics the cube exposes."""
+        characteristics = [ORIENTATION, FIRMWARE_REVISION]
+        if self.battery is not None:
+            characteristics.append(BATTERY_LEVEL)
+        return characteristics
+
+    @property
+    def services(self) -> SimulatedServices:
+        """Return the cube's GATT services."""
+        return SimulatedServices(self.characteristics)
+
+    @property
+    def ble_device(self) -> BLEDevice:
+        """Return the BLEDevice Home Assistant would report for the cube."""
+        return BLEDevice(self.address, self.name, {"source": self.source})
+
+    async def async_connect(
+        self, disconnected_callback: Callable[[SimulatedZeiClient], None] | None
+    ) -> SimulatedZeiClient:
+        """Accept a connection after the connect latency, or fail it."""
+        await asyncio.sleep(self.connect_latency)
+        if self.connect_failures > 0:
+            self.connect_failures -= 1
+            self.failed_connections += 1
+            raise BleakError(f"Simulated connection failure for {self.address}")
+        if self.client is not None:
+            self.client.close()
+        self.connections += 1
+        self.client = SimulatedZeiClient(self, disconnected_callback)
+        return self.client
+
+    def read(self, uuid: str) -> bytearray:
+        """Return the current value of a characteristic."""
+        if uuid == BLE_ORIENTATION_CHARACTERISTIC_UUID:
+            return bytearray([self.face])
+        if uuid == BLE_BATTERY_LEVEL_CHARACTERISTIC_UUID and self.battery is not None:
+            return bytearray([self.battery])
+        if uuid == BLE_FIRMWARE_REVISION_CHARACTERISTIC_UUID:
+            return bytearray(self.firmware.encode())
+        raise BleakError(f"Characteristic {uuid} not found")
+
+    def flip(self, face: int) -> None:
+        """Turn the cube to face, notifying a subscribed client."""
+        self.face = face
+        if self.client is None or not self.client.is_connected:
+            return
+        if self.drop_rate and self._rng.random() < self.drop_rate:
+            self.notifications_dropped += 1
+            return
+        if self.client.notify(BLE_ORIENTATION_CHARACTERISTIC_UUID, bytearray([face])):
+            self.notifications_sent += 1
+            if (
+                self.disconnect_after is not None
+                and self.notifications_sent >= self.disconnect_after
+            ):
+                self.disconnect_after = None
+                self.drop_link()
+
+    def set_battery(self, level: int) -> None:
+        """Change the battery level, notifying a subscribed client."""
+        self.battery = level
+        if self.client is not None:
+            self.client.notify(
+                BLE_BATTERY_LEVEL_CHARACTERISTIC_UUID, bytearray([level])
+            )
+
+    def drop_link(self) -> None:
+        """Lose the connection, as when the cube goes out of range."""
+        if self.client is not None:
+            self._stop_script()
+            self.client.close()
+
+    def release(self, client: SimulatedZeiClient) -> None:
+        """Close a client on its request."""
+        if client is self.client:
+            self._stop_script()
+        client.close()
+
+    def start_script(self) -> None:
+        """Play the remaining scripted faces."""
+        if self._script_task is None and self._script_position < len(self.faces):
+            self._script_task = asyncio.get_running_loop().create_task(
+                self._async_play_script()
+            )
+        elif self._script_position >= len(self.faces):
+            self.script_done.set()
+
+    def _stop_script(self) -> None:
+        """Pause the script until the next subscription."""
+        if self._script_task is not None:
+            self._script_task.cancel()
+            self._script_task = None
+
+    async def _async_play_script(self) -> None:
+        """Flip through the scripted faces at the configured rate."""
+        while self._script_position < len(self.faces):
+            await asyncio.sleep(self.flip_interval)
+            face = self.faces[self._script_position]
+            self._script_position += 1
+            # A link dropped by flip() cancels this task at the next sleep
+            self.flip(face)
+        self._script_task = None
+        self.script_done.set()
+
+
+class SimulatedZeiBackend:
+    """A set of virtual cubes reachable through patched Bluetooth entry points."""
+
+    def __init__(self, seed: int = 0) -> None:
+        """Initialize an empty backend; seed makes injected faults repeatable."""
+        self._rng = random.Random(seed)
+        self.cubes: dict[str, SimulatedZeiCube] = {}
+
+    def add_cube(self, address: str | None = None, **kwargs: Any) -> SimulatedZeiCube:
+        """Add a virtual cube; see SimulatedZeiCube for the options."""
+        if address is None:
+            index = len(self.cubes) + 1
+            address = f"C7:E7:00:00:{index >> 8:02X}:{index & 0xFF:02X}"
+        kwargs.setdefault("rng", random.Random(self._rng.random()))
+        cube = self.cubes[address] = SimulatedZeiCube(address, **kwargs)
+        return cube
+
+    def add_cubes(self, count: int, **kwargs: Any) -> list[SimulatedZeiCube]:
+        """Add count virtual cubes sharing the same options."""
+        return [self.add_cube(**kwargs) for _ in range(count)]
+
+    def ble_device_from_address(
+        self, hass: Any, address: str, connectable: bool = True
+    ) -> BLEDevice | None:
+        """Stand in for bluetooth.async_ble_device_from_address."""
+        if (cube := self.cubes.get(address)) is None:
+            return None
+        return cube.ble_device
+
+    async def establish_connection(
+        self,
+        client_class: type,
+        device: BLEDevice,
+        name: str,
+        disconnected_callback: Callable[[Any], None] | None = None,
+        max_attempts: int = 1,
+        **kwargs: Any,
+    ) -> SimulatedZeiClient:
+        """Stand in for bleak_retry_connector.establish_connection."""
+        if (cube := self.cubes.get(device.address)) is None:
+            raise BleakError(f"{name} ({device.address}) is not in range")
+        for attempt in range(1, max_attempts + 1):
+            try:
+                return await cube.async_connect(disconnected_callback)
+            except BleakError:
+                if attempt == max_attempts:
+                    raise
+        raise BleakError(f"No connection attempts allowed for {device.address}")
+
+    @contextmanager
+    def patch(self) -> Iterator[SimulatedZeiBackend]:
+        """Route the integration's Bluetooth connections to the virtual cubes.
+
+        The device's timers are also run on the event loop, so the test's hass
+        need only run background tasks.
+        """
+        with ExitStack() as stack:
+            stack.enter_context(
+                patch(
+                    "custom_components.early.bluetooth.establish_connection",
+                    self.establish_connection,
+                )
+            )
+            stack.enter_context(
+                patch(
+                    "custom_components.early.bluetooth.bluetooth."
+                    "async_ble_device_from_address",
+                    self.ble_device_from_address,
+                )
+            )
+            # Settle, dispatch and reconnect timers run on the event loop
+            stack.enter_context(
+                patch(
+                    "custom_components.early.bluetooth.async_call_later",
+                    async_call_later,
+                )
+            )
+            yield self
+
+
+def async_call_later(
+    hass: Any, delay: float, action: Callable[[Any], None]
+) -> Callable[[], None]:
+    """Stand in for helpers.event.async_call_later without a real hass."""
+    handle = asyncio.get_running_loop().call_later(delay, action, None)
+    return handle.cancel
+
+
+def _uuid(char: SimulatedCharacteristic | str) -> str:
+    """Return the UUID of a characteristic or UUID string."""
+    return char if isinstance(char, str) else char.uuid